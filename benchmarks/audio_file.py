@@ -0,0 +1,83 @@
+"""
+Measure how long AudioFile takes before its first chunk is ready, and the
+memory it allocates doing so, on a long recording: decoding the whole file,
+streaming it, and mapping the decoded audio from the cache.
+
+Run with: python benchmarks/audio_file.py [minutes]
+"""
+
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import av
+import numpy as np
+
+from juturna.nodes.source._audio_file.audio_file import AudioFile
+
+
+def _encode(path: str, minutes: int):
+    rng = np.random.default_rng(0)
+    noise = rng.integers(-8000, 8000, (1, 2 * 48000), np.int16)
+
+    with av.open(path, 'w') as container:
+        stream = container.add_stream('pcm_s16le', rate=48000, layout='stereo')
+
+        # one second of stereo noise, over and over
+        for _ in range(minutes * 60):
+            frame = av.AudioFrame.from_ndarray(
+                noise, format='s16', layout='stereo'
+            )
+            frame.sample_rate = 48000
+
+            for packet in stream.encode(frame):
+                container.mux(packet)
+
+        for packet in stream.encode(None):
+            container.mux(packet)
+
+
+def _run(path: str, label: str, **kwargs):
+    node = AudioFile(
+        path,
+        3,
+        16000,
+        node_name='audio_file',
+        pipe_name='benchmark',
+        **kwargs,
+    )
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    node.warmup()
+    next(node._audio_chunks)
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    node.stop()
+
+    print(
+        f'  {label:24} {1000 * elapsed:10.1f} ms {peak / 1024 / 1024:10.1f} MiB'
+    )
+
+
+if __name__ == '__main__':
+    minutes = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = str(pathlib.Path(folder, 'audio.wav'))
+        cache_dir = str(pathlib.Path(folder, 'cache'))
+        _encode(path, minutes)
+
+        print(f'{minutes} min of 48 kHz stereo wav, first 3 s chunk at 16 kHz')
+
+        _run(path, 'full decode')
+        _run(path, 'streaming', streaming=True)
+        _run(path, 'full decode, cache miss', cache_dir=cache_dir)
+        _run(path, 'cache hit', cache_dir=cache_dir)
+        _run(path, 'streaming, cache hit', streaming=True, cache_dir=cache_dir)
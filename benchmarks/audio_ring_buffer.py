@@ -0,0 +1,121 @@
+"""
+Compare repeated concatenation against a ring buffer over a long audio session,
+for the two accumulation patterns found in audio nodes:
+
+- block: short decoded frames are accumulated, and fixed-size blocks are cut
+  from the front of the accumulator (audio sources);
+- window: every new chunk is appended, and the last ``keep`` chunks are read
+  as a single array (voice activity detection and transcription).
+
+Run with: python benchmarks/audio_ring_buffer.py [session_seconds]
+"""
+
+import sys
+import time
+
+from collections import deque
+
+import numpy as np
+
+from juturna.utils.audio_utils import AudioRingBuffer
+
+
+RATE = 16_000
+FRAME = 320
+CHUNK = RATE // 2
+
+
+def _block_concatenate(frames: int, block: int):
+    frame = np.zeros(FRAME, dtype=np.float32)
+    pending = np.empty(0, dtype=np.float32)
+
+    for _ in range(frames):
+        pending = np.concatenate([pending, frame])
+
+        while len(pending) >= block:
+            _ = pending[:block]
+            pending = pending[block:]
+
+
+def _block_ring(frames: int, block: int):
+    frame = np.zeros(FRAME, dtype=np.float32)
+    pending = AudioRingBuffer(2 * block, grow=True)
+
+    for _ in range(frames):
+        pending.append(frame)
+
+        while len(pending) >= block:
+            _ = pending.pop(block)
+
+
+def _window_concatenate(chunks: int, keep: int):
+    chunk = np.zeros(CHUNK, dtype=np.float32)
+    data = deque(maxlen=keep)
+
+    for _ in range(chunks):
+        data.append(chunk)
+        _ = np.concatenate(list(data))
+
+
+def _window_ring(chunks: int, keep: int):
+    chunk = np.zeros(CHUNK, dtype=np.float32)
+    lengths = deque(maxlen=keep)
+    ring = AudioRingBuffer(RATE, grow=True)
+
+    for _ in range(chunks):
+        if len(lengths) == keep:
+            ring.discard(lengths[0])
+
+        lengths.append(len(chunk))
+        ring.append(chunk)
+        _ = ring.window()
+
+
+def _timeit(f, *args) -> float:
+    start = time.perf_counter()
+    f(*args)
+
+    return time.perf_counter() - start
+
+
+def main(seconds: int):
+    """Run the benchmark"""
+    frames = seconds * RATE // FRAME
+    chunks = seconds * RATE // CHUNK
+
+    print(f'{seconds} s session at {RATE} Hz')
+    print(f'{"":16}{"concatenate":>14}{"ring":>10}{"speedup":>10}')
+
+    results = [
+        *[
+            (
+                f'block {seconds_in_block} s',
+                _block_concatenate,
+                _block_ring,
+                (frames, seconds_in_block * RATE),
+            )
+            for seconds_in_block in (1, 5, 10)
+        ],
+        *[
+            (
+                f'window keep={keep}',
+                _window_concatenate,
+                _window_ring,
+                (chunks, keep),
+            )
+            for keep in (2, 8, 32)
+        ],
+    ]
+
+    for name, concatenate, ring, args in results:
+        t_concatenate = _timeit(concatenate, *args)
+        t_ring = _timeit(ring, *args)
+
+        print(
+            f'{name:16}{t_concatenate:13.3f}s{t_ring:9.3f}s'
+            f'{t_concatenate / t_ring:9.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]] or [3600])
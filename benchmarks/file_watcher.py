@@ -0,0 +1,107 @@
+"""
+Measure how FileWatcher coalesces a storm of filesystem events: a number of
+files copied at once, each in many small writes, against the events and
+messages the node fires for them, and the delay between the end of the copy
+and the last message.
+
+Run with: python benchmarks/file_watcher.py [files] [writes per file]
+"""
+
+import contextlib
+import importlib.util
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+
+from juturna.payloads import Batch
+
+
+_PLUGIN = pathlib.Path(
+    pathlib.Path(__file__).parent.parent,
+    'plugins/nodes/source/_file_watcher/file_watcher.py',
+)
+
+
+class _Counter:
+    def __init__(self):
+        self.messages = 0
+        self.events = 0
+        self.last = 0.0
+        self.arrived = threading.Event()
+
+    def put(self, message):
+        self.messages += 1
+        self.events += (
+            len(message.payload.messages)
+            if isinstance(message.payload, Batch)
+            else 1
+        )
+        self.last = time.perf_counter()
+        self.arrived.set()
+
+
+def _watcher_class():
+    spec = importlib.util.spec_from_file_location('file_watcher', _PLUGIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module.FileWatcher
+
+
+def _run(files: int, writes: int, label: str, **kwargs):
+    with tempfile.TemporaryDirectory() as folder:
+        node = _watcher_class()(
+            location=folder,
+            pattern='*',
+            recursive=False,
+            ignore_directories=True,
+            ignore_updates=False,
+            ignore_deletions=True,
+            node_name='file_watcher',
+            pipe_name='benchmark',
+            **kwargs,
+        )
+        counter = _Counter()
+
+        node.add_destination('sink', counter)
+        node.start()
+
+        with contextlib.ExitStack() as stack:
+            targets = [
+                stack.enter_context(
+                    open(pathlib.Path(folder, f'{idx:05}.bin'), 'wb')
+                )
+                for idx in range(files)
+            ]
+
+            for _ in range(writes):
+                for target in targets:
+                    target.write(b'x' * 1024)
+                    target.flush()
+
+        copied = time.perf_counter()
+
+        # wait until nothing has arrived for a while
+        while counter.arrived.wait(timeout=2):
+            counter.arrived.clear()
+
+        node.stop()
+
+        print(
+            f'  {label:22} {node._coalescer.received:8} received '
+            f'{counter.events:6} fired {counter.messages:6} messages '
+            f'{1000 * (counter.last - copied):8.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    writes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print(f'{files} files copied at once, {writes} writes each')
+
+    _run(files, writes, 'no debounce, no batch', debounce=0, batch_size=0)
+    _run(files, writes, 'debounce 0.5 s', debounce=0.5, batch_size=0)
+    _run(files, writes, 'debounce 0.5 s, batch', debounce=0.5, batch_size=32)
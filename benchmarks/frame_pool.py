@@ -0,0 +1,99 @@
+"""
+Compare per-frame allocation against a frame pool, reading raw RGB frames from
+a pipe as ffmpeg-based video sources do. A few frames are kept alive at any
+time, to simulate messages still travelling through the pipeline.
+
+Run with: python benchmarks/frame_pool.py [width] [height] [frames]
+"""
+
+import gc
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+
+from collections import deque
+
+import numpy as np
+
+from juturna.components import FramePool
+
+
+def _open_pipe(frame: bytes, frames: int, buffering: int):
+    read_fd, write_fd = os.pipe()
+
+    def write():
+        with os.fdopen(write_fd, 'wb') as writer:
+            for _ in range(frames):
+                writer.write(frame)
+
+    threading.Thread(target=write, daemon=True).start()
+
+    return os.fdopen(read_fd, 'rb', buffering=buffering)
+
+
+def _run(read_frame, frames: int, in_flight: int) -> tuple:
+    collections = [0]
+
+    def count(phase, _):
+        if phase == 'start':
+            collections[0] += 1
+
+    held = deque(maxlen=in_flight)
+
+    gc.callbacks.append(count)
+    tracemalloc.start()
+    faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+    start = time.perf_counter()
+
+    for _ in range(frames):
+        held.append(read_frame())
+
+    elapsed = time.perf_counter() - start
+    faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt - faults
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.callbacks.remove(count)
+
+    return elapsed, peak, faults, collections[0]
+
+
+def main(width: int, height: int, frames: int):
+    """Run the benchmark"""
+    shape = (height, width, 3)
+    nbytes = width * height * 3
+    in_flight = 4
+
+    frame = np.random.default_rng().bytes(nbytes)
+
+    stream = _open_pipe(frame, frames, 10**8)
+    baseline = _run(
+        lambda: np.frombuffer(stream.read(nbytes), np.uint8).reshape(shape),
+        frames,
+        in_flight,
+    )
+
+    pool = FramePool(shape, size=in_flight + 2)
+    stream = _open_pipe(frame, frames, 0)
+    pooled = _run(lambda: pool.fill(stream), frames, in_flight)
+
+    print(f'{frames} frames of {width}x{height}, {in_flight} in flight')
+    print(
+        f'{"":6}{"frames/s":>10}{"alloc MB":>10}{"peak MB":>10}'
+        f'{"faults":>10}{"gc":>6}'
+    )
+
+    for name, (elapsed, peak, faults, collections), allocated in (
+        ('read', baseline, frames * nbytes),
+        ('pool', pooled, pool.misses * nbytes),
+    ):
+        print(
+            f'{name:6}{frames / elapsed:10.0f}{allocated / 1e6:10.1f}'
+            f'{peak / 1e6:10.1f}{faults:10}{collections:6}'
+        )
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:4]] or [1920, 1080, 600])
@@ -0,0 +1,114 @@
+"""
+Measure how fast ImageLoader turns a bulk drop of JPEG images into frames,
+reducing them by 4: decoding at full size on a single worker, as the node
+used to, against draft mode decoding at reduced scale, and a pool of
+workers. Events are handed to the node directly, as the file watcher would.
+
+Run with: python benchmarks/image_loader.py [images] [width] [height]
+"""
+
+import importlib.util
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from PIL import Image
+
+from juturna.components import Message
+from juturna.payloads import ObjectPayload
+
+
+_PLUGIN = pathlib.Path(
+    pathlib.Path(__file__).parent.parent,
+    'plugins/nodes/source/_image_loader/image_loader.py',
+)
+
+
+class _Counter:
+    def __init__(self, expected: int):
+        self.count = 0
+        self.expected = expected
+        self.done = threading.Event()
+
+    def put(self, message):
+        self.count += 1
+
+        if self.count == self.expected:
+            self.done.set()
+
+
+def _loader_class():
+    spec = importlib.util.spec_from_file_location('image_loader', _PLUGIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module.ImageLoader
+
+
+def _write(folder: pathlib.Path, count: int, width: int, height: int) -> list:
+    rng = np.random.default_rng(0)
+    base = Image.fromarray(
+        rng.integers(0, 255, (height // 16, width // 16, 3), np.uint8)
+    ).resize((width, height))
+    paths = list()
+
+    for idx in range(count):
+        paths.append(folder / f'{idx:06}.jpg')
+        base.rotate(idx % 360).save(paths[-1], quality=90)
+
+    return paths
+
+
+def _run(folder: pathlib.Path, paths: list, label: str, **kwargs):
+    node = _loader_class()(
+        location=str(folder),
+        patterns=['*.jpg'],
+        recursive=False,
+        ignore_updates=True,
+        convert_rgb=True,
+        reduce_by=4,
+        resize_by=[-1, -1],
+        node_name='image_loader',
+        pipe_name='benchmark',
+        **kwargs,
+    )
+    counter = _Counter(len(paths))
+
+    node.add_destination('sink', counter)
+    node.start()
+
+    start = time.perf_counter()
+
+    for path in paths:
+        node.update(
+            Message(payload=ObjectPayload.from_dict({'src_path': path}))
+        )
+
+    counter.done.wait()
+    elapsed = time.perf_counter() - start
+    node.stop()
+
+    print(
+        f'  {label:24} {elapsed:8.2f} s {len(paths) / elapsed:10.1f} images/s'
+    )
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 1280
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 720
+
+    with tempfile.TemporaryDirectory() as folder:
+        folder = pathlib.Path(folder)
+        paths = _write(folder, count, width, height)
+
+        print(f'{count} jpeg images {width}x{height}, reduced by 4')
+
+        _run(folder, paths, 'full decode, 1 worker', workers=1, draft=False)
+        _run(folder, paths, 'draft, 1 worker', workers=1)
+        _run(folder, paths, 'full decode, 4 workers', workers=4, draft=False)
+        _run(folder, paths, 'draft, 4 workers', workers=4)
@@ -0,0 +1,141 @@
+"""
+Measure the ingest throughput and latency of JsonHttp against a local load
+generator, posting single messages and batches over keep-alive connections.
+Ingest latency is the time between a message being posted and the node
+processing it.
+
+Run with: python benchmarks/json_http.py [messages] [clients]
+"""
+
+import http.client
+import json
+import statistics
+import sys
+import threading
+import time
+
+from juturna.nodes.source._json_http.json_http import JsonHttp
+
+
+class _Source(JsonHttp):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.latencies = list()
+        self.done = threading.Event()
+        self.expected = 0
+
+    def update(self, message):
+        self.latencies.append(time.perf_counter() - message.payload['sent'])
+
+        if len(self.latencies) == self.expected:
+            self.done.set()
+
+
+def _client(port: int, batches: list, batch_path: bool, statuses: list):
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+
+    for batch in batches:
+        while True:
+            now = time.perf_counter()
+
+            if batch_path:
+                path, content_type = '/juturna/batch', 'application/x-ndjson'
+                body = '\n'.join(
+                    json.dumps({'sent': now, 'idx': idx}) for idx in batch
+                )
+            else:
+                path, content_type = '/juturna', 'application/json'
+                body = json.dumps({'sent': now, 'idx': batch[0]})
+
+            conn.request('POST', path, body, {'Content-Type': content_type})
+            response = conn.getresponse()
+            accepted = json.loads(response.read())['accepted']
+            statuses.append(response.status)
+
+            if response.getheader('Connection') == 'close':
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port)
+
+            if response.status == 202:
+                break
+
+            # only the refused tail of a batch is sent again
+            batch = batch[accepted:]
+            time.sleep(0.01)
+
+    conn.close()
+
+
+def _run(count: int, clients: int, batch_size: int) -> tuple:
+    node = _Source(
+        host='127.0.0.1',
+        port=0,
+        endpoint='juturna',
+        node_name='bench',
+        pipe_name='bench',
+    )
+
+    node.expected = count
+    node.warmup()
+    node.start()
+
+    port = node._httpd.server_port
+    batches = [
+        list(range(i, min(i + batch_size, count)))
+        for i in range(0, count, batch_size)
+    ]
+    statuses = list()
+    threads = [
+        threading.Thread(
+            target=_client,
+            args=(port, batches[idx::clients], batch_size > 1, statuses),
+        )
+        for idx in range(clients)
+    ]
+
+    start = time.perf_counter()
+
+    for t in threads:
+        t.start()
+
+    for t in threads:
+        t.join()
+
+    node.done.wait(timeout=60)
+    elapsed = time.perf_counter() - start
+
+    node.stop()
+    node.destroy()
+
+    latencies = sorted(node.latencies)
+    refused = sum(1 for s in statuses if s != 202)
+
+    return (
+        len(statuses) / elapsed,
+        len(latencies) / elapsed,
+        statistics.median(latencies) * 1000,
+        latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        refused,
+    )
+
+
+def main(count: int, clients: int):
+    """Run the benchmark"""
+    print(f'{count} messages, {clients} clients')
+    print(
+        f'{"":14}{"req/s":>8}{"msg/s":>8}{"p50 ms":>8}{"p99 ms":>8}'
+        f'{"refused":>9}'
+    )
+
+    for name, batch_size in [('single', 1), ('batch of 50', 50)]:
+        rps, mps, p50, p99, refused = _run(count, clients, batch_size)
+
+        print(f'{name:14}{rps:8.0f}{mps:8.0f}{p50:8.1f}{p99:8.1f}{refused:9}')
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 8,
+    )
@@ -0,0 +1,142 @@
+"""
+Measure the delivery throughput of NotifierHTTP against a local endpoint,
+compared with posting every message on its own thread with a new connection
+(as the node used to do).
+
+Run with: python benchmarks/notifier_http.py [messages]
+"""
+
+import contextlib
+import sys
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import requests
+
+from juturna.components import Message
+from juturna.nodes.sink import NotifierHTTP
+from juturna.payloads import ObjectPayload
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class _Endpoint(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers['Content-Length']))
+
+        with self.server.lock:
+            self.server.requests += 1
+
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args): ...
+
+
+def _messages(count: int) -> list:
+    return [
+        Message[ObjectPayload](
+            creator='bench',
+            version=i,
+            payload=ObjectPayload(text='hello world ' * 8, idx=i),
+        )
+        for i in range(count)
+    ]
+
+
+def _post(url: str, content: dict):
+    with contextlib.suppress(requests.RequestException):
+        requests.post(url, json=content, timeout=20)
+
+
+def _thread_per_message(url: str, messages: list) -> tuple[int, float]:
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(target=_post, args=(url, m.to_dict()), daemon=True)
+        for m in messages
+    ]
+
+    for t in threads:
+        t.start()
+
+    peak = threading.active_count()
+
+    for t in threads:
+        t.join()
+
+    return peak, time.perf_counter() - start
+
+
+def _node(url: str, messages: list, **kwargs) -> tuple[int, float]:
+    node = NotifierHTTP(
+        endpoint=url,
+        timeout=20,
+        content_type='application/json',
+        node_name='bench',
+        **kwargs,
+    )
+
+    node.warmup()
+    node.start()
+
+    start = time.perf_counter()
+
+    for m in messages:
+        node.update(m)
+
+    peak = threading.active_count()
+
+    # wait for delivery, rather than measuring the node stop timeout
+    while node.sent + node.failed < len(messages):
+        time.sleep(0.001)
+
+    elapsed = time.perf_counter() - start
+
+    node.stop()
+    node.destroy()
+
+    return peak, elapsed
+
+
+def main(count: int):
+    """Run the benchmark"""
+    server = _Server(('127.0.0.1', 0), _Endpoint)
+    server.lock = threading.Lock()
+    server.requests = 0
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    url = f'http://127.0.0.1:{server.server_port}'
+    messages = _messages(count)
+
+    runs = [
+        ('thread per message', _thread_per_message, {}),
+        ('pooled, 1 worker', _node, {'workers': 1}),
+        ('pooled, 4 workers', _node, {'workers': 4}),
+        ('batch 32, ordered', _node, {'batch_size': 32, 'ordered': True}),
+        ('batch 32, 4 workers', _node, {'batch_size': 32, 'workers': 4}),
+    ]
+
+    print(f'{count} messages')
+    print(f'{"":22}{"msg/s":>10}{"requests":>10}{"threads":>9}')
+
+    for name, run, kwargs in runs:
+        server.requests = 0
+        peak, elapsed = run(url, messages, **kwargs)
+
+        print(f'{name:22}{count / elapsed:10.0f}{server.requests:10}{peak:9}')
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]] or [2000])
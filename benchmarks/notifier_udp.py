@@ -0,0 +1,128 @@
+"""
+Measure the throughput of NotifierUDP for large object payloads, with JSON
+fragments (base64 encoded) and with binary fragments, and the
+throughput of reassembling binary fragments on the receiving end.
+
+Datagrams are sent to a local socket that is never read, so only the sending
+cost is measured; reassembly is measured separately on captured datagrams.
+
+Run with: python benchmarks/notifier_udp.py [messages] [payload_kb]
+"""
+
+import socket
+import sys
+import time
+
+import numpy as np
+
+from juturna.components import Message
+from juturna.nodes.sink._notifier_udp.notifier_udp import NotifierUDP
+from juturna.payloads import ObjectPayload
+from juturna.utils.net_utils import FragmentReassembler
+from juturna.utils.net_utils import fragment
+
+
+PAYLOAD_SIZE = 1400
+
+
+def _message(version: int, kb: int, arrays: bool = False) -> Message:
+    rng = np.random.default_rng(version)
+    payload = (
+        ObjectPayload(
+            transcript=' '.join(['word'] * (kb * 64)),
+            features=rng.random(kb * 256, dtype=np.float32),
+        )
+        if arrays
+        else ObjectPayload(
+            transcript=' '.join(['word'] * (kb * 64)),
+            scores=rng.random(kb * 64).round(4).tolist(),
+        )
+    )
+
+    message = Message(creator='bench', version=version, payload=payload)
+    message._freeze()
+
+    return message
+
+
+def _node(port: int, **kwargs) -> NotifierUDP:
+    return NotifierUDP(
+        endpoint='127.0.0.1',
+        port=port,
+        payload_size=PAYLOAD_SIZE,
+        max_sequence=9999,
+        max_chunks=65535,
+        encoding='utf8',
+        node_name='bench',
+        **kwargs,
+    )
+
+
+def _datagrams(node: NotifierUDP, message: Message) -> list[int]:
+    if not node._binary:
+        return [len(c) for c in node._prepare_chunks(message, message.version)]
+
+    return [
+        len(h) + len(c)
+        for h, c in fragment(message.to_bytes(), 0, PAYLOAD_SIZE)
+    ]
+
+
+def main(count: int, kb: int):
+    """Run the benchmark"""
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(('127.0.0.1', 0))
+    port = sink.getsockname()[1]
+
+    print(f'{count} messages, {kb} kB of content each')
+    print(f'{"":22}{"msg/s":>8}{"wire kB":>9}{"datagrams":>11}')
+
+    # arrays cannot be encoded as JSON, so only binary fragments carry them
+    runs = [
+        ('lists, json + base64', False, {'encode_b64': True}),
+        ('lists, binary', False, {'encode_b64': False, 'binary': True}),
+        ('arrays, binary', True, {'encode_b64': False, 'binary': True}),
+    ]
+
+    for name, arrays, kwargs in runs:
+        messages = [_message(i, kb, arrays) for i in range(count)]
+        node = _node(port, **kwargs)
+        datagrams = _datagrams(node, messages[0])
+
+        start = time.perf_counter()
+
+        for m in messages:
+            node.update(m)
+
+        elapsed = time.perf_counter() - start
+
+        print(
+            f'{name:22}{count / elapsed:8.0f}'
+            f'{sum(datagrams) / 1024:9.0f}{len(datagrams):11}'
+        )
+
+    captured = [
+        h + bytes(c)
+        for m in messages
+        for h, c in fragment(m.to_bytes(), m.version, PAYLOAD_SIZE)
+    ]
+    reassembler = FragmentReassembler()
+
+    start = time.perf_counter()
+
+    for d in captured:
+        reassembler.push(d)
+
+    elapsed = time.perf_counter() - start
+
+    print(
+        f'{"arrays, reassembly":22}{count / elapsed:8.0f}'
+        f'{sum(len(d) for d in captured) / count / 1024:9.0f}'
+        f'{len(captured) // count:11}'
+    )
+
+    sink.close()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]] or [500, 256])
@@ -0,0 +1,128 @@
+"""
+Measure how many pipe-fed ingest streams a process sustains when every stream
+blocks its own source thread on the pipe, versus a single Reactor thread
+watching all of them. Every stream carries 100 ms blocks of 16 kHz mono PCM,
+the output ffmpeg produces for AudioRTP, written by a separate process.
+
+Run with: python benchmarks/reactor.py [streams] [seconds]
+"""
+
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+from juturna.utils.net_utils import Reactor
+
+
+BLOCK = 3200
+
+
+def _write(fds: list, seconds: float):
+    block = bytes(BLOCK)
+    start = time.perf_counter()
+    sent = 0
+
+    while time.perf_counter() - start < seconds:
+        for fd in fds:
+            os.write(fd, block)
+
+        sent += 1
+        wait = start + sent * 0.1 - time.perf_counter()
+
+        if wait > 0:
+            time.sleep(wait)
+
+    for fd in fds:
+        os.close(fd)
+
+
+def _threaded(read_fds: list, counts: list) -> list:
+    def _loop(idx: int, fd: int):
+        while data := os.read(fd, BLOCK):
+            counts[idx] += len(data)
+
+    threads = [
+        threading.Thread(target=_loop, args=(idx, fd), daemon=True)
+        for idx, fd in enumerate(read_fds)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    return threads
+
+
+def _reactor(read_fds: list, counts: list, done: threading.Event):
+    reactor = Reactor()
+    left = [len(read_fds)]
+
+    def _read(idx: int, fd: int):
+        data = os.read(fd, 1 << 16)
+        counts[idx] += len(data)
+
+        if not data:
+            reactor.remove_reader(fd)
+            left[0] -= 1
+
+            if not left[0]:
+                done.set()
+
+    for idx, fd in enumerate(read_fds):
+        os.set_blocking(fd, False)
+        reactor.add_reader(fd, lambda idx=idx, fd=fd: _read(idx, fd))
+
+
+def _run(mode: str, streams: int, seconds: float):
+    pipes = [os.pipe() for _ in range(streams)]
+    read_fds = [r for r, _ in pipes]
+    write_fds = [w for _, w in pipes]
+    counts = [0] * streams
+    done = threading.Event()
+
+    writer = multiprocessing.get_context('fork').Process(
+        target=_write, args=(write_fds, seconds)
+    )
+
+    cpu = time.process_time()
+    start = time.perf_counter()
+
+    writer.start()
+
+    for fd in write_fds:
+        os.close(fd)
+
+    if mode == 'threads':
+        threads = _threaded(read_fds, counts)
+        active = threading.active_count()
+
+        for thread in threads:
+            thread.join()
+    else:
+        _reactor(read_fds, counts, done)
+        active = threading.active_count()
+        done.wait()
+
+    writer.join()
+
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+
+    for fd in read_fds:
+        os.close(fd)
+
+    expected = streams * BLOCK * round(seconds / 0.1)
+
+    print(f'{mode}, {streams} streams')
+    print(f'  threads            {active:12}')
+    print(f'  received           {100 * sum(counts) / expected:11.1f}%')
+    print(f'  reader cpu         {100 * cpu / elapsed:11.1f}%')
+
+
+if __name__ == '__main__':
+    streams = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    _run('threads', streams, seconds)
+    _run('reactor', streams, seconds)
@@ -0,0 +1,140 @@
+"""
+Measure RTP header parsing, one datagram at a time with RTPDatagram versus
+whole batches with RTPDatagram.parse_batch, then receive a live 50k packets/s
+load (spread over several PCMU sessions) with a single RTPReceiver thread.
+
+Run with: python benchmarks/rtp_parse.py [packets/s] [sessions] [seconds]
+"""
+
+import multiprocessing
+import socket
+import struct
+import sys
+import time
+
+import numpy as np
+
+from juturna.utils.net_utils import RTPDatagram
+from juturna.utils.net_utils import RTPReceiver
+from juturna.utils.net_utils import RTPSession
+
+
+PAYLOAD = bytes(160)
+
+
+def _packet(seq: int, ssrc: int) -> bytes:
+    return struct.pack('!BBHII', 0x80, 0, seq & 0xFFFF, seq * 160, ssrc) + (
+        PAYLOAD
+    )
+
+
+def _parse(rate: int):
+    packets = [_packet(seq, 1) for seq in range(rate)]
+    buffer = b''.join(packets)
+    sizes = [len(p) for p in packets]
+
+    start = time.perf_counter()
+
+    for packet in packets:
+        RTPDatagram(packet)
+
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+
+    for idx in range(0, rate, 64):
+        chunk = sizes[idx : idx + 64]
+
+        RTPDatagram.parse_batch(
+            buffer, chunk, np.arange(idx, idx + len(chunk)) * 172
+        )
+
+    batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    RTPDatagram.parse_batch(buffer, sizes)
+    whole = time.perf_counter() - start
+
+    print(f'parsing {rate} datagrams')
+    print(f'  one at a time      {rate / single:12.0f} packets/s')
+    print(f'  batches of 64      {rate / batch:12.0f} packets/s')
+    print(f'  single batch       {rate / whole:12.0f} packets/s')
+
+
+def _send(ports: list, rate: int, seconds: float):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 22)
+
+    # packets are sent in bursts every millisecond
+    per_burst = max(rate // 1000 // len(ports), 1)
+    start = time.perf_counter()
+    seq = 0
+
+    while time.perf_counter() - start < seconds:
+        for _ in range(per_burst):
+            for ssrc, port in enumerate(ports):
+                sock.sendto(_packet(seq, ssrc), ('127.0.0.1', port))
+
+            seq += 1
+
+        wait = start + seq / (rate / len(ports)) - time.perf_counter()
+
+        if wait > 0:
+            time.sleep(wait)
+
+    sock.close()
+
+
+def _receive(rate: int, sessions: int, seconds: float):
+    received = [0] * sessions
+    receiver = RTPReceiver()
+    rtp_sessions = [
+        RTPSession(
+            0,
+            lambda samples, idx=idx: received.__setitem__(
+                idx, received[idx] + len(samples) // 160
+            ),
+            host='127.0.0.1',
+            recv_buffer=1 << 22,
+        )
+        for idx in range(sessions)
+    ]
+
+    for session in rtp_sessions:
+        receiver.add(session)
+
+    sender = multiprocessing.get_context('spawn').Process(
+        target=_send,
+        args=([s.address[1] for s in rtp_sessions], rate, seconds),
+    )
+
+    cpu = time.process_time()
+    start = time.perf_counter()
+
+    sender.start()
+    sender.join()
+    time.sleep(0.5)
+
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+
+    for session in rtp_sessions:
+        receiver.remove(session)
+        session.close()
+
+    total = sum(received)
+    lost = sum(s.jitter_buffer.lost for s in rtp_sessions)
+
+    print(f'receiving {rate} packets/s over {sessions} sessions')
+    print(f'  received           {total / seconds:12.0f} packets/s')
+    print(f'  lost               {lost:12}')
+    print(f'  receiver cpu       {100 * cpu / elapsed:11.0f}%')
+
+
+if __name__ == '__main__':
+    rate = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    _parse(rate)
+    _receive(rate, sessions, seconds)
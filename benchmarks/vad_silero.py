@@ -0,0 +1,93 @@
+"""
+Measure the CPU time spent by Silero VAD for every second of audio, when every
+new chunk is analysed together with the previous ``keep - 1`` chunks (window
+mode of the VadSilero node), and when the model state is carried across chunks
+so that every sample is only analysed once (streaming mode).
+
+Requires the VadSilero plugin requirements (silero-vad and torch).
+
+Run with: python benchmarks/vad_silero.py [session_seconds] [chunk_ms]
+"""
+
+import sys
+import time
+
+from collections import deque
+
+import numpy as np
+import silero_vad
+import torch
+
+
+RATE = 16_000
+WINDOW = 512
+
+
+def _session(seconds: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    t = np.arange(seconds * RATE) / RATE
+
+    # alternate two seconds of voiced tone and two seconds of noise
+    voiced = (t.astype(int) // 2) % 2 == 0
+    audio = rng.normal(0, 0.01, len(t)) + voiced * 0.3 * np.sin(
+        2 * np.pi * 220 * t
+    )
+
+    return audio.astype(np.float32)
+
+
+def _window_mode(model, chunks: list, keep: int) -> float:
+    data = deque(maxlen=keep)
+    start = time.process_time()
+
+    for chunk in chunks:
+        data.append(chunk)
+        silero_vad.get_speech_timestamps(
+            torch.from_numpy(np.concatenate(data)),
+            model,
+            sampling_rate=RATE,
+        )
+
+    return time.process_time() - start
+
+
+def _streaming_mode(model, chunks: list) -> float:
+    iterator = silero_vad.VADIterator(model, sampling_rate=RATE)
+    pending = np.empty(0, dtype=np.float32)
+    start = time.process_time()
+
+    for chunk in chunks:
+        pending = np.concatenate([pending, chunk])
+        usable = len(pending) - len(pending) % WINDOW
+        wav = torch.from_numpy(pending[:usable])
+
+        for idx in range(0, usable, WINDOW):
+            iterator(wav[idx : idx + WINDOW])
+
+        pending = pending[usable:]
+
+    return time.process_time() - start
+
+
+def main(seconds: int, chunk_ms: int = 500):
+    """Run the benchmark"""
+    torch.set_num_threads(1)
+
+    model = silero_vad.load_silero_vad()
+    audio = _session(seconds)
+    size = RATE * chunk_ms // 1000
+    chunks = [audio[i : i + size] for i in range(0, len(audio), size)]
+
+    print(f'{seconds} s session, {chunk_ms} ms chunks, single thread')
+    print(f'{"mode":16}{"cpu ms / audio s":>18}')
+
+    for keep in range(1, 9):
+        elapsed = _window_mode(model, chunks, keep)
+        print(f'{f"window keep={keep}":16}{1000 * elapsed / seconds:18.2f}')
+
+    elapsed = _streaming_mode(model, chunks)
+    print(f'{"streaming":16}{1000 * elapsed / seconds:18.2f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]] or [120, 500])
@@ -0,0 +1,67 @@
+"""
+Measure the cost of turning decoded video frames into arrays, as VideoRtpAv
+does: full resolution RGB24 against scaling and converting in the same
+reformatter pass, to smaller sizes and to native pixel formats. Scaled
+conversions use the default bilinear interpolation unless marked as fast.
+
+Run with: python benchmarks/video_convert.py [frames] [width] [height]
+"""
+
+import sys
+import time
+
+import av
+import numpy as np
+
+
+def _convert(frames: list, label: str, **kwargs):
+    start = time.perf_counter()
+
+    for frame in frames:
+        image = frame.to_ndarray(**kwargs)
+
+    elapsed = time.perf_counter() - start
+
+    print(
+        f'  {label:28} {1000 * elapsed / len(frames):8.2f} ms/frame '
+        f'{image.nbytes / 1024:10.0f} KiB'
+    )
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 1920
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 1080
+
+    # decoders produce planar yuv420p frames
+    rng = np.random.default_rng(0)
+    frames = [
+        av.VideoFrame.from_ndarray(
+            rng.integers(0, 255, (height * 3 // 2, width), np.uint8),
+            format='yuv420p',
+        )
+        for _ in range(count)
+    ]
+
+    print(f'{count} frames {width}x{height}')
+
+    _convert(frames, 'rgb24, full size', format='rgb24')
+    _convert(frames, 'rgb24, 640 wide', format='rgb24', width=640, height=360)
+    _convert(
+        frames,
+        'rgb24, 640 wide, fast',
+        format='rgb24',
+        width=640,
+        height=360,
+        interpolation='FAST_BILINEAR',
+    )
+    _convert(frames, 'yuv420p, full size', format='yuv420p')
+    _convert(frames, 'gray, full size', format='gray')
+    _convert(
+        frames,
+        'gray, 640 wide, fast',
+        format='gray',
+        width=640,
+        height=360,
+        interpolation='FAST_BILINEAR',
+    )
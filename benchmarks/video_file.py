@@ -0,0 +1,111 @@
+"""
+Measure how fast VideoFile produces frames from a long file when pacing is
+off, as in offline batch analysis: decoding the whole file on one read-ahead
+thread, decoding disjoint segments concurrently, and decimating frames. The
+time at which every decoder is done is reported apart, as segments decoded
+ahead of their turn finish before their frames are produced. Segments can
+only speed decoding up with more than one CPU available.
+
+Run with: python benchmarks/video_file.py [seconds] [width] [height]
+"""
+
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+import av
+import numpy as np
+
+from juturna.nodes.source._video_file.video_file import VideoFile
+
+
+class _Counter:
+    def __init__(self):
+        self.count = 0
+
+    def put(self, message):
+        self.count += 1
+
+
+def _encode(path: str, seconds: int, width: int, height: int):
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, (height, width, 3), np.uint8)
+
+    with av.open(path, 'w') as container:
+        stream = container.add_stream('libx264', rate=25)
+        stream.width, stream.height = width, height
+        stream.pix_fmt = 'yuv420p'
+        stream.options = {'preset': 'ultrafast'}
+
+        for idx in range(seconds * 25):
+            frame = av.VideoFrame.from_ndarray(
+                np.roll(base, 4 * idx, axis=1), format='rgb24'
+            )
+            frame.pts = idx
+
+            for packet in stream.encode(frame):
+                container.mux(packet)
+
+        for packet in stream.encode(None):
+            container.mux(packet)
+
+
+def _run(path: str, label: str, **kwargs):
+    node = VideoFile(
+        path,
+        640,
+        360,
+        32,
+        realtime=False,
+        node_name='video_file',
+        pipe_name='benchmark',
+        **kwargs,
+    )
+    counter = _Counter()
+
+    node.add_destination('sink', counter)
+    node.configure()
+    node.warmup()
+
+    start = time.perf_counter()
+    node.start()
+    decoded = None
+
+    while node._segment <= len(node._frames) or node._queue.qsize():
+        if decoded is None and not any(d.is_alive() for d in node._decoders):
+            decoded = time.perf_counter() - start
+
+        time.sleep(0.005)
+
+    elapsed = time.perf_counter() - start
+    decoded = decoded or elapsed
+    node.stop()
+
+    print(
+        f'  {label:24} {counter.count:6} frames '
+        f'{counter.count / elapsed:10.1f} frames/s '
+        f'decoded in {decoded:6.2f} s'
+    )
+
+
+if __name__ == '__main__':
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 1280
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 720
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = str(pathlib.Path(folder, 'video.mp4'))
+        _encode(path, seconds, width, height)
+
+        print(
+            f'{seconds} s of {width}x{height} h264, scaled to 640x360, '
+            f'{len(os.sched_getaffinity(0))} CPUs'
+        )
+
+        _run(path, 'sequential')
+        _run(path, 'sequential, one thread', decode_threads=1)
+        _run(path, '4 segments', segments=4)
+        _run(path, 'sequential, 5 fps', fps=5)
+        _run(path, '4 segments, 5 fps', segments=4, fps=5)
@@ -0,0 +1,84 @@
+"""
+Measure the VideostreamAv sink: time the node thread spends handing frames
+over, frames encoded per second by the encoder thread, and frames dropped
+when frames arrive faster than they can be encoded. The stream is sent to a
+local port nobody listens on.
+
+Run with: python benchmarks/videostream_av.py [frames] [width] [height]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from juturna.components import Message
+from juturna.nodes.sink._videostream_av.videostream_av import VideostreamAv
+from juturna.payloads import ImagePayload
+
+
+def _run(codec: str, frames: int, width: int, height: int):
+    node = VideostreamAv(
+        dst_host='127.0.0.1',
+        dst_port=9,
+        codec=codec,
+        payload_type=96,
+        out_width=0,
+        out_height=0,
+        rate=1000,
+        gop=30,
+        bit_rate=2000000,
+        queue_size=4,
+        node_name=f'stream_{codec}',
+        pipe_name='benchmark',
+    )
+
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, (height, width, 3), np.uint8)
+    messages = [
+        Message[ImagePayload](
+            creator='benchmark',
+            payload=ImagePayload(
+                image=np.roll(base, idx, axis=1),
+                width=width,
+                height=height,
+                depth=3,
+                pixel_format='rgb24',
+            ),
+        )
+        for idx in range(frames)
+    ]
+
+    node.start()
+
+    handover = 0.0
+    start = time.perf_counter()
+
+    for message in messages:
+        t = time.perf_counter()
+        node.update(message)
+        handover += time.perf_counter() - t
+
+        # frames arrive at 1 kHz at most, the output rate
+        time.sleep(0.001)
+
+    while node._frames.qsize():
+        time.sleep(0.001)
+
+    elapsed = time.perf_counter() - start
+    node.stop()
+
+    print(f'{codec}, {frames} frames {width}x{height}')
+    print(f'  handover           {1e6 * handover / frames:10.1f} us/frame')
+    print(f'  encoded            {node._encoded / elapsed:10.1f} frames/s')
+    print(f'  dropped            {node._dropped:10}')
+    print(f'  skipped            {node._skipped:10}')
+
+
+if __name__ == '__main__':
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 640
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 480
+
+    for codec in ('h264', 'vp8'):
+        _run(codec, frames, width, height)
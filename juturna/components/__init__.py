@@ -3,6 +3,14 @@ from juturna.components._message import Message
 from juturna.components._node import Node
 from juturna.components._pipeline import Pipeline
 from juturna.components._buffer import Buffer
+from juturna.components._frame_pool import FramePool
+from juturna.components._load_shedder import LoadShedder
+from juturna.components._memo_cache import MemoCache
+from juturna.components._inference_server import InferenceServer
+from juturna.components._inference_server import InferenceAdapter
+from juturna.components._inference_server import UltralyticsAdapter
+from juturna.components._inference_server import HFPipelineAdapter
+from juturna.components._inference_server import FasterWhisperAdapter
 
 
 __all__ = [
@@ -10,4 +18,12 @@ __all__ = [
     'Node',
     'Pipeline',
     'Buffer',
+    'FramePool',
+    'LoadShedder',
+    'MemoCache',
+    'InferenceServer',
+    'InferenceAdapter',
+    'UltralyticsAdapter',
+    'HFPipelineAdapter',
+    'FasterWhisperAdapter',
 ]
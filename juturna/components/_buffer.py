@@ -12,10 +12,16 @@ from juturna.meta import JUTURNA_MAX_QUEUE_SIZE
 
 
 class Buffer:
-    def __init__(self, creator: str, synchroniser: Callable | None = None):
+    def __init__(
+        self,
+        creator: str,
+        synchroniser: Callable | None = None,
+        on_emit: Callable | None = None,
+    ):
         self._data: dict[str, list[Message]] = dict()
         self._data_lock = threading.Lock()
         self._synchroniser: Callable = synchroniser
+        self._on_emit: Callable | None = on_emit
 
         # out queue can be built based on the synchronisation policy
         self._out_queue = queue.Queue(maxsize=JUTURNA_MAX_QUEUE_SIZE)
@@ -27,6 +33,10 @@ class Buffer:
     def get(self, timeout: float = None) -> typing.Any:
         return self._out_queue.get(timeout=timeout)
 
+    def qsize(self) -> int:
+        """Number of synchronised messages waiting to be processed"""
+        return self._out_queue.qsize()
+
     def put(self, message: Message | None):
         if message.creator not in self._data:
             self._data[message.creator] = list()
@@ -71,6 +81,9 @@ class Buffer:
             )
         )
 
+        if self._on_emit is not None:
+            self._on_emit(to_send)
+
         self._out_queue.put(to_send)
 
     def flush(self):
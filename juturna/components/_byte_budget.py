@@ -0,0 +1,112 @@
+import threading
+
+
+class ByteBudget:
+    """
+    A byte budget limits the amount of data that can be held at the same time
+    by one or more consumers. Every time a message is queued its size is
+    acquired from the budget, and released once the message is consumed.
+    Budgets can be chained, so that a node budget also draws from the budget of
+    the pipeline it belongs to.
+    """
+
+    def __init__(
+        self, name: str, max_bytes: int, parent: 'ByteBudget | None' = None
+    ):
+        """
+        Parameters
+        ----------
+        name : str
+            Name of the budget, used for logging.
+        max_bytes : int
+            Maximum number of bytes that can be acquired at the same time. If
+            set to 0 or less, the budget is unbounded.
+        parent : ByteBudget, optional
+            A parent budget that will be drawn from every time this budget is.
+
+        """
+        self.name = name
+        self.max_bytes = max_bytes
+        self.parent = parent
+
+        self._used = 0
+        self._cond = threading.Condition()
+
+    def __repr__(self):
+        return f'<ByteBudget {self.name}: {self._used}/{self.max_bytes}>'
+
+    @property
+    def used(self) -> int:
+        return self._used
+
+    def acquire(
+        self, size: int, timeout: float | None = None, force: bool = False
+    ) -> bool:
+        """
+        Acquire bytes from the budget, blocking until enough bytes are
+        available. A single item larger than the whole budget is admitted only
+        when the budget is empty, so oversized messages can not block forever.
+        In the same way, an empty budget always draws from its parent: every
+        consumer can hold at least one message, so a full shared budget can
+        never prevent the pipeline from making progress.
+
+        Parameters
+        ----------
+        size : int
+            Number of bytes to acquire.
+        timeout : float, optional
+            How long to wait for bytes to be available. If None, wait forever.
+        force : bool
+            Acquire the bytes without waiting, regardless of the limit of the
+            budget and of its parents.
+
+        Returns
+        -------
+        bool
+            True if the bytes were acquired, False if the timeout expired.
+
+        """
+        with self._cond:
+            if (
+                not force
+                and self.max_bytes > 0
+                and not self._cond.wait_for(
+                    lambda: (
+                        self._used == 0 or self._used + size <= self.max_bytes
+                    ),
+                    timeout=timeout,
+                )
+            ):
+                return False
+
+            was_empty = self._used == 0
+            self._used += size
+
+        if self.parent is not None and not self.parent.acquire(
+            size, timeout, force=force or was_empty
+        ):
+            self._release_local(size)
+
+            return False
+
+        return True
+
+    def release(self, size: int):
+        """
+        Release bytes previously acquired from the budget.
+
+        Parameters
+        ----------
+        size : int
+            Number of bytes to release.
+
+        """
+        self._release_local(size)
+
+        if self.parent is not None:
+            self.parent.release(size)
+
+    def _release_local(self, size: int):
+        with self._cond:
+            self._used = max(0, self._used - size)
+            self._cond.notify_all()
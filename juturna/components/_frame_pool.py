@@ -0,0 +1,129 @@
+import threading
+import weakref
+
+import numpy as np
+
+
+class FramePool:
+    """
+    A frame pool holds a fixed number of preallocated buffers, so that sources
+    producing frames of constant shape do not allocate a new array for every
+    frame. Every acquired frame is a view on one of the pool slots, and the slot
+    goes back to the pool as soon as the frame, and every array derived from
+    it, is garbage collected. This happens when the last downstream node
+    releases the message carrying the frame.
+    """
+
+    def __init__(self, shape: tuple, dtype: np.dtype = np.uint8, size: int = 8):
+        """
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the frames in the pool.
+        dtype : np.dtype
+            Data type of the frames in the pool.
+        size : int
+            Maximum number of slots the pool can hold. Slots are allocated the
+            first time they are needed. When all the slots are in use, frames
+            are allocated outside the pool, and never recycled.
+
+        """
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._nbytes = int(np.prod(self._shape)) * self._dtype.itemsize
+        self._size = size
+
+        self._slots: list[bytearray] = list()
+        self._free: list[int] = list()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return (
+            f'<FramePool {self._shape}: '
+            f'{self.in_use}/{self._size} in use, '
+            f'{self.hits} hits, {self.misses} misses>'
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Size in bytes of a single frame"""
+        return self._nbytes
+
+    @property
+    def in_use(self) -> int:
+        """Number of slots currently held by frames"""
+        with self._lock:
+            return len(self._slots) - len(self._free)
+
+    def acquire(self) -> np.ndarray:
+        """
+        Get a frame from the pool. The content of the frame is undefined, as
+        slots are not cleared when they are recycled.
+
+        Returns
+        -------
+        np.ndarray
+            A writable frame with the pool shape and data type.
+
+        """
+        with self._lock:
+            if self._free:
+                idx = self._free.pop()
+                self.hits += 1
+            elif len(self._slots) < self._size:
+                idx = len(self._slots)
+                self._slots.append(bytearray(self._nbytes))
+                self.misses += 1
+            else:
+                idx = None
+                self.misses += 1
+
+        if idx is None:
+            return np.empty(self._shape, dtype=self._dtype)
+
+        # views on this array all point to it as their base, so the slot is
+        # only recycled when no view on the frame is left
+        flat = np.frombuffer(self._slots[idx], dtype=self._dtype)
+        weakref.finalize(flat, self._recycle, idx)
+
+        return flat.reshape(self._shape)
+
+    def fill(self, stream) -> np.ndarray | None:
+        """
+        Acquire a frame, and fill it reading from a binary stream. Data are
+        read straight into the frame memory with ``readinto``, with no
+        intermediate buffer.
+
+        Parameters
+        ----------
+        stream : io.BufferedIOBase
+            Any binary stream exposing a ``readinto`` method.
+
+        Returns
+        -------
+        np.ndarray | None
+            The filled frame, or None if the stream ended before a whole frame
+            could be read.
+
+        """
+        frame = self.acquire()
+        view = memoryview(frame).cast('B')
+        filled = 0
+
+        with view:
+            while filled < self._nbytes:
+                read = stream.readinto(view[filled:])
+
+                if not read:
+                    return None
+
+                filled += read
+
+        return frame
+
+    def _recycle(self, idx: int):
+        with self._lock:
+            self._free.append(idx)
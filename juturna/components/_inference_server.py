@@ -0,0 +1,354 @@
+import abc
+import queue
+import threading
+import time
+
+from concurrent.futures import Future
+from collections.abc import Callable
+from typing import Any
+
+from juturna.meta import JUTURNA_INFERENCE_MAX_BATCH
+from juturna.meta import JUTURNA_INFERENCE_MAX_LATENCY
+from juturna.meta import JUTURNA_THREAD_JOIN_TIMEOUT
+from juturna.utils.log_utils import jt_logger
+
+
+class InferenceAdapter(abc.ABC):
+    """
+    An inference adapter runs a batch of inputs through a model. Adapters hide
+    how each model family is invoked, so that the same inference server can
+    serve any of them.
+    """
+
+    def __init__(self, model: Any):
+        """
+        Parameters
+        ----------
+        model : Any
+            The model object the adapter runs.
+
+        """
+        self.model = model
+
+    @abc.abstractmethod
+    def predict(self, inputs: list, **options) -> list:
+        """
+        Run inference on a batch of inputs.
+
+        Parameters
+        ----------
+        inputs : list
+            The batch inputs.
+        **options
+            Inference options, shared by every input in the batch.
+
+        Returns
+        -------
+        list
+            One result for every input, in the same order.
+
+        """
+
+
+class UltralyticsAdapter(InferenceAdapter):
+    """Adapter for ultralytics models, images are predicted in one batch"""
+
+    def predict(self, inputs: list, **options) -> list:
+        return list(self.model.predict(inputs, verbose=False, **options))
+
+
+class HFPipelineAdapter(InferenceAdapter):
+    """Adapter for Hugging Face pipelines, inputs are run as one batch"""
+
+    def predict(self, inputs: list, **options) -> list:
+        return list(self.model(inputs, batch_size=len(inputs), **options))
+
+
+class FasterWhisperAdapter(InferenceAdapter):
+    """
+    Adapter for faster-whisper models. The library only batches segments of
+    the same audio, so inputs are transcribed one after the other on the
+    shared model. Results are lists of transcribed segments.
+    """
+
+    def predict(self, inputs: list, **options) -> list:
+        return [list(self.model.transcribe(a, **options)[0]) for a in inputs]
+
+
+class InferenceServer:
+    """
+    An inference server runs a single model instance on behalf of many nodes,
+    possibly belonging to different pipelines. Requests submitted by nodes
+    are grouped in dynamic batches: a batch is closed as soon as it is full,
+    or when its first request has been waiting for the maximum latency.
+    Requests with different inference options are never batched together.
+    """
+
+    _shared: dict[str, 'InferenceServer'] = dict()
+    _shared_lock = threading.Lock()
+    # creation lock of every server being created, with its number of users
+    _creation_locks: dict[str, list] = dict()
+
+    def __init__(
+        self,
+        name: str,
+        adapter: InferenceAdapter,
+        max_batch_size: int = JUTURNA_INFERENCE_MAX_BATCH,
+        max_latency: float = JUTURNA_INFERENCE_MAX_LATENCY,
+    ):
+        """
+        Parameters
+        ----------
+        name : str
+            Name of the server, used as key when the server is shared.
+        adapter : InferenceAdapter
+            The adapter running the model.
+        max_batch_size : int
+            Maximum number of requests in a batch.
+        max_latency : float
+            Maximum time, in seconds, a request waits for its batch to fill.
+
+        """
+        self.name = name
+        self.adapter = adapter
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+
+        self.logger = jt_logger(f'inference.{name}')
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._accepting = False
+        self._submit_lock = threading.Lock()
+        self._users = 0
+
+        self.batches = 0
+        self.requests = 0
+
+    def __repr__(self):
+        return f'<InferenceServer {self.name}: {self.mean_batch_size:.2f}>'
+
+    @classmethod
+    def shared(
+        cls,
+        name: str,
+        adapter_factory: Callable[[], InferenceAdapter],
+        **kwargs,
+    ) -> 'InferenceServer':
+        """
+        Get the running server with the given name, creating and starting it
+        if needed. The adapter factory is only invoked when the server is
+        created, so a model is loaded once no matter how many nodes use it.
+        Every call must be matched by a call to ``release``.
+
+        Parameters
+        ----------
+        name : str
+            Name of the shared server.
+        adapter_factory : Callable[[], InferenceAdapter]
+            Create the adapter, loading its model.
+        **kwargs
+            Server arguments, only used when the server is created.
+
+        Returns
+        -------
+        InferenceServer
+            The shared server.
+
+        """
+        with cls._shared_lock:
+            server = cls._shared.get(name)
+
+            if server is not None:
+                server._users += 1
+
+                return server
+
+            creation = cls._creation_locks.setdefault(
+                name, [threading.Lock(), 0]
+            )
+            creation[1] += 1
+
+        # models can take long to load, so only requests for the same server
+        # wait for its creation
+        try:
+            with creation[0]:
+                with cls._shared_lock:
+                    server = cls._shared.get(name)
+
+                    if server is not None:
+                        server._users += 1
+
+                        return server
+
+                server = cls(name, adapter_factory(), **kwargs)
+                server.start()
+
+                with cls._shared_lock:
+                    server._users += 1
+                    cls._shared[name] = server
+
+                return server
+        finally:
+            # once the server is registered, the lock is only needed by the
+            # requests already waiting on it
+            with cls._shared_lock:
+                creation[1] -= 1
+
+                if creation[1] == 0:
+                    del cls._creation_locks[name]
+
+    def release(self):
+        """Release a shared server, stopping it when no node is using it"""
+        with self.__class__._shared_lock:
+            self._users -= 1
+
+            if self._users > 0:
+                return
+
+            self.__class__._shared.pop(self.name, None)
+
+        self.stop()
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of requests served by a batch"""
+        return self.requests / self.batches if self.batches else 0.0
+
+    def start(self):
+        """Start serving requests"""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._serve, name=f'_inference_{self.name}', daemon=True
+        )
+        self._thread.start()
+        self._accepting = True
+
+    def stop(self):
+        """Stop serving requests, after all the queued ones are served"""
+        if self._thread is None:
+            return
+
+        # requests submitted after the stop sentinel would never be served
+        with self._submit_lock:
+            self._accepting = False
+            self._queue.put(None)
+
+        self._thread.join(timeout=JUTURNA_THREAD_JOIN_TIMEOUT)
+
+        if self._thread.is_alive():
+            self.logger.warning(f'{self._thread.name} still serving, detached')
+
+        self._thread = None
+
+    def submit(self, inputs: Any, **options) -> Future:
+        """
+        Submit a single input for inference.
+
+        Parameters
+        ----------
+        inputs : Any
+            The model input.
+        **options
+            Inference options.
+
+        Returns
+        -------
+        Future
+            A future that will hold the inference result.
+
+        """
+        future = Future()
+
+        with self._submit_lock:
+            if not self._accepting:
+                raise RuntimeError(
+                    f'inference server {self.name} is not running'
+                )
+
+            self._queue.put((inputs, options, future))
+
+        return future
+
+    def infer(self, inputs: Any, timeout: float | None = None, **options):
+        """
+        Submit a single input for inference, and wait for its result.
+
+        Parameters
+        ----------
+        inputs : Any
+            The model input.
+        timeout : float | None
+            Maximum time to wait for the result.
+        **options
+            Inference options.
+
+        Returns
+        -------
+        Any
+            The inference result.
+
+        """
+        return self.submit(inputs, **options).result(timeout=timeout)
+
+    def _serve(self):
+        stopping = False
+
+        while not stopping:
+            request = self._queue.get()
+
+            if request is None:
+                break
+
+            batch = [request]
+            deadline = time.monotonic() + self.max_latency
+
+            while len(batch) < self.max_batch_size:
+                try:
+                    request = self._queue.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+
+                if request is None:
+                    stopping = True
+                    break
+
+                batch.append(request)
+
+            self._run(batch)
+
+    def _run(self, batch: list):
+        groups = dict()
+
+        for request in batch:
+            key = repr(sorted(request[1].items()))
+            groups.setdefault(key, list()).append(request)
+
+        for group in groups.values():
+            options = group[0][1]
+
+            try:
+                results = self.adapter.predict([r[0] for r in group], **options)
+
+                if len(results) != len(group):
+                    raise RuntimeError(
+                        f'adapter returned {len(results)} results '
+                        f'for {len(group)} inputs'
+                    )
+            except Exception as e:
+                self.logger.error(f'inference failed: {e}')
+
+                for _, _, future in group:
+                    future.set_exception(e)
+
+                continue
+
+            for (_, _, future), result in zip(group, results, strict=True):
+                future.set_result(result)
+
+            self.batches += 1
+            self.requests += len(group)
@@ -0,0 +1,118 @@
+import time
+
+
+class LoadShedder:
+    """
+    A load shedder decides which messages a node can skip to hold a target
+    output latency. The time the node takes to process a message is tracked
+    as an exponential moving average; a message is skipped when newer ones
+    are already waiting behind it, and processing all of them would take the
+    last one past the target latency. The newest available message is never
+    skipped, so that under overload the node coalesces bursts of messages
+    into the most recent one.
+    """
+
+    def __init__(self, target_latency: float, smoothing: float = 0.2):
+        """
+        Parameters
+        ----------
+        target_latency : float
+            Target latency, in seconds, between the creation of a message and
+            the end of its processing.
+        smoothing : float
+            Weight of the last processing time in the moving average.
+
+        """
+        if target_latency <= 0:
+            raise ValueError('target latency must be positive')
+
+        if not 0 < smoothing <= 1:
+            raise ValueError('smoothing must be in (0, 1]')
+
+        self.target_latency = target_latency
+        self.smoothing = smoothing
+
+        self.processing_time = 0.0
+        self.processed = 0
+        self.skipped = 0
+
+    def __repr__(self):
+        return (
+            f'<LoadShedder {self.target_latency}s: '
+            f'{self.processing_time:.4f}s, {self.skip_ratio:.2f}>'
+        )
+
+    @property
+    def skip_ratio(self) -> float:
+        """Fraction of the observed messages that were skipped"""
+        total = self.processed + self.skipped
+
+        return self.skipped / total if total else 0.0
+
+    def predict(self, created_at: float, backlog: int) -> float:
+        """
+        Predict the latency of the last waiting message, if the current one
+        and all those behind it were processed.
+
+        Parameters
+        ----------
+        created_at : float
+            Creation time of the current message.
+        backlog : int
+            Number of messages waiting behind the current one.
+
+        Returns
+        -------
+        float
+            The predicted latency, in seconds.
+
+        """
+        age = time.time() - created_at
+
+        return age + self.processing_time * (backlog + 1)
+
+    def should_skip(self, created_at: float, backlog: int) -> bool:
+        """
+        Decide whether the current message should be skipped, and account the
+        decision in the skip ratio.
+
+        Parameters
+        ----------
+        created_at : float
+            Creation time of the current message.
+        backlog : int
+            Number of messages waiting behind the current one.
+
+        Returns
+        -------
+        bool
+            True if the message should be skipped.
+
+        """
+        skip = (
+            backlog > 0
+            and self.predict(created_at, backlog) > self.target_latency
+        )
+
+        if skip:
+            self.skipped += 1
+
+        return skip
+
+    def observe(self, elapsed: float):
+        """
+        Record the processing time of a message.
+
+        Parameters
+        ----------
+        elapsed : float
+            Time spent processing the message, in seconds.
+
+        """
+        self.processing_time = (
+            elapsed
+            if self.processed == 0
+            else self.smoothing * elapsed
+            + (1 - self.smoothing) * self.processing_time
+        )
+        self.processed += 1
@@ -0,0 +1,329 @@
+import collections
+import dataclasses
+import hashlib
+import pathlib
+import pickle
+import sqlite3
+import threading
+import time
+
+from typing import Any
+
+import numpy as np
+
+
+_POLICIES = ('lru', 'lfu')
+
+
+class MemoCache:
+    """
+    A bounded cache for results computed by nodes, such as model outputs or
+    database queries. Entries are evicted either least recently used (LRU) or
+    least frequently used (LFU, ties broken by recency) once the cache is
+    full, and expire after a time to live. A cache can be persisted to a local
+    database file, so that results survive between runs.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        policy: str = 'lru',
+        ttl: float = 0,
+        path: str | None = None,
+        key: list | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        size : int
+            Maximum number of entries.
+        policy : str
+            Eviction policy, either ``lru`` or ``lfu``.
+        ttl : float
+            Time to live of an entry, in seconds. If 0, entries never expire.
+        path : str | None
+            Path of the database file the cache is persisted to. If None, the
+            cache is only kept in memory.
+        key : list | None
+            The payload fields cache keys are built from. If None, keys are
+            built from the whole payload.
+
+        """
+        if size <= 0:
+            raise ValueError('cache size must be positive')
+
+        if policy not in _POLICIES:
+            raise ValueError(f'unknown eviction policy: {policy}')
+
+        self.size = size
+        self.policy = policy
+        self.ttl = ttl
+        self.path = None if path is None else pathlib.Path(path)
+        self.key = key
+
+        # key -> [value, expiry, frequency], kept in recency order
+        self._entries: collections.OrderedDict[str, list] = (
+            collections.OrderedDict()
+        )
+
+        # frequency -> keys with that frequency, kept in recency order
+        self._frequencies: dict[int, collections.OrderedDict] = dict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def __repr__(self):
+        return (
+            f'<MemoCache {self.policy} {len(self)}/{self.size}: '
+            f'{self.hit_ratio:.2f}>'
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+
+        return entry is not None and not self._expired(entry)
+
+    def project(self, *payloads: Any) -> str:
+        """
+        Build a cache key from one or more payloads, projecting each of them
+        on the cache key fields.
+
+        Parameters
+        ----------
+        *payloads : Any
+            The payloads the key is built from. Payloads must support item
+            access when key fields are set.
+
+        Returns
+        -------
+        str
+            The cache key.
+
+        """
+        if self.key is None:
+            return _fingerprint(payloads)
+
+        return _fingerprint(
+            tuple(tuple(p[field] for field in self.key) for p in payloads)
+        )
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of the lookups that were served from the cache"""
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+        Look up an entry.
+
+        Parameters
+        ----------
+        key : str
+            The entry key.
+
+        Returns
+        -------
+        tuple[bool, Any]
+            Whether the entry was found, and its value (None if not found).
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and self._expired(entry):
+                self._remove(key)
+                self.evictions += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+
+                return False, None
+
+            self._touch(key, entry)
+            self.hits += 1
+
+            return True, entry[0]
+
+    def put(self, key: str, value: Any) -> int:
+        """
+        Store an entry, evicting others if the cache is full.
+
+        Parameters
+        ----------
+        key : str
+            The entry key.
+        value : Any
+            The entry value.
+
+        Returns
+        -------
+        int
+            The number of evicted entries.
+
+        """
+        expiry = time.time() + self.ttl if self.ttl > 0 else 0
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                entry[0] = value
+                entry[1] = expiry
+                self._touch(key, entry)
+
+                return 0
+
+            evicted = 0
+
+            while len(self._entries) >= self.size:
+                self._remove(self._victim())
+                evicted += 1
+
+            self._insert(key, [value, expiry, 0])
+            self.evictions += evicted
+
+            return evicted
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._frequencies.clear()
+
+    def save(self):
+        """Persist the cache content to its database file"""
+        if self.path is None:
+            return
+
+        with self._lock:
+            rows = [
+                (key, pickle.dumps(value), expiry, frequency)
+                for key, (value, expiry, frequency) in self._entries.items()
+                if not self._expired((value, expiry))
+            ]
+
+        with sqlite3.connect(self.path) as db:
+            db.execute(_CREATE)
+            db.execute('DELETE FROM entries')
+            db.executemany('INSERT INTO entries VALUES (?, ?, ?, ?)', rows)
+
+        db.close()
+
+    def _load(self):
+        with sqlite3.connect(self.path) as db:
+            db.execute(_CREATE)
+            rows = db.execute(
+                'SELECT key, value, expiry, frequency FROM entries '
+                'ORDER BY rowid'
+            ).fetchall()
+
+        db.close()
+
+        # only the most recent entries are kept if the cache shrank
+        for key, value, expiry, frequency in rows[-self.size :]:
+            if self._expired((None, expiry)):
+                continue
+
+            self._insert(
+                key, [pickle.loads(value), expiry, max(frequency - 1, 0)]
+            )
+
+    def _expired(self, entry: list | tuple) -> bool:
+        return 0 < entry[1] <= time.time()
+
+    def _insert(self, key: str, entry: list):
+        self._entries[key] = entry
+        self._touch(key, entry)
+
+    def _touch(self, key: str, entry: list):
+        self._entries.move_to_end(key)
+        entry[2] += 1
+
+        if self.policy != 'lfu':
+            return
+
+        self._discard_frequency(key, entry[2] - 1)
+        self._frequencies.setdefault(entry[2], collections.OrderedDict())[
+            key
+        ] = None
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+
+        if self.policy == 'lfu':
+            self._discard_frequency(key, entry[2])
+
+    def _discard_frequency(self, key: str, frequency: int):
+        keys = self._frequencies.get(frequency)
+
+        if keys is None:
+            return
+
+        keys.pop(key, None)
+
+        if not keys:
+            del self._frequencies[frequency]
+
+    def _victim(self) -> str:
+        if self.policy == 'lfu':
+            return next(iter(self._frequencies[min(self._frequencies)]))
+
+        return next(iter(self._entries))
+
+
+def _fingerprint(value: Any) -> str:
+    # numpy abbreviates the repr of large arrays, so arrays and buffers are
+    # keyed by a digest of their content instead
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(value).data, digest_size=16
+        )
+
+        return f'array({value.dtype},{value.shape},{digest.hexdigest()})'
+
+    if isinstance(value, bytes | bytearray | memoryview):
+        digest = hashlib.blake2b(value, digest_size=16)
+
+        return f'bytes({digest.hexdigest()})'
+
+    if isinstance(value, dict):
+        items = ','.join(
+            f'{_fingerprint(k)}:{_fingerprint(v)}' for k, v in value.items()
+        )
+
+        return f'{type(value).__name__}{{{items}}}'
+
+    if isinstance(value, list | tuple):
+        items = ','.join(_fingerprint(v) for v in value)
+
+        return f'{type(value).__name__}[{items}]'
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        items = ','.join(
+            f'{f.name}={_fingerprint(getattr(value, f.name))}'
+            for f in dataclasses.fields(value)
+        )
+
+        return f'{type(value).__name__}({items})'
+
+    if isinstance(value, np.ndarray):
+        return _fingerprint(value.tolist())
+
+    return repr(value)
+
+
+_CREATE = (
+    'CREATE TABLE IF NOT EXISTS entries '
+    '(key TEXT PRIMARY KEY, value BLOB, expiry REAL, frequency INTEGER)'
+)
@@ -1,12 +1,54 @@
 import typing
 import time
 import json
+import struct
 import itertools
+import dataclasses
 
 from contextlib import contextmanager
 from types import MappingProxyType
 
+import numpy as np
+
 from juturna.payloads import Draft
+from juturna.payloads import BasePayload
+from juturna.payloads import ControlPayload
+from juturna.payloads import AudioPayload
+from juturna.payloads import ImagePayload
+from juturna.payloads import VideoPayload
+from juturna.payloads import BytesPayload
+from juturna.payloads import ObjectPayload
+from juturna.payloads import Batch
+from juturna.payloads import ControlSignal
+from juturna.payloads._payloads import _deep_size
+from juturna.payloads._payloads import _set_read_only
+
+
+# binary codec layout: fixed preamble (magic, version, header length), a JSON
+# header describing message fields and buffers, then raw buffers, each aligned
+# to _CODEC_ALIGN bytes so they can be mapped with np.frombuffer
+_CODEC_MAGIC = b'JTMB'
+_CODEC_VERSION = 1
+_CODEC_PREAMBLE = struct.Struct('<4sBxxxI')
+_CODEC_ALIGN = 64
+_CODEC_TAG = '__jt__'
+
+# values stored in the header as they are, lists made only of these are not
+# walked item by item
+_CODEC_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+_CODEC_PAYLOADS: dict[str, type] = {
+    t.__name__: t
+    for t in (
+        ControlPayload,
+        AudioPayload,
+        ImagePayload,
+        VideoPayload,
+        BytesPayload,
+        ObjectPayload,
+        Batch,
+    )
+}
 
 
 class Message[T_Input]:
@@ -25,6 +67,7 @@ class Message[T_Input]:
         '_payload',
         '_is_frozen',
         '_data_source_id',
+        '_size_bytes',
     ]
 
     _id_gen = itertools.count()
@@ -82,16 +125,20 @@ class Message[T_Input]:
         object.__delattr__(self, key)
 
     def _freeze(self):
-        """Freeze the message, making it immutable."""
+        """Freeze the message, making it and its arrays immutable."""
         if self._is_frozen:
             return
 
         if isinstance(self.payload, Draft):
             self.payload = self.payload.compile()
 
+        _set_read_only(self.payload)
+        _set_read_only(self.meta)
+
         self.meta = MappingProxyType(self.meta)
         self.timers = MappingProxyType(self.timers)
 
+        object.__setattr__(self, '_size_bytes', self._compute_size())
         object.__setattr__(self, '_is_frozen', True)
 
     def to_dict(self) -> dict:
@@ -153,6 +200,132 @@ class Message[T_Input]:
             indent=indent,
         )
 
+    def to_bytes(self, encoder: typing.Callable | None = None) -> bytes:
+        """
+        Convert the message to its binary representation. Message fields and
+        metadata are stored in a compact header, while numpy arrays and byte
+        contents (both in the payload and in the metadata) are stored as raw
+        contiguous buffers, with their dtype and shape.
+
+        Parameters
+        ----------
+        encoder : callable, optional
+            A function used to convert objects the codec does not know how to
+            store into something it does. The default is None, in which case
+            unknown objects raise a TypeError.
+
+        Returns
+        -------
+        bytes
+            The binary representation of the message.
+
+        """
+        buffers = list()
+        header = json.dumps(
+            {
+                'message': _encode_message(self, buffers, encoder),
+                'buffers': [b[0] for b in buffers],
+            },
+            separators=(',', ':'),
+        ).encode('utf-8')
+
+        chunks = [
+            _CODEC_PREAMBLE.pack(_CODEC_MAGIC, _CODEC_VERSION, len(header)),
+            header,
+        ]
+        written = _CODEC_PREAMBLE.size + len(header)
+
+        for _, view in buffers:
+            pad = -written % _CODEC_ALIGN
+            chunks.append(b'\x00' * pad)
+            chunks.append(view)
+            written += pad + view.nbytes
+
+        return b''.join(chunks)
+
+    @staticmethod
+    def from_bytes(data: bytes | bytearray | memoryview) -> 'Message':
+        """
+        Create a message from its binary representation. Arrays are not
+        copied: they are created as views over the provided data, so they
+        will be read-only if the data is.
+
+        Parameters
+        ----------
+        data : bytes | bytearray | memoryview
+            The binary representation of the message, as produced by
+            ``to_bytes()``.
+
+        Returns
+        -------
+        Message
+            The decoded message.
+
+        Raises
+        ------
+        ValueError
+            If the data is not a juturna binary message, or if it was produced
+            with an unsupported codec version.
+
+        """
+        view = memoryview(data).cast('B')
+
+        if view.nbytes < _CODEC_PREAMBLE.size:
+            raise ValueError('data too short for a binary message')
+
+        magic, version, header_len = _CODEC_PREAMBLE.unpack_from(view)
+
+        if magic != _CODEC_MAGIC:
+            raise ValueError('data is not a binary message')
+
+        if version != _CODEC_VERSION:
+            raise ValueError(f'unsupported binary message version {version}')
+
+        header_end = _CODEC_PREAMBLE.size + header_len
+        header = json.loads(bytes(view[_CODEC_PREAMBLE.size : header_end]))
+
+        buffers = list()
+        offset = header_end
+
+        for kind, dtype, shape, nbytes in header['buffers']:
+            offset += -offset % _CODEC_ALIGN
+
+            if kind == 'nd':
+                dtype = np.dtype(dtype)
+                buffers.append(
+                    np.frombuffer(
+                        view,
+                        dtype=dtype,
+                        count=nbytes // dtype.itemsize,
+                        offset=offset,
+                    ).reshape(shape)
+                )
+            else:
+                buffers.append(bytes(view[offset : offset + nbytes]))
+
+            offset += nbytes
+
+        return _decode_message(header['message'], buffers)
+
+    @property
+    def size_bytes(self) -> int:
+        """
+        Size in bytes of the message content, including its payload and any
+        data stored in its metadata. The size of a frozen message is computed
+        only once.
+        """
+        if self._is_frozen:
+            return self._size_bytes
+
+        return self._compute_size()
+
+    def _compute_size(self) -> int:
+        payload_size = (
+            0 if isinstance(self.payload, Draft) else _deep_size(self.payload)
+        )
+
+        return payload_size + _deep_size(dict(self.meta))
+
     @property
     def payload(self) -> T_Input:
         """Returns the payload of the message."""
@@ -208,3 +381,141 @@ class Message[T_Input]:
             elapsed = time.time() - start
 
             self.timer(timer_name, elapsed)
+
+
+def _encode_message(
+    message: Message, buffers: list, encoder: typing.Callable | None
+) -> dict:
+    payload = message.payload
+
+    if isinstance(payload, Draft):
+        payload = payload.compile()
+
+    return {
+        'created_at': message.created_at,
+        'creator': message.creator,
+        'version': message.version,
+        'id': message.id,
+        'payload': _encode_value(payload, buffers, encoder),
+        'meta': _encode_value(dict(message.meta), buffers, encoder),
+        'timers': dict(message.timers),
+    }
+
+
+def _encode_value(
+    value: typing.Any, buffers: list, encoder: typing.Callable | None
+) -> typing.Any:
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError('object arrays cannot be binary encoded')
+
+        value = np.ascontiguousarray(value)
+        buffers.append(
+            (
+                ['nd', value.dtype.str, list(value.shape), value.nbytes],
+                memoryview(value).cast('B'),
+            )
+        )
+
+        return {_CODEC_TAG: 'buf', 'i': len(buffers) - 1}
+
+    if isinstance(value, bytes | bytearray | memoryview):
+        view = memoryview(value).cast('B')
+        buffers.append((['raw', '', [], view.nbytes], view))
+
+        return {_CODEC_TAG: 'buf', 'i': len(buffers) - 1}
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, Message):
+        return {
+            _CODEC_TAG: 'msg',
+            'm': _encode_message(value, buffers, encoder),
+        }
+
+    if isinstance(value, ObjectPayload):
+        fields = dict(value)
+    elif isinstance(value, BasePayload):
+        fields = {
+            f.name: getattr(value, f.name) for f in dataclasses.fields(value)
+        }
+    elif isinstance(value, dict):
+        return {
+            str(k): _encode_value(v, buffers, encoder) for k, v in value.items()
+        }
+    elif isinstance(value, list | tuple):
+        if _scalars(value):
+            return list(value)
+
+        return [_encode_value(v, buffers, encoder) for v in value]
+    elif encoder is not None:
+        return _encode_value(encoder(value), buffers, None)
+    else:
+        raise TypeError(
+            f'type {value.__class__.__name__} cannot be binary encoded'
+        )
+
+    if type(value).__name__ not in _CODEC_PAYLOADS:
+        raise TypeError(
+            f'payload {value.__class__.__name__} cannot be binary encoded'
+        )
+
+    return {
+        _CODEC_TAG: 'payload',
+        't': type(value).__name__,
+        'f': {k: _encode_value(v, buffers, encoder) for k, v in fields.items()},
+    }
+
+
+def _decode_message(encoded: dict, buffers: list) -> Message:
+    message = Message(
+        creator=encoded['creator'],
+        version=encoded['version'],
+        payload=_decode_value(encoded['payload'], buffers),
+    )
+
+    message.created_at = encoded['created_at']
+    message.id = encoded['id']
+    message.meta.update(_decode_value(encoded['meta'], buffers))
+    message.timers.update(encoded['timers'])
+
+    return message
+
+
+def _decode_value(value: typing.Any, buffers: list) -> typing.Any:
+    if isinstance(value, list):
+        if _scalars(value):
+            return value
+
+        return [_decode_value(v, buffers) for v in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    match value.get(_CODEC_TAG):
+        case 'buf':
+            return buffers[value['i']]
+        case 'msg':
+            return _decode_message(value['m'], buffers)
+        case 'payload':
+            payload_type = _CODEC_PAYLOADS[value['t']]
+            fields = {
+                k: _decode_value(v, buffers) for k, v in value['f'].items()
+            }
+
+            if payload_type is ControlPayload:
+                fields['signal'] = ControlSignal(fields['signal'])
+            elif payload_type is Batch:
+                fields['messages'] = tuple(fields['messages'])
+
+            return payload_type(**fields)
+        case _:
+            return {k: _decode_value(v, buffers) for k, v in value.items()}
+
+
+def _scalars(values: list | tuple) -> bool:
+    return all(type(v) in _CODEC_SCALARS for v in values)
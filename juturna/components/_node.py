@@ -15,12 +15,17 @@ from juturna.payloads import ControlSignal
 
 from juturna.names import ComponentStatus
 from juturna.utils.log_utils import jt_logger
+from juturna.utils.net_utils import Reactor
 
 from juturna.meta import JUTURNA_THREAD_JOIN_TIMEOUT
 from juturna.meta import JUTURNA_MAX_QUEUE_SIZE
+from juturna.meta import JUTURNA_MAX_QUEUE_BYTES
 from juturna.meta import JUTURNA_TELEMETRY_BATCH_SIZE
 
 from juturna.components._buffer import Buffer
+from juturna.components._byte_budget import ByteBudget
+from juturna.components._load_shedder import LoadShedder
+from juturna.components._memo_cache import MemoCache
 from juturna.components._telemetry_manager import TelemetryManager
 from juturna.components._synchronisers import _SYNCHRONISERS
 
@@ -67,6 +72,11 @@ class Node[T_Input, T_Output]:
         self._status: ComponentStatus | None = None
 
         self._queue = queue.Queue(maxsize=JUTURNA_MAX_QUEUE_SIZE)
+        self._byte_budget = ByteBudget(_logger_name, JUTURNA_MAX_QUEUE_BYTES)
+        # sizes charged for queued messages; the queue references every
+        # charged message, so their ids cannot be reused until released
+        self._charged: dict[int, list[int]] = dict()
+        self._charged_lock = threading.Lock()
         self._worker_thread: threading.Thread | None = None
         self._source_thread: threading.Thread | None = None
         self._update_thread: threading.Thread | None = None
@@ -82,12 +92,20 @@ class Node[T_Input, T_Output]:
 
         self._suspended = False
         self._auto_dump = False
+        self._shedder: LoadShedder | None = None
+        self._cache: MemoCache | None = None
 
-        self._buffer = Buffer(_logger_name, self.synchroniser)
+        # payload fields results are cached by, unless the cache names others
+        self.cache_key: list | None = None
+
+        self._buffer = Buffer(
+            _logger_name, self.synchroniser, self._charge_emitted
+        )
 
         self._source_f: Callable | None = None
         self._source_sleep = -1
         self._source_mode = ''
+        self._readers: dict[Any, Callable] = dict()
 
         self._destinations: dict[str, Node] = dict()
         self._origins: list = list()
@@ -130,13 +148,211 @@ class Node[T_Input, T_Output]:
     def link_telemetry(self, manager: TelemetryManager):
         self._telemetry_manager = manager
 
+    def set_byte_budget(self, max_bytes: int, parent: ByteBudget | None = None):
+        """
+        Limit the amount of data the node can hold in its queues. Messages are
+        accounted from when they are put on the node until the node starts
+        processing them, so senders block once the limit is reached. Control
+        messages are never accounted.
+
+        Parameters
+        ----------
+        max_bytes : int
+            Maximum number of queued bytes. If set to 0 or less, only the
+            parent budget (if any) will be enforced.
+        parent : ByteBudget, optional
+            A shared budget the node will also draw from (for instance, the
+            budget of the pipeline the node belongs to).
+
+        """
+        self._byte_budget = ByteBudget(
+            f'{self.pipe_name}.{self.name}', max_bytes, parent
+        )
+
+    @property
+    def backlog(self) -> int:
+        """Number of messages received but not yet processed by the node"""
+        return self._queue.qsize() + self._buffer.qsize()
+
+    @property
+    def load_shedder(self) -> LoadShedder | None:
+        return self._shedder
+
+    def shed_load(self, target_latency: float | None):
+        """
+        Enable adaptive load shedding. When processing cannot keep up with the
+        incoming messages, the node skips the messages that would push the
+        output latency past the target, as long as newer messages are waiting
+        to be processed. Skipped messages are passed to ``skip()`` instead of
+        ``update()``, and recorded in telemetry as ``skip`` events.
+
+        Parameters
+        ----------
+        target_latency : float | None
+            Target latency, in seconds, between the creation of a message and
+            the end of its processing. If None or 0, load shedding is
+            disabled.
+
+        """
+        self._shedder = LoadShedder(target_latency) if target_latency else None
+
+    def skip(self, message: Message[T_Input]):
+        """
+        Handle a message skipped by the load shedder. Skipped messages are
+        discarded by default; nodes can override this method to produce a
+        cheap output for them, such as forwarding the last results.
+
+        Parameters
+        ----------
+        message : Message
+            The skipped message.
+
+        """
+        ...
+
+    @property
+    def cache(self) -> MemoCache | None:
+        return self._cache
+
+    def set_cache(
+        self,
+        size: int,
+        policy: str = 'lru',
+        ttl: float = 0,
+        path: str | None = None,
+        key: list | None = None,
+    ):
+        """
+        Enable the result cache of the node, used by ``memoise()``. A cache
+        persisted to a file is loaded when enabled, and saved when the node
+        is stopped.
+
+        Parameters
+        ----------
+        size : int
+            Maximum number of cached results.
+        policy : str
+            Eviction policy, either ``lru`` or ``lfu``.
+        ttl : float
+            Time to live of a cached result, in seconds. If 0, results never
+            expire.
+        path : str | None
+            Path of the database file the cache is persisted to.
+        key : list | None
+            The payload fields cache keys are built from. If None, the node
+            ``cache_key`` fields are used, or whole payloads if the node sets
+            none.
+
+        """
+        key = key if key is not None else self.cache_key
+        self._cache = MemoCache(size, policy, ttl, path, key)
+
+    def memoise(
+        self,
+        message: Message[T_Input],
+        compute: Callable[[], Any],
+        payloads: list | None = None,
+    ) -> Any:
+        """
+        Get a result from the node cache, computing and caching it when it is
+        not found. Hits, misses and evictions are recorded in telemetry as
+        ``cache_hit``, ``cache_miss`` and ``cache_evict`` events. If the node
+        cache is not enabled, the result is always computed.
+
+        Parameters
+        ----------
+        message : Message
+            The message the result is computed for.
+        compute : Callable[[], Any]
+            Compute the result. Results must be picklable if the cache is
+            persisted.
+        payloads : list | None
+            The payloads the cache key is built from. If None, the key is built
+            from the message payload.
+
+        Returns
+        -------
+        Any
+            The result.
+
+        """
+        if self._cache is None:
+            return compute()
+
+        key = self._cache.project(*(payloads or [message.payload]))
+        found, result = self._cache.get(key)
+
+        if found:
+            self._rec_telemetry(message, 'cache_hit')
+
+            return result
+
+        self._rec_telemetry(message, 'cache_miss')
+
+        result = compute()
+
+        for _ in range(self._cache.put(key, result)):
+            self._rec_telemetry(message, 'cache_evict')
+
+        return result
+
     def put(self, message: Message | ControlSignal):
         if self._draining.is_set():
             self.logger.debug('message received while draining, discarding...')
 
             return
+
+        if isinstance(message, Message) and not isinstance(
+            message.payload, ControlPayload
+        ):
+            size = message.size_bytes
+
+            self._byte_budget.acquire(size)
+            self._charge(message, size)
+
         self._queue.put(message)
 
+    def offer(self, message: Message) -> bool:
+        """
+        Put a message on the node without waiting. Unlike ``put()``, the
+        message is refused when the node queue or byte budget is full, so
+        that callers can push back on their own producers instead of
+        blocking.
+
+        Parameters
+        ----------
+        message : Message
+            The message to put on the node.
+
+        Returns
+        -------
+        bool
+            True if the message was queued, False if it was refused.
+
+        """
+        if self._draining.is_set():
+            return False
+
+        size = None
+
+        if not isinstance(message.payload, ControlPayload):
+            size = message.size_bytes
+
+            if not self._byte_budget.acquire(size, timeout=0):
+                return False
+
+            self._charge(message, size)
+
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            if size is not None:
+                self._release_bytes(message)
+
+            return False
+
+        return True
+
     def compile_template(self, template_name: str, arguments: dict) -> str:
         """
         Compile a template string
@@ -219,6 +435,40 @@ class Node[T_Input, T_Output]:
 
         return str(dump_path)
 
+    def dump_bytes(self, message: Message, file_name: str) -> str | None:
+        """
+        Dump a message to the node folder using the binary message codec.
+        Compared to ``dump_json()``, array contents are stored as raw buffers,
+        so dumps are smaller and faster to write and to load back with
+        ``Message.from_bytes()``.
+
+        Parameters
+        ----------
+        message : Message
+            The message to dump.
+        file_name : str
+            The name of the destination file in the node folder.
+
+        Returns
+        -------
+        str | None
+            The path of the dumped file, or None if the node is not part of a
+            pipeline.
+
+        """
+        if self.pipe_path is None:
+            return None
+
+        dump_path = pathlib.Path(self.pipe_path, file_name)
+
+        try:
+            with open(dump_path, 'wb') as f:
+                f.write(message.to_bytes())
+        except Exception:
+            self.logger.warning('message cannot be dumped')
+
+        return str(dump_path)
+
     def set_source(self, source: Callable, by: int = 0, mode: str = 'post'):
         """
         Set the node source (to be used for ``source`` nodes). The source can be
@@ -246,6 +496,44 @@ class Node[T_Input, T_Output]:
         self._source_sleep = by
         self._source_mode = mode
 
+    def add_reader(self, fileobj: Any, callback: Callable[[], None]):
+        """
+        Add a file object (a pipe or a socket) the node reads from. Instead of
+        blocking a source thread on the file object, the node is called back
+        by the shared reactor whenever data are available, while the node is
+        running. Callbacks run on the reactor thread, so they must read only
+        what is available, never block, and hand messages over with
+        ``offer``.
+
+        Parameters
+        ----------
+        fileobj : Any
+            A file object with a ``fileno`` method, set to non-blocking mode.
+        callback : Callable[[], None]
+            Function called with no arguments when the file object is
+            readable. When the file object reaches its end, the callback
+            should remove it with ``remove_reader``.
+
+        """
+        self._readers[fileobj] = callback
+
+        if self._status == ComponentStatus.RUNNING:
+            Reactor.shared().add_reader(fileobj, callback)
+
+    def remove_reader(self, fileobj: Any):
+        """
+        Stop reading a file object. Once this returns, no callback for the
+        file object is running, and the file object can be closed.
+
+        Parameters
+        ----------
+        fileobj : Any
+            The file object to stop reading.
+
+        """
+        if self._readers.pop(fileobj, None) is not None:
+            Reactor.shared().remove_reader(fileobj)
+
     def add_destination(self, name: str, destination: 'Node'):
         self._destinations[name] = destination
 
@@ -260,6 +548,11 @@ class Node[T_Input, T_Output]:
     def clear_buffer(self):
         self._buffer.flush()
 
+        with self._charged_lock:
+            charged, self._charged = self._charged, dict()
+
+        self._byte_budget.release(sum(map(sum, charged.values())))
+
     def transmit(self, message: Message[T_Output] | ControlSignal):
         """
         Transmit a message. This method is used to send data from the node to
@@ -283,8 +576,10 @@ class Node[T_Input, T_Output]:
         if isinstance(message, Message):
             self._rec_telemetry(message, 'tx')
 
-        if self._auto_dump:
+        if self._auto_dump == 'json':
             self.dump_json(message, f'auto_{message.id}.json')
+        elif self._auto_dump:
+            self.dump_bytes(message, f'auto_{message.id}.jtm')
 
     def start(self):
         """
@@ -305,6 +600,9 @@ class Node[T_Input, T_Output]:
             self._worker_thread.start()
             self._status = ComponentStatus.RUNNING
 
+            for fileobj, callback in self._readers.items():
+                Reactor.shared().add_reader(fileobj, callback)
+
         if self._update_thread is None:
             self._update_thread = threading.Thread(
                 name=f'_update_{self.name}',
@@ -338,6 +636,9 @@ class Node[T_Input, T_Output]:
         if self._status == ComponentStatus.STOPPED:
             return
 
+        for fileobj in list(self._readers):
+            Reactor.shared().remove_reader(fileobj)
+
         self._draining.set()
         self._stop_worker_event.set()
         self._stop_source_event.set()
@@ -350,6 +651,9 @@ class Node[T_Input, T_Output]:
         self._update_thread = None
         self._status = ComponentStatus.STOPPED
 
+        if self._cache is not None:
+            self._cache.save()
+
         self.logger.info('node stopped')
 
     def join(self):
@@ -393,6 +697,11 @@ class Node[T_Input, T_Output]:
             except queue.Empty:
                 continue
 
+            # messages held by the synchroniser, possibly for many updates,
+            # are not charged, or senders could wait for them forever; the
+            # buffer charges them again once they are emitted
+            self._release_bytes(message)
+
             if self._suspended and not isinstance(
                 message.payload, ControlPayload
             ):
@@ -411,6 +720,8 @@ class Node[T_Input, T_Output]:
             except queue.Empty:
                 continue
 
+            self._release_bytes(batch)
+
             if isinstance(batch, Message) and isinstance(
                 batch.payload, ControlPayload
             ):
@@ -423,7 +734,15 @@ class Node[T_Input, T_Output]:
             with self._pending_condition:
                 self._pending_updates += 1
             try:
-                self.update(batch)
+                if self._shedder is None:
+                    self.update(batch)
+                elif self._shedder.should_skip(batch.created_at, self.backlog):
+                    self._rec_telemetry(batch, 'skip')
+                    self.skip(batch)
+                else:
+                    start = time.perf_counter()
+                    self.update(batch)
+                    self._shedder.observe(time.perf_counter() - start)
             finally:
                 with self._pending_condition:
                     self._pending_updates -= 1
@@ -484,6 +803,37 @@ class Node[T_Input, T_Output]:
             case None:
                 return
 
+    def _charge(self, message: Message, size: int):
+        # the same message can be queued more than once
+        with self._charged_lock:
+            self._charged.setdefault(id(message), list()).append(size)
+
+    def _charge_emitted(self, message: Message):
+        if isinstance(message.payload, ControlPayload):
+            return
+
+        # bytes just released by the worker move to the emitted message, so
+        # the worker never waits on the budget senders are waiting on
+        size = message.size_bytes
+
+        self._byte_budget.acquire(size, force=True)
+        self._charge(message, size)
+
+    def _release_bytes(self, message: Message):
+        with self._charged_lock:
+            sizes = self._charged.get(id(message))
+
+            if not sizes:
+                return
+
+            size = sizes.pop(0)
+
+            if not sizes:
+                del self._charged[id(message)]
+
+        if size:
+            self._byte_budget.release(size)
+
     def _rec_telemetry(self, message: Message, event: str):
         if self._telemetry_manager is None:
             return
@@ -495,7 +845,7 @@ class Node[T_Input, T_Output]:
             message.creator,
             message.id,
             message._data_source_id,
-            getattr(message.payload, 'size_bytes', 0),
+            message.size_bytes,
         )
 
         self._telemetry_buffer.append(telemetry_entry)
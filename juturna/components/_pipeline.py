@@ -15,7 +15,11 @@ from juturna.names import PipelineStatus
 
 from juturna.payloads import ControlSignal, ControlPayload
 
+from juturna.meta import JUTURNA_MAX_QUEUE_BYTES
+from juturna.meta import JUTURNA_MAX_PIPELINE_BYTES
+
 from juturna.components._dag import DAG
+from juturna.components._byte_budget import ByteBudget
 from juturna.components._node_builder import _builder
 from juturna.components._telemetry_manager import TelemetryManager
 
@@ -51,6 +55,13 @@ class Pipeline:
         self._telemetry = False
         self._telemetry_file = None
 
+        self._byte_budget = ByteBudget(
+            self._name,
+            self._raw_config['pipeline'].get(
+                'max_queue_bytes', JUTURNA_MAX_PIPELINE_BYTES
+            ),
+        )
+
         self._status = PipelineStatus.NEW
 
         self.created_at = time.time()
@@ -165,6 +176,18 @@ class Pipeline:
             _node.status = ComponentStatus.NEW
             _node.telemetry = self._telemetry
             _node._auto_dump = node.get('auto_dump', False)
+            _node.set_byte_budget(
+                node.get('max_queue_bytes', JUTURNA_MAX_QUEUE_BYTES),
+                self._byte_budget,
+            )
+
+            if cache := node.get('cache'):
+                cache = dict(cache)
+
+                if 'path' in cache:
+                    cache['path'] = pathlib.Path(node_folder, cache['path'])
+
+                _node.set_cache(**cache)
 
             self._nodes[node_name] = _node
             self._dag.add_node(node_name)
@@ -7,6 +7,10 @@ from juturna.meta._constants import (
     JUTURNA_LOCAL_PLUGIN_DIR,
     JUTURNA_THREAD_JOIN_TIMEOUT,
     JUTURNA_MAX_QUEUE_SIZE,
+    JUTURNA_MAX_QUEUE_BYTES,
+    JUTURNA_MAX_PIPELINE_BYTES,
+    JUTURNA_INFERENCE_MAX_BATCH,
+    JUTURNA_INFERENCE_MAX_LATENCY,
     JUTURNA_ENV_VAR_PREFIX,
     JUTURNA_TELEMETRY_BATCH_SIZE,
 )
@@ -20,6 +24,10 @@ __all__ = [
     'JUTURNA_LOCAL_PLUGIN_DIR',
     'JUTURNA_THREAD_JOIN_TIMEOUT',
     'JUTURNA_MAX_QUEUE_SIZE',
+    'JUTURNA_MAX_QUEUE_BYTES',
+    'JUTURNA_MAX_PIPELINE_BYTES',
+    'JUTURNA_INFERENCE_MAX_BATCH',
+    'JUTURNA_INFERENCE_MAX_LATENCY',
     'JUTURNA_ENV_VAR_PREFIX',
     'JUTURNA_TELEMETRY_BATCH_SIZE',
 ]
@@ -12,6 +12,10 @@ _VAR_DEFAULTS = {
     'JUTURNA_LOCAL_PLUGIN_DIR': './plugins',
     'JUTURNA_THREAD_JOIN_TIMEOUT': 2.0,
     'JUTURNA_MAX_QUEUE_SIZE': 999,
+    'JUTURNA_MAX_QUEUE_BYTES': 0,
+    'JUTURNA_MAX_PIPELINE_BYTES': 0,
+    'JUTURNA_INFERENCE_MAX_BATCH': 8,
+    'JUTURNA_INFERENCE_MAX_LATENCY': 0.01,
     'JUTURNA_ENV_VAR_PREFIX': '$JT_ENV_',
     'JUTURNA_TELEMETRY_BATCH_SIZE': 10,
 }
@@ -28,5 +32,11 @@ JUTURNA_HUB_TOKEN = get_constant_var('JUTURNA_HUB_TOKEN')
 JUTURNA_LOCAL_PLUGIN_DIR = get_constant_var('JUTURNA_LOCAL_PLUGIN_DIR')
 JUTURNA_THREAD_JOIN_TIMEOUT = get_constant_var('JUTURNA_THREAD_JOIN_TIMEOUT')
 JUTURNA_MAX_QUEUE_SIZE = get_constant_var('JUTURNA_MAX_QUEUE_SIZE')
+JUTURNA_MAX_QUEUE_BYTES = get_constant_var('JUTURNA_MAX_QUEUE_BYTES')
+JUTURNA_MAX_PIPELINE_BYTES = get_constant_var('JUTURNA_MAX_PIPELINE_BYTES')
+JUTURNA_INFERENCE_MAX_BATCH = get_constant_var('JUTURNA_INFERENCE_MAX_BATCH')
+JUTURNA_INFERENCE_MAX_LATENCY = get_constant_var(
+    'JUTURNA_INFERENCE_MAX_LATENCY'
+)
 JUTURNA_ENV_VAR_PREFIX = get_constant_var('JUTURNA_ENV_VAR_PREFIX')
 JUTURNA_TELEMETRY_BATCH_SIZE = get_constant_var('JUTURNA_TELEMETRY_BATCH_SIZE')
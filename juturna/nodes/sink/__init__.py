@@ -3,9 +3,15 @@ from juturna.nodes.sink._notifier_http.notifier_http import NotifierHTTP
 from juturna.nodes.sink._notifier_websocket.notifier_websocket import (
     NotifierWebsocket,
 )
+from juturna.nodes.sink._videostream_av.videostream_av import VideostreamAv
 from juturna.nodes.sink._videostream_ffmpeg.videostream_ffmpeg import (
     VideostreamFFMPEG,
 )
 
 
-__all__ = ['NotifierHTTP', 'NotifierWebsocket', 'VideostreamFFMPEG']
+__all__ = [
+    'NotifierHTTP',
+    'NotifierWebsocket',
+    'VideostreamAv',
+    'VideostreamFFMPEG',
+]
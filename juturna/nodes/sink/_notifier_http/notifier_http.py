@@ -7,26 +7,50 @@ NotifierHTTP
 Transmit message to a HTTP endpoint.
 """
 
+import queue
 import threading
+import time
 
 import requests
 
+from requests.adapters import HTTPAdapter
+
 from juturna.components import Message
 from juturna.components import Node
 
+from juturna.meta import JUTURNA_THREAD_JOIN_TIMEOUT
+
 from juturna.payloads import ObjectPayload
 
 
 class NotifierHTTP(Node[ObjectPayload, None]):
     """Send data to a HTTP endpoint"""
 
+    # messages are serialised before being queued, so that content that
+    # cannot be serialised is refused on the node thread
     _CNT_CB = {
-        'application/json': lambda m: m.to_dict(),
+        'application/json': lambda m: m.to_json(),
         'text/plain': lambda m: m.to_json(),
+        'application/octet-stream': lambda m: m.to_bytes(),
     }
 
+    # responses worth retrying, as the endpoint may accept the same request
+    # later on
+    _RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
     def __init__(
-        self, endpoint: str, timeout: int, content_type: str, **kwargs
+        self,
+        endpoint: str,
+        timeout: int,
+        content_type: str,
+        workers: int = 4,
+        max_pending: int = 1000,
+        batch_size: int = 1,
+        batch_delay: float = 0.05,
+        retries: int = 2,
+        backoff: float = 0.5,
+        ordered: bool = False,
+        **kwargs,
     ):
         """
         Parameters
@@ -37,7 +61,27 @@ class NotifierHTTP(Node[ObjectPayload, None]):
             Transmission timeout.
         content_type : str
             Transmission data content type (this node supports, for now,
-            application/json and text/plain data).
+            application/json, text/plain and application/octet-stream data,
+            the latter using the binary message codec).
+        workers : int
+            Number of sender threads, each one with its own connection to the
+            endpoint.
+        max_pending : int
+            Maximum number of messages waiting to be sent. Once reached, the
+            node stops processing messages until some are sent.
+        batch_size : int
+            Maximum number of messages sent in a single request. When larger
+            than 1, requests always hold a JSON array of messages. Binary
+            messages are always sent one at a time.
+        batch_delay : float
+            Maximum time, in seconds, a message waits for its batch to fill.
+        retries : int
+            How many times a failed request is retried.
+        backoff : float
+            Delay before the first retry, in seconds, doubled at every retry.
+        ordered : bool
+            Deliver messages in the order they are received, using a single
+            sender thread.
         kwargs : dict
             Superclass arguments.
 
@@ -47,6 +91,22 @@ class NotifierHTTP(Node[ObjectPayload, None]):
         self._endpoint = endpoint
         self._timeout = timeout
         self._content_type = content_type
+        self._workers = 1 if ordered else max(workers, 1)
+        self._batch_size = (
+            1 if content_type == 'application/octet-stream' else batch_size
+        )
+        self._batch_delay = batch_delay
+        self._retries = retries
+        self._backoff = backoff
+
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._session = None
+        self._senders: list[threading.Thread] = list()
+
+        self._stats_lock = threading.Lock()
+
+        self.sent = 0
+        self.failed = 0
 
     @property
     def configuration(self) -> dict:
@@ -58,6 +118,13 @@ class NotifierHTTP(Node[ObjectPayload, None]):
 
     def warmup(self):
         """Warmup the node"""
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._workers)
+
+        self._session = requests.Session()
+        self._session.headers['Content-Type'] = self._content_type
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
         self.logger.info(f'[{self.name}] set to endpoint {self._endpoint}')
 
     def set_on_config(self, prop: str, value: str):
@@ -67,6 +134,47 @@ class NotifierHTTP(Node[ObjectPayload, None]):
 
             self._endpoint = value
 
+    def start(self):
+        """Start the sender threads, then the node"""
+        if not self._senders:
+            self._senders = [
+                threading.Thread(
+                    name=f'_sender_{self.name}_{idx}',
+                    target=self._send,
+                    daemon=True,
+                )
+                for idx in range(self._workers)
+            ]
+
+            for sender in self._senders:
+                sender.start()
+
+        super().start()
+
+    def stop(self):
+        """Stop the node, then the sender threads once pending data is sent"""
+        super().stop()
+
+        # senders stuck on an unreachable endpoint are not waited for
+        for _ in self._senders:
+            try:
+                self._pending.put(None, timeout=JUTURNA_THREAD_JOIN_TIMEOUT)
+            except queue.Full:
+                break
+
+        for sender in self._senders:
+            sender.join(timeout=JUTURNA_THREAD_JOIN_TIMEOUT)
+
+            if sender.is_alive():
+                self.logger.warning(f'{sender.name} still sending, detached')
+
+        self._senders = list()
+
+    def destroy(self):
+        """Close the endpoint connections"""
+        if self._session is not None:
+            self._session.close()
+
     def update(self, message: Message[ObjectPayload]):
         """Receive a message, transmit a message"""
         to_send = Message[ObjectPayload](
@@ -76,28 +184,89 @@ class NotifierHTTP(Node[ObjectPayload, None]):
             payload=message.payload,
         )
 
+        to_send.meta = dict(message.meta)
         to_send.meta['session_id'] = self.pipe_id
-        to_send = NotifierHTTP._CNT_CB[self._content_type](message)
 
-        t = threading.Thread(
-            name=f'{self.name}_thread',
-            target=self._send_chunk,
-            args=(to_send,),
-            daemon=True,
-        )
+        try:
+            content = NotifierHTTP._CNT_CB[self._content_type](to_send)
+        except (TypeError, ValueError) as e:
+            self.logger.error(f'message not serialisable, dropping: {e}')
+            self._account(failed=1)
 
-        t.start()
+            return
 
-    def _send_chunk(self, message_cnt):
-        try:
-            headers = {'Content-Type': self._content_type}
-            response = requests.post(
-                self._endpoint,
-                json=message_cnt,
-                headers=headers,
-                timeout=self._timeout,
-            )
-
-            self.logger.info(f'message sent: {response.status_code}')
-        except Exception as e:
-            self.logger.info(e)
+        self._pending.put(content)
+
+    def _send(self):
+        stopping = False
+
+        while not stopping:
+            content = self._pending.get()
+
+            if content is None:
+                break
+
+            batch = [content]
+            deadline = time.monotonic() + self._batch_delay
+
+            while len(batch) < self._batch_size:
+                try:
+                    content = self._pending.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+
+                if content is None:
+                    stopping = True
+                    break
+
+                batch.append(content)
+
+            self._post(batch)
+
+    def _post(self, batch: list):
+        body = self._body(batch)
+
+        for attempt in range(self._retries + 1):
+            if attempt > 0:
+                time.sleep(self._backoff * 2 ** (attempt - 1))
+
+            try:
+                response = self._session.post(
+                    self._endpoint, data=body, timeout=self._timeout
+                )
+            except requests.RequestException as e:
+                self.logger.warning(f'message not sent: {e}')
+
+                continue
+
+            if response.ok:
+                self.logger.debug(f'message sent: {response.status_code}')
+                self._account(sent=len(batch))
+
+                return
+
+            self.logger.warning(f'message not sent: {response.status_code}')
+
+            if response.status_code not in NotifierHTTP._RETRY_STATUS:
+                break
+
+        self.logger.error(f'dropping {len(batch)} messages')
+        self._account(failed=len(batch))
+
+    def _account(self, sent: int = 0, failed: int = 0):
+        with self._stats_lock:
+            self.sent += sent
+            self.failed += failed
+
+    def _body(self, batch: list) -> bytes:
+        if self._content_type == 'application/octet-stream':
+            return batch[0]
+
+        # with batching enabled, messages are always sent as an array, even
+        # when a batch holds a single message
+        if self._batch_size > 1:
+            return f'[{",".join(batch)}]'.encode()
+
+        return batch[0].encode()
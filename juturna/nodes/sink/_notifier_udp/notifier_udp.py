@@ -17,6 +17,8 @@ from juturna.components import Message
 
 from juturna.payloads import ObjectPayload
 
+from juturna.utils.net_utils import fragment
+
 
 class NotifierUDP(Node[ObjectPayload, None]):
     """Send data to a UDP endpoint, managing segmentation"""
@@ -30,6 +32,7 @@ class NotifierUDP(Node[ObjectPayload, None]):
         max_chunks: int,
         encoding: str,
         encode_b64: bool,
+        binary: bool = False,
         **kwargs,
     ):
         """
@@ -49,6 +52,11 @@ class NotifierUDP(Node[ObjectPayload, None]):
             Data encoding.
         encode_b64 : bool
             Whether to encode data to base64.
+        binary : bool
+            Transmit messages using the binary message codec, split into
+            fragments with a compact binary header (see
+            ``juturna.utils.net_utils.fragment``). When set, the encoding,
+            base64, sequence and chunk options are not used.
         kwargs : dict
             Superclass arguments.
 
@@ -61,8 +69,10 @@ class NotifierUDP(Node[ObjectPayload, None]):
         self._max_chunks = max_chunks
         self._encoding = encoding
         self._encode_b64 = encode_b64
+        self._binary = binary
 
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._scatter = hasattr(self._socket, 'sendmsg')
         self._meta_overhead = len(
             json.dumps(
                 {
@@ -76,6 +86,10 @@ class NotifierUDP(Node[ObjectPayload, None]):
 
         self._data_size = self._payload_size - self._meta_overhead
 
+        # fragment receivers drop sequences they have just seen, so binary
+        # messages are numbered by the node, whatever their versions
+        self._sequence = 0
+
     def set_on_config(self, prop: str, value: typing.Any):
         """Change node configuration"""
         if prop == 'endpoint':
@@ -85,10 +99,31 @@ class NotifierUDP(Node[ObjectPayload, None]):
 
     def update(self, message: Message[ObjectPayload]):
         """Receive a message, transmit a message"""
+        address = tuple(self._address)
+
+        if self._binary:
+            sequence = self._sequence
+            self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+
+            self._send_fragments(message, sequence, address)
+
+            return
+
         chunks = self._prepare_chunks(message, message.version)
 
         for chunk in chunks:
-            self._socket.sendto(chunk, tuple(self._address))
+            self._socket.sendto(chunk, address)
+
+    def _send_fragments(self, message: Message, sequence: int, address: tuple):
+        data = message.to_bytes()
+
+        # headers and data views are gathered by the kernel, so fragments are
+        # never copied into a datagram buffer
+        for header, chunk in fragment(data, sequence, self._payload_size):
+            if self._scatter:
+                self._socket.sendmsg([header, chunk], (), 0, address)
+            else:
+                self._socket.sendto(header + chunk, address)
 
     def _prepare_chunks(self, message: Message, version: int) -> list[bytes]:
         chunks = list()
@@ -98,7 +133,7 @@ class NotifierUDP(Node[ObjectPayload, None]):
             json_bytes = base64.b64encode(json_bytes).decode('ascii')
 
         total_chunks = (
-            len(json_bytes) + self._payload_size - 1
+            len(json_bytes) + self._data_size - 1
         ) // self._data_size
 
         for i in range(total_chunks):
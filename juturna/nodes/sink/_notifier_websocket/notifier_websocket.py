@@ -7,25 +7,55 @@ NotifierWebsocket
 Transmit message to a websocket socket.
 """
 
+import collections
+import contextlib
+import queue
 import threading
 
 from websockets.sync.client import connect
+from websockets.sync.client import ClientConnection
 
 from juturna.components import Message
 from juturna.components import Node
 
 from juturna.payloads import BasePayload
 
+from juturna.meta import JUTURNA_THREAD_JOIN_TIMEOUT
+
 
 class NotifierWebsocket(Node[BasePayload, None]):
     """Transmit data to a websocket endpoint"""
 
-    def __init__(self, endpoint: str, **kwargs):
+    def __init__(
+        self,
+        endpoint: str,
+        binary: bool = False,
+        max_pending: int = 1000,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 10,
+        replay: int = 0,
+        **kwargs,
+    ):
         """
         Parameters
         ----------
         endpoint : str
             Destination endpoint, including port.
+        binary : bool
+            Transmit messages as binary frames using the binary message codec,
+            instead of JSON strings.
+        max_pending : int
+            Maximum number of messages waiting to be sent. Once reached, the
+            node stops processing messages until some are sent.
+        reconnect_delay : float
+            Delay before the first reconnection attempt, in seconds, doubled
+            at every failed attempt.
+        max_reconnect_delay : float
+            Maximum delay between two reconnection attempts, in seconds.
+        replay : int
+            Number of the last sent messages to send again after a
+            reconnection, as messages sent right before a connection drops
+            can be lost.
         kwargs : dict
             Superclass arguments.
 
@@ -33,6 +63,13 @@ class NotifierWebsocket(Node[BasePayload, None]):
         super().__init__(**kwargs)
 
         self._endpoint = endpoint
+        self._binary = binary
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._stopping = threading.Event()
+        self._history = collections.deque(maxlen=replay)
 
         self._sent = 0
         self._t = None
@@ -41,6 +78,42 @@ class NotifierWebsocket(Node[BasePayload, None]):
         """Warmup the node"""
         self.logger.info(f'[{self.name}] set to endpoint {self._endpoint}')
 
+    def start(self):
+        """Start the sender thread, then the node"""
+        if self._t is None:
+            self._stopping.clear()
+            self._t = threading.Thread(
+                name=f'_sender_{self.name}',
+                target=self._send_messages,
+                daemon=True,
+            )
+
+            self._t.start()
+
+        super().start()
+
+    def stop(self):
+        """Stop the node, then the sender thread once pending data is sent"""
+        # a connected sender still sends every queued message, a disconnected
+        # one stops trying to reconnect and drops them
+        self._stopping.set()
+
+        super().stop()
+
+        if self._t is None:
+            return
+
+        # a sender stuck on an unresponsive endpoint is not waited for
+        with contextlib.suppress(queue.Full):
+            self._pending.put(None, timeout=JUTURNA_THREAD_JOIN_TIMEOUT)
+
+        self._t.join(timeout=JUTURNA_THREAD_JOIN_TIMEOUT)
+
+        if self._t.is_alive():
+            self.logger.warning(f'{self._t.name} still sending, detached')
+
+        self._t = None
+
     def update(self, message: Message[BasePayload]):
         """Receive a message, transmit a message"""
         meta = dict(message.meta)
@@ -53,27 +126,74 @@ class NotifierWebsocket(Node[BasePayload, None]):
         meta['session_id'] = self.pipe_id
         to_send.meta = meta
 
-        self._t = threading.Thread(
-            name='_post_transcript',
-            target=self._send_message,
-            args=(to_send,),
-            daemon=True,
-        )
+        try:
+            content = to_send.to_bytes() if self._binary else to_send.to_json()
+        except (TypeError, ValueError) as e:
+            self.logger.error(f'message not serialisable, dropping: {e}')
+
+            return
 
-        self._t.start()
+        self._pending.put(content)
 
-        self._sent += 1
+    def _send_messages(self):
+        content = self._pending.get()
 
-    def _send_message(self, message: Message[BasePayload]):
-        with connect(self._endpoint) as ws:
+        while content is not None:
+            ws = self._connect()
+
+            if ws is None:
+                break
+
+            with ws:
+                content = self._stream(ws, content)
+
+        dropped = 0
+
+        # keep consuming messages, so that the node is never blocked on a full
+        # queue while stopping
+        while content is not None:
+            dropped += 1
+            content = self._pending.get()
+
+        if dropped:
+            self.logger.warning(f'endpoint unreachable, {dropped} not sent')
+
+    def _stream(self, ws: ClientConnection, content: str | bytes):
+        try:
+            for sent in self._history:
+                ws.send(sent)
+
+            while content is not None:
+                ws.send(content)
+
+                self._sent += 1
+                self._history.append(content)
+                content = self._pending.get()
+        except Exception as e:
+            # the message is sent again, ahead of the queued ones, as soon as
+            # the connection is back
+            self.logger.warning(f'connection lost: {e}')
+
+        return content
+
+    def _connect(self) -> ClientConnection | None:
+        delay = self._reconnect_delay
+
+        while True:
             try:
-                message_json = message.to_json()
-                ws.send(message_json)
+                ws = connect(self._endpoint)
+                self.logger.info(f'connected to {self._endpoint}')
+
+                return ws
             except Exception as e:
-                self.logger.warning(e)
+                self.logger.warning(f'cannot connect: {e}')
+
+            if self._stopping.wait(delay):
+                return None
+
+            delay = min(2 * delay, self._max_reconnect_delay)
 
     def destroy(self):
         """Destroy the node"""
         if self._t:
-            self._t.join()
-        ...
+            self.stop()
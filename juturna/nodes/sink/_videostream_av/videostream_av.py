@@ -0,0 +1,287 @@
+"""
+VideostreamAv
+
+@author: Antonio Bevilacqua
+@email: abevilacqua@meetecho.com
+
+Encode frames and transmit them to a RTP endpoint using PyAv.
+"""
+
+import contextlib
+import queue
+import threading
+import time
+
+from fractions import Fraction
+
+import av
+import numpy as np
+
+from juturna.components import Message
+from juturna.components import Node
+from juturna.names import PixelFormat
+from juturna.payloads import ImagePayload
+
+from juturna.meta import JUTURNA_THREAD_JOIN_TIMEOUT
+
+
+# encoder name, RTP encoding name, encoder options for low latency streaming
+_CODECS = {
+    'h264': (
+        'libx264',
+        'H264',
+        {'preset': 'ultrafast', 'tune': 'zerolatency', 'profile': 'baseline'},
+    ),
+    'vp8': (
+        'libvpx',
+        'VP8',
+        {'deadline': 'realtime', 'cpu-used': '4', 'lag-in-frames': '0'},
+    ),
+}
+
+
+class VideostreamAv(Node[ImagePayload, None]):
+    """Sink node for video streaming"""
+
+    _SDP_TEMPLATE_NAME: str = 'session_out.sdp.template'
+
+    def __init__(
+        self,
+        dst_host: str,
+        dst_port: int,
+        codec: str,
+        payload_type: int,
+        out_width: int,
+        out_height: int,
+        rate: int,
+        gop: int,
+        bit_rate: int,
+        queue_size: int,
+        packet_size: int = 1200,
+        **kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        dst_host : str
+            Hostname of the RTP endpoint to direct the stream to.
+        dst_port : int
+            Port of the RTP endpoint to direct the stream to.
+        codec : str
+            Codec of the outgoing video stream, either ``h264`` or ``vp8``.
+        payload_type : int
+            Payload type of the outgoing RTP stream.
+        out_width : int
+            Width of the outgoing video stream. If 0, the width of the
+            incoming frames is used.
+        out_height : int
+            Height of the outgoing video stream. If 0, the height of the
+            incoming frames is used.
+        rate : int
+            Maximum frame rate of the outgoing video stream. Frames received
+            faster than this are skipped.
+        gop : int
+            Interval, in frames, at which keyframes are sent in the outgoing
+            stream.
+        bit_rate : int
+            Target bit rate of the outgoing video stream, in bits per second.
+        queue_size : int
+            Number of frames waiting to be encoded. When the encoder falls
+            behind, the oldest waiting frame is dropped.
+        packet_size : int
+            Maximum size of the RTP packets, in bytes.
+        kwargs : dict
+            Superclass arguments.
+
+        """
+        super().__init__(**kwargs)
+
+        if codec not in _CODECS:
+            raise ValueError(f'unsupported codec: {codec}')
+
+        self._dst_host = dst_host
+        self._dst_port = dst_port
+        self._codec = codec
+        self._payload_type = payload_type
+        self._out_width = out_width
+        self._out_height = out_height
+        self._rate = rate
+        self._gop = gop
+        self._bit_rate = bit_rate
+        self._packet_size = packet_size
+
+        # frame, pixel format, presentation timestamp; None stops the encoder
+        self._frames: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._encoder: threading.Thread | None = None
+        self._container = None
+        self._stream = None
+        self._session_sdp_file = None
+
+        self._origin: float | None = None
+        self._last_pts = -1
+        self._encoded = 0
+        self._skipped = 0
+        self._dropped = 0
+
+    def warmup(self):
+        """Warmup the node"""
+        if self.pipe_path is not None:
+            self._session_sdp_file = self.prepare_template(
+                VideostreamAv._SDP_TEMPLATE_NAME,
+                '_session_out.sdp',
+                {
+                    '_dst_host': self._dst_host,
+                    '_dst_port': self._dst_port,
+                    '_payload_type': self._payload_type,
+                    '_encoding': _CODECS[self._codec][1],
+                },
+            )
+
+    def start(self):
+        """Start the node"""
+        if self._encoder is None:
+            self._encoder = threading.Thread(
+                name=f'_encoder_{self.name}', target=self._encode, daemon=True
+            )
+
+            self._encoder.start()
+
+        super().start()
+
+    def stop(self):
+        """Stop the node"""
+        super().stop()
+
+        if self._encoder is None:
+            return
+
+        # an encoder stuck on a frame is not waited for
+        with contextlib.suppress(queue.Full):
+            self._frames.put(None, timeout=JUTURNA_THREAD_JOIN_TIMEOUT)
+
+        self._encoder.join(timeout=JUTURNA_THREAD_JOIN_TIMEOUT)
+
+        if self._encoder.is_alive():
+            self.logger.warning(
+                f'{self._encoder.name} still encoding, detached'
+            )
+
+        self._encoder = None
+
+    def destroy(self):
+        """Destroy the node"""
+        self.stop()
+
+    def update(self, message: Message[ImagePayload]):
+        """Receive a message, queue its frame for encoding"""
+        image = message.payload.image
+
+        if image.size == 0:
+            return
+
+        # timestamps follow the arrival of frames, at the output rate
+        now = time.monotonic()
+        self._origin = self._origin if self._origin is not None else now
+        pts = round((now - self._origin) * self._rate)
+
+        if pts <= self._last_pts:
+            self._skipped += 1
+
+            return
+
+        self._last_pts = pts
+        frame = (image, message.payload.pixel_format or PixelFormat.RGB24, pts)
+
+        try:
+            self._frames.put_nowait(frame)
+        except queue.Full:
+            # the encoder is the only consumer, so a slot is freed
+            with contextlib.suppress(queue.Empty):
+                self._frames.get_nowait()
+
+            self._frames.put_nowait(frame)
+            self._dropped += 1
+
+            if self._dropped % 100 == 1:
+                self.logger.warning(
+                    f'encoder saturated, {self._dropped} dropped'
+                )
+
+    def _encode(self):
+        while (frame := self._frames.get()) is not None:
+            try:
+                self._write(*frame)
+            except Exception as e:
+                self.logger.error(f'encoding failed: {e}')
+
+        if self._container is None:
+            return
+
+        try:
+            for packet in self._stream.encode(None):
+                self._container.mux(packet)
+        except Exception as e:
+            self.logger.error(f'flushing failed: {e}')
+        finally:
+            self._close()
+
+    def _write(self, image: np.ndarray, pixel_format: str, pts: int):
+        if self._container is None:
+            self._open(image.shape[1], image.shape[0])
+
+        frame = av.VideoFrame.from_ndarray(image, format=pixel_format)
+        frame.pts = pts
+        frame.time_base = self._stream.codec_context.time_base
+
+        for packet in self._stream.encode(frame):
+            self._container.mux(packet)
+
+        self._encoded += 1
+
+    def _open(self, width: int, height: int):
+        encoder, _, options = _CODECS[self._codec]
+
+        # container and stream are only kept when both are ready, so a failed
+        # open is retried with the next frame
+        container = av.open(
+            f'rtp://{self._dst_host}:{self._dst_port}'
+            f'?pkt_size={self._packet_size}',
+            mode='w',
+            format='rtp',
+            container_options={'payload_type': str(self._payload_type)},
+        )
+
+        try:
+            stream = container.add_stream(
+                encoder, rate=self._rate, options=options
+            )
+
+            # 4:2:0 subsampling requires even sizes
+            stream.width = (self._out_width or width) // 2 * 2
+            stream.height = (self._out_height or height) // 2 * 2
+            stream.pix_fmt = 'yuv420p'
+            stream.bit_rate = self._bit_rate
+            stream.codec_context.gop_size = self._gop
+            stream.codec_context.time_base = Fraction(1, self._rate)
+        except Exception:
+            container.close()
+
+            raise
+
+        self._container = container
+        self._stream = stream
+
+        self.logger.info(
+            f'streaming {self._codec} '
+            f'{self._stream.width}x{self._stream.height} '
+            f'to {self._dst_host}:{self._dst_port}'
+        )
+
+    def _close(self):
+        try:
+            self._container.close()
+        except Exception as e:
+            self.logger.error(f'closing failed: {e}')
+        finally:
+            self._container = None
+            self._stream = None
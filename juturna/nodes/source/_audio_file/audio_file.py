@@ -7,8 +7,11 @@ AudioFile
 Read an audio file and chunk it into smaller audio messages.
 """
 
-import io
+import contextlib
+import hashlib
 import itertools
+import os
+import pathlib
 
 import av
 
@@ -23,6 +26,11 @@ from juturna.payloads import ControlPayload
 from juturna.payloads import ControlSignal
 
 
+# decoded audio is resampled to mono 32-bit float samples, which is also the
+# layout of the files in the cache
+_SAMPLE_FORMAT = 'flt'
+
+
 class AudioFile(Node[AudioPayload, AudioPayload]):
     """
     Read in an audio file, chunk it based on the configured length, then make
@@ -30,7 +38,13 @@ class AudioFile(Node[AudioPayload, AudioPayload]):
     """
 
     def __init__(
-        self, file_source: str, block_size: int, audio_rate: int, **kwargs
+        self,
+        file_source: str,
+        block_size: int,
+        audio_rate: int,
+        streaming: bool = False,
+        cache_dir: str = '',
+        **kwargs,
     ):
         """
         Parameter
@@ -41,6 +55,13 @@ class AudioFile(Node[AudioPayload, AudioPayload]):
             Time length of each produced audio chunk.
         audio_rate : int
             Sampling rate of the audio file.
+        streaming : bool
+            If true, the file is decoded chunk by chunk while the node
+            produces them, instead of entirely before the node starts.
+        cache_dir : str
+            Folder where decoded audio is stored, and memory mapped when the
+            same file is read again at the same rate. If empty, decoded audio
+            is not cached.
         kwargs : dict
             Superclass arguments.
 
@@ -50,42 +71,58 @@ class AudioFile(Node[AudioPayload, AudioPayload]):
         self._file_source = file_source
         self._block_size = block_size
         self._rate = audio_rate
+        self._streaming = streaming
+        self._cache_dir = cache_dir
 
         self._audio = None
         self._audio_chunks = None
         self._transmitted = 0
 
     def warmup(self):  # noqa: D102
-        resampler = av.audio.resampler.AudioResampler(
-            format='s16', layout='mono', rate=self._rate
-        )
+        cache_path = self._cache_path() if self._cache_dir else None
+
+        if cache_path is not None and cache_path.exists():
+            self._audio = AudioFile._load_cache(cache_path)
+            self.logger.info(f'audio mapped from cache {cache_path}')
+        else:
+            blocks = self._decode_blocks()
+
+            if cache_path is not None:
+                blocks = self._write_cache(blocks, cache_path)
+
+            if not self._streaming and cache_path is not None:
+                # the cache is filled on disk, then mapped back in
+                for _ in blocks:
+                    pass
+
+                self._audio = AudioFile._load_cache(cache_path)
+            elif not self._streaming:
+                self._audio = np.concatenate(
+                    list(blocks) or [np.zeros(0, np.float32)]
+                )
 
-        raw_buffer = io.BytesIO()
-        dtype = None
+        if self._audio is not None:
+            self._audio_chunks = self._iter_audio_chunks()
 
-        with av.open(
-            self._file_source, mode='r', metadata_errors='ignore'
-        ) as container:
-            frames = container.decode(audio=0)
-            frames = AudioFile._ignore_invalid_frames(frames)
-            frames = AudioFile._group_frames(frames, 500000)
-            frames = AudioFile._resample_frames(frames, resampler)
+            self.logger.info('audio loaded')
+            self.logger.info(f'duration: {len(self._audio) / self._rate}')
+        else:
+            self._audio_chunks = self._rechunk(blocks)
 
-            for frame in frames:
-                array = frame.to_ndarray()
-                dtype = array.dtype
-                raw_buffer.write(array)
+            self.logger.info('audio streaming')
 
-        audio = np.frombuffer(raw_buffer.getbuffer(), dtype=dtype)
-        audio = audio.astype(np.float32) / 32768.0
+        self.set_source(self._generate_chunks, by=self._block_size, mode='pre')
 
-        self._audio = audio
-        self._audio_chunks = self._iter_audio_chunks()
+    def stop(self):  # noqa: D102
+        super().stop()
 
-        self.set_source(self._generate_chunks, by=self._block_size, mode='pre')
+        # releases the file, and discards an incomplete cache file
+        if self._audio_chunks is not None and self._audio is None:
+            with contextlib.suppress(ValueError):
+                self._audio_chunks.close()
 
-        self.logger.info('audio loaded')
-        self.logger.info(f'duration: {len(audio) / self._rate}')
+    def destroy(self):  # noqa: D102
+        self.stop()
 
     def _generate_chunks(self) -> Message[AudioPayload | ControlPayload]:
         audio_chunk = next(self._audio_chunks, None)
@@ -126,6 +163,88 @@ class AudioFile(Node[AudioPayload, AudioPayload]):
             yield chunk, sample_offset
             sample_offset += wave_len
 
+    def _rechunk(self, blocks):
+        wave_len = self._block_size * self._rate
+        sample_offset = 0
+        chunk = np.zeros(wave_len, np.float32)
+        filled = 0
+
+        for block in blocks:
+            while len(block) > 0:
+                taken = min(wave_len - filled, len(block))
+                chunk[filled : filled + taken] = block[:taken]
+                block = block[taken:]
+                filled += taken
+
+                if filled == wave_len:
+                    yield chunk, sample_offset
+
+                    sample_offset += wave_len
+                    chunk = np.zeros(wave_len, np.float32)
+                    filled = 0
+
+        # the last chunk is left padded with zeros
+        if filled > 0:
+            yield chunk, sample_offset
+
+    def _decode_blocks(self):
+        resampler = av.audio.resampler.AudioResampler(
+            format=_SAMPLE_FORMAT, layout='mono', rate=self._rate
+        )
+
+        with av.open(self._file_source, mode='r') as container:
+            frames = container.decode(audio=0)
+            frames = AudioFile._ignore_invalid_frames(frames)
+
+            # grouping frames saves resampler calls, but delays the first
+            # block, so streaming decodes frame by frame
+            if not self._streaming:
+                frames = AudioFile._group_frames(frames, 500000)
+
+            frames = AudioFile._resample_frames(frames, resampler)
+
+            for frame in frames:
+                yield frame.to_ndarray().reshape(-1)
+
+    def _cache_path(self) -> pathlib.Path:
+        # sha256 is hardware accelerated on most machines, and hashing is
+        # all a cache hit costs
+        with open(self._file_source, 'rb') as source:
+            digest = hashlib.file_digest(source, 'sha256').hexdigest()
+
+        return pathlib.Path(
+            self._cache_dir, f'{digest[:32]}_{self._rate}_{_SAMPLE_FORMAT}.pcm'
+        )
+
+    def _write_cache(self, blocks, cache_path: pathlib.Path):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = cache_path.with_suffix(f'.{os.getpid()}.partial')
+        complete = False
+
+        try:
+            with open(partial, 'wb') as cache:
+                for block in blocks:
+                    cache.write(block.astype('<f4', copy=False).tobytes())
+
+                    yield block
+
+            # readers only ever see complete files
+            os.replace(partial, cache_path)
+            complete = True
+
+            self.logger.info(f'audio cached in {cache_path}')
+        finally:
+            if not complete:
+                partial.unlink(missing_ok=True)
+
+    @staticmethod
+    def _load_cache(cache_path: pathlib.Path) -> np.ndarray:
+        # empty files cannot be mapped; copy on write keeps chunks writable
+        if cache_path.stat().st_size == 0:
+            return np.zeros(0, np.float32)
+
+        return np.memmap(cache_path, dtype='<f4', mode='c')
+
     def update(self, message: Message[AudioPayload | ControlPayload]):  # noqa: D102
         message.meta['session_id'] = self.pipe_id
 
@@ -7,6 +7,8 @@ AudioRTP
 Read an incoming RTO audio stream.
 """
 
+import functools
+import os
 import pathlib
 import subprocess
 import threading
@@ -80,6 +82,8 @@ class AudioRTP(Node[BytesPayload, AudioPayload]):
             * self._audio_rate
         )
         self._abs_recv = 0
+        self._pending = bytearray()
+        self._dropped = 0
 
         # infer incoming channel by encoding_clock_chan
         self._in_channels = AudioRTP._parse_audio_channels(encoding_clock_chan)
@@ -120,6 +124,9 @@ class AudioRTP(Node[BytesPayload, AudioPayload]):
         self.logger.debug('stopping node...')
         self._stop_requested = True
 
+        if self._ffmpeg_proc is not None:
+            self.remove_reader(self._ffmpeg_proc.stdout)
+
         # safe stop procedure if no process exists
         if self._ffmpeg_proc is None:
             self.logger.debug('ffmpeg process is already None, nothing to stop')
@@ -244,16 +251,42 @@ class AudioRTP(Node[BytesPayload, AudioPayload]):
         """Clear any source functions defined on the node"""
         self.logger.debug('clearing source...')
 
+        if self._ffmpeg_proc is not None:
+            self.remove_reader(self._ffmpeg_proc.stdout)
+
         self.clear_buffer()
-        self.set_source(
-            lambda: Message[BytesPayload](
-                creator=self.name,
-                payload=BytesPayload(cnt=b''),
-            ),
-            1,
-            'pre',
+        self._pending.clear()
+
+    def _read_audio(self, proc: subprocess.Popen):
+        # called by the reactor thread, which must never block
+        try:
+            data = os.read(
+                proc.stdout.fileno(), self._rec_bytes - len(self._pending)
+            )
+        except BlockingIOError:
+            return
+
+        if not data:
+            self.remove_reader(proc.stdout)
+
+            return
+
+        self._pending += data
+
+        if len(self._pending) < self._rec_bytes:
+            return
+
+        message = Message[BytesPayload](
+            creator=self.name,
+            payload=BytesPayload(cnt=bytes(self._pending)),
         )
 
+        self._pending.clear()
+
+        if not self.offer(message):
+            self._dropped += 1
+            self.logger.warning(f'node saturated, {self._dropped} dropped')
+
     @staticmethod
     def _get_waveform(raw_data: bytes, channels: int) -> np.ndarray:
         waveform = (
@@ -358,7 +391,7 @@ class AudioRTP(Node[BytesPayload, AudioPayload]):
             ['sh', self.ffmpeg_launcher],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            bufsize=64536,
+            bufsize=0,
         )
 
         self._subprocess_running = True
@@ -371,14 +404,12 @@ class AudioRTP(Node[BytesPayload, AudioPayload]):
         )
         self._monitor_thread.start()
 
-        self.logger.debug(
-            f'setting source with process {self._ffmpeg_proc.pid}'
-        )
-        self.set_source(
-            lambda: Message[BytesPayload](
-                creator=self.name,
-                payload=BytesPayload(
-                    cnt=self._ffmpeg_proc.stdout.read(self._rec_bytes)
-                ),
-            )
+        self.logger.debug(f'reading process {self._ffmpeg_proc.pid} output')
+
+        os.set_blocking(self._ffmpeg_proc.stdout.fileno(), False)
+
+        self._pending.clear()
+        self.add_reader(
+            self._ffmpeg_proc.stdout,
+            functools.partial(self._read_audio, self._ffmpeg_proc),
         )
@@ -20,6 +20,7 @@ from juturna.components import Message
 from juturna.payloads import AudioPayload
 from juturna.components import _resource_broker as rb
 from juturna.meta import JUTURNA_THREAD_JOIN_TIMEOUT
+from juturna.utils.audio_utils import AudioRingBuffer
 
 FORMAT_DTYPES = {
     'dbl': np.float64,
@@ -115,7 +116,9 @@ class AudioRtpAv(Node[AudioPayload, AudioPayload]):
         self._elapsed = 0.0
 
         self._dtype = FORMAT_DTYPES[self._resampler_format]
-        self._pending = np.empty((0,), dtype=self._dtype)
+        self._pending = AudioRingBuffer(
+            2 * self._samples_per_block, dtype=self._dtype, grow=True
+        )
 
     def configure(self):
         """Configure the node"""
@@ -187,15 +190,15 @@ class AudioRtpAv(Node[AudioPayload, AudioPayload]):
 
     def _flush_pending(self, force: bool = False):
         while len(self._pending) >= self._samples_per_block:
-            chunk = self._pending[: self._samples_per_block]
-            self._pending = self._pending[self._samples_per_block :]
-            self._emit_chunk(chunk)
+            self._emit_chunk(self._pending.pop(self._samples_per_block))
 
         if force and len(self._pending) > 0:
+            partial = self._pending.pop(len(self._pending))
+
             self._emit_chunk(
                 np.pad(
-                    self._pending,
-                    (0, self._samples_per_block - len(self._pending)),
+                    partial,
+                    (0, self._samples_per_block - len(partial)),
                     mode='constant',
                 )
             )
@@ -204,7 +207,7 @@ class AudioRtpAv(Node[AudioPayload, AudioPayload]):
         while not self._stop_event.is_set():
             try:
                 for samples in self._stream_audio_blocks():
-                    self._pending = np.concatenate([self._pending, samples])
+                    self._pending.append(samples)
                     self._flush_pending(force=False)
 
                     if self._stop_event.is_set():
@@ -219,7 +222,7 @@ class AudioRtpAv(Node[AudioPayload, AudioPayload]):
                     self._stop_event.wait(2.0)
             finally:
                 self._flush_pending(force=self._flush_partial_on_error)
-                self._pending = np.empty((0,), dtype=self._dtype)
+                self._pending.clear()
                 self._elapsed = 0.0
 
     def _emit_chunk(self, audio: np.ndarray):
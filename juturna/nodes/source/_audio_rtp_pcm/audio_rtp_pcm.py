@@ -0,0 +1,189 @@
+"""
+AudioRtpPcm
+
+@author: Antonio Bevilacqua
+@email: abevilacqua@meetecho.com
+
+Receive uncompressed (L16) and G.711 (PCMU, PCMA) RTP audio streams without
+external processes.
+"""
+
+import numpy as np
+
+from juturna.components import Node
+from juturna.components import Message
+from juturna.components import _resource_broker as rb
+
+from juturna.payloads import AudioPayload
+from juturna.utils.audio_utils import AudioRingBuffer
+from juturna.utils.net_utils import RTPReceiver
+from juturna.utils.net_utils import RTPSession
+
+
+class AudioRtpPcm(Node[AudioPayload, AudioPayload]):
+    """Node implementation class"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        encoding: str,
+        clock_rate: int,
+        channels: int,
+        payload_type: int,
+        out_channels: int,
+        block_size: float,
+        min_delay: float = 0.01,
+        max_delay: float = 0.2,
+        **kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        host : str
+            Listening host address.
+        port : int
+            Listening port. If set to 0, the port will be assigned
+            automatically by the resource broker.
+        encoding : str
+            Audio encoding of the stream, one of ``L16``, ``PCMU`` and
+            ``PCMA``.
+        clock_rate : int
+            RTP clock rate of the stream, which is also the sampling rate of
+            the produced audio.
+        channels : int
+            Audio channels of the stream.
+        payload_type : int
+            RTP payload type of the stream. If negative, any payload type is
+            accepted.
+        out_channels : int
+            Audio channels of output chunks, either 1 or the stream channels.
+            Stereo streams are downmixed when set to 1.
+        block_size : float
+            Size of the audio blocks to produce, in seconds.
+        min_delay : float
+            Minimum time, in seconds, the jitter buffer waits for a missing
+            packet.
+        max_delay : float
+            Maximum time, in seconds, the jitter buffer waits for a missing
+            packet.
+        kwargs : dict
+            Supernode arguments.
+
+        """
+        super().__init__(**kwargs)
+
+        # streams can only be downmixed to mono, or kept as they are
+        if out_channels not in (1, channels):
+            raise ValueError(
+                f'cannot produce {out_channels} channels '
+                f'from a {channels} channel stream'
+            )
+
+        self._host = host
+        self._port = port
+        self._encoding = encoding
+        self._clock_rate = clock_rate
+        self._channels = channels
+        self._payload_type = payload_type if payload_type >= 0 else None
+        self._out_channels = out_channels
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._samples_per_block = int(clock_rate * block_size) * out_channels
+
+        self._session: RTPSession | None = None
+        self._pending = AudioRingBuffer(
+            2 * self._samples_per_block, dtype=np.float32, grow=True
+        )
+
+        self._abs_recv = 0
+        self._elapsed = 0.0
+        self._dropped = 0
+
+    @property
+    def configuration(self) -> dict:
+        """Fetch node configuration"""
+        base_config = super().configuration
+        base_config['port'] = self._port
+
+        return base_config
+
+    def configure(self):
+        """Configure the node"""
+        if self._port == 0:
+            self._port = rb.get('port')
+
+    def warmup(self):
+        """Warmup the node"""
+        self._session = RTPSession(
+            self._port,
+            self._receive,
+            host=self._host,
+            encoding=self._encoding,
+            clock_rate=self._clock_rate,
+            channels=self._channels,
+            payload_type=self._payload_type,
+            min_delay=self._min_delay,
+            max_delay=self._max_delay,
+        )
+
+        self.logger.info(f'receiving {self._encoding} on {self._port}')
+
+    def start(self):
+        """Start the node"""
+        super().start()
+
+        RTPReceiver.shared().add(self._session)
+
+    def stop(self):
+        """Stop the node"""
+        if self._session is not None:
+            RTPReceiver.shared().remove(self._session)
+
+        super().stop()
+
+    def destroy(self):
+        """Destroy the node"""
+        self.stop()
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def update(self, message: Message[AudioPayload]):
+        """Receive data from upstream, transmit data downstream"""
+        self.transmit(message)
+
+    def _receive(self, samples: np.ndarray):
+        # called by the receiver thread, which must never block
+        audio = samples.astype(np.float32) / 32768.0
+
+        if self._channels > 1 and self._out_channels == 1:
+            audio = audio.reshape(-1, self._channels).mean(axis=1)
+
+        self._pending.append(audio)
+
+        while len(self._pending) >= self._samples_per_block:
+            self._emit_chunk(self._pending.pop(self._samples_per_block))
+
+    def _emit_chunk(self, audio: np.ndarray):
+        duration = len(audio) / self._out_channels / self._clock_rate
+        message = Message[AudioPayload](
+            creator=self.name,
+            version=self._abs_recv,
+            payload=AudioPayload(
+                audio=audio,
+                sampling_rate=self._clock_rate,
+                channels=self._out_channels,
+                audio_format='flt',
+                start=self._elapsed,
+                end=self._elapsed + duration,
+            ),
+        )
+
+        self._abs_recv += 1
+        self._elapsed += duration
+
+        if not self.offer(message):
+            self._dropped += 1
+            self.logger.warning(f'node saturated, {self._dropped} dropped')
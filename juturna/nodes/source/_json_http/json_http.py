@@ -20,7 +20,7 @@ import contextlib
 
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler
-from http.server import HTTPServer
+from http.server import ThreadingHTTPServer
 
 from juturna.components import _resource_broker as rb
 from juturna.components import Node
@@ -28,6 +28,18 @@ from juturna.components import Message
 from juturna.payloads import ObjectPayload
 
 
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+# statuses of requests refused because the node is saturated, which clients
+# can retry later on
+_RETRY_STATUS = frozenset(
+    {HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE}
+)
+
+
 class JsonHttp(Node[ObjectPayload, ObjectPayload]):
     """HTTP JSON source node."""
 
@@ -36,6 +48,10 @@ class JsonHttp(Node[ObjectPayload, ObjectPayload]):
         host: str,
         port: int | str,
         endpoint: str,
+        max_requests: int = 64,
+        max_backlog: int = 0,
+        retry_after: int = 1,
+        listen_backlog: int = 128,
         **kwargs,
     ) -> None:
         """
@@ -48,6 +64,18 @@ class JsonHttp(Node[ObjectPayload, ObjectPayload]):
             automatically by the resource broker.
         endpoint : str
             Listening endpoint.
+        max_requests : int
+            Maximum number of requests handled at the same time. Requests
+            beyond this limit are refused with 429.
+        max_backlog : int
+            Maximum number of received messages waiting to be processed by
+            the node. Requests that would exceed it are refused with 503. If
+            0, only the node queue limits apply.
+        retry_after : int
+            Seconds clients are asked to wait before retrying a refused
+            request.
+        listen_backlog : int
+            Maximum number of connections waiting to be accepted.
         kwargs : dict
             Superclass arguments.
 
@@ -56,11 +84,23 @@ class JsonHttp(Node[ObjectPayload, ObjectPayload]):
 
         self._host: str = host
         self._port: int | str = port
-        self._endpoint: str = endpoint.lstrip('/')
-        self._httpd: HTTPServer | None = None
+        self._endpoint: str = endpoint.strip('/')
+        self._max_backlog: int = max_backlog
+        self._retry_after: int = retry_after
+        self._listen_backlog: int = listen_backlog
+        self._httpd: ThreadingHTTPServer | None = None
         self._thread: threading.Thread | None = None
         self._sent: int = 0
 
+        self._slots = threading.BoundedSemaphore(max_requests)
+        self._admission = threading.Lock()
+
+        # messages queued and refused because the node was saturated, and
+        # requests refused because too many were being handled
+        self.accepted: int = 0
+        self.refused: int = 0
+        self.throttled: int = 0
+
     def configure(self) -> None:
         """Configure the node before warming up"""
         if self._port == 'auto':
@@ -72,10 +112,11 @@ class JsonHttp(Node[ObjectPayload, ObjectPayload]):
         """Warm up the node"""
         handler = self._make_handler()
 
-        self._httpd = HTTPServer(
+        self._httpd = _Server(
             (self._host, self._port), handler, bind_and_activate=False
         )
 
+        self._httpd.request_queue_size = self._listen_backlog
         self._httpd.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self._httpd.server_bind()
         self._httpd.server_activate()
@@ -83,7 +124,7 @@ class JsonHttp(Node[ObjectPayload, ObjectPayload]):
         self.logger.info(
             'HTTP JSON source ready on http://%s:%s/%s',
             self._host,
-            self._port,
+            self._httpd.server_port,
             self._endpoint,
         )
 
@@ -122,30 +163,93 @@ class JsonHttp(Node[ObjectPayload, ObjectPayload]):
 
     def update(self, message: Message[ObjectPayload]) -> None:
         """Receive an update message"""
-        self.logger.info(f'HTTP server received a message: {message}')
+        self.logger.debug(f'HTTP server received a message: {message}')
 
         self.transmit(message)
 
+    def ingest(self, payloads: list[ObjectPayload]) -> int:
+        """
+        Queue received payloads as messages, without blocking. Payloads are
+        queued in order, until the node is saturated.
+
+        Parameters
+        ----------
+        payloads : list[ObjectPayload]
+            The received payloads.
+
+        Returns
+        -------
+        int
+            The number of queued payloads.
+
+        """
+        with self._admission:
+            if self._max_backlog > 0:
+                room = max(self._max_backlog - self.backlog, 0)
+            else:
+                room = len(payloads)
+
+            accepted = 0
+
+            for payload in payloads[:room]:
+                msg = Message[ObjectPayload](
+                    creator=self.name, version=self._sent, payload=payload
+                )
+
+                if not self.offer(msg):
+                    break
+
+                self._sent += 1
+                accepted += 1
+
+            self.accepted += accepted
+            self.refused += len(payloads) - accepted
+
+        return accepted
+
     def _make_handler(self) -> type[BaseHTTPRequestHandler]:
         node = self
+        batch_path = f'{node._endpoint}/batch'
 
         class _Handler(BaseHTTPRequestHandler):
-            def do_POST(self) -> None:
-                node.logger.info('POST received')
-
-                if self.path.strip('/') != node._endpoint:
+            # keep-alive connections spare clients a handshake per request,
+            # and replies are not delayed waiting for their acknowledgement
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_POST(self) -> None:  # noqa: N802
+                if self.path.strip('/') not in (node._endpoint, batch_path):
+                    self.close_connection = True
                     self.send_error(HTTPStatus.NOT_FOUND)
 
                     return
 
-                if self.headers.get('Content-Type') != 'application/json':
-                    self.send_error(
-                        HTTPStatus.BAD_REQUEST,
-                        'Content-Type must be application/json',
-                    )
+                if not node._slots.acquire(blocking=False):
+                    with node._admission:
+                        node.throttled += 1
+
+                    # the body is left unread, so the connection can not be
+                    # used for further requests
+                    self.close_connection = True
+                    self._reply(HTTPStatus.TOO_MANY_REQUESTS, 0)
 
                     return
 
+                try:
+                    self._post()
+                finally:
+                    node._slots.release()
+
+            def do_GET(self) -> None:  # noqa: N802
+                if self.path == '/health':
+                    self._reply(HTTPStatus.OK, status='ok')
+                else:
+                    self.send_error(HTTPStatus.NOT_FOUND)
+
+            def log_message(self, format: str, *args) -> None:
+                node.logger.debug(format, *args)
+
+            def _post(self) -> None:
                 content_length = int(self.headers.get('Content-Length', 0))
 
                 if content_length <= 0:
@@ -156,35 +260,77 @@ class JsonHttp(Node[ObjectPayload, ObjectPayload]):
                 body = self.rfile.read(content_length)
 
                 try:
-                    json_content = json.loads(body.decode('utf-8'))
-                except ValueError:
-                    self.send_error(HTTPStatus.BAD_REQUEST, 'Malformed JSON')
+                    payloads = [
+                        ObjectPayload.from_dict(content)
+                        for content in self._parse(body)
+                    ]
+                except ValueError as e:
+                    self.send_error(HTTPStatus.BAD_REQUEST, str(e))
 
                     return
 
-                msg = Message[ObjectPayload](
-                    creator=node.name,
-                    version=node._sent,
-                    payload=ObjectPayload.from_dict(json_content),
-                )
+                accepted = node.ingest(payloads)
+
+                if accepted < len(payloads):
+                    node.logger.warning(
+                        f'node saturated, {len(payloads) - accepted} refused'
+                    )
 
-                node.put(msg)
-                node._sent += 1
+                    self._reply(HTTPStatus.SERVICE_UNAVAILABLE, accepted)
 
-                self.send_response(HTTPStatus.ACCEPTED)
-                self.end_headers()
+                    return
 
-            def do_GET(self) -> None:
-                if self.path == '/health':
-                    self.send_response(HTTPStatus.OK)
-                    self.send_header('Content-Type', 'application/json')
-                    self.end_headers()
-
-                    with contextlib.suppress(
-                        BrokenPipeError, ConnectionResetError
-                    ):
-                        self.wfile.write(b'{"status": "ok"}')
+                self._reply(HTTPStatus.ACCEPTED, accepted)
+
+            def _parse(self, body: bytes) -> list:
+                batch = self.path.strip('/') == batch_path
+                content_type = self.headers.get('Content-Type', '')
+                content_type = content_type.split(';')[0].strip()
+
+                if batch and content_type == 'application/x-ndjson':
+                    lines = [line for line in body.splitlines() if line.strip()]
+                elif content_type == 'application/json':
+                    lines = [body]
                 else:
-                    self.send_error(HTTPStatus.NOT_FOUND)
+                    raise ValueError(
+                        'Content-Type must be application/json'
+                        + (' or application/x-ndjson' if batch else '')
+                    )
+
+                try:
+                    contents = [json.loads(line) for line in lines]
+                except ValueError as e:
+                    raise ValueError('Malformed JSON') from e
+
+                if batch and content_type == 'application/json':
+                    contents = contents[0]
+
+                    if not isinstance(contents, list):
+                        raise ValueError('Batch body must be a JSON array')
+
+                if not all(isinstance(c, dict) for c in contents):
+                    raise ValueError('Messages must be JSON objects')
+
+                return contents
+
+            def _reply(
+                self, status: HTTPStatus, accepted: int = 0, **content
+            ) -> None:
+                body = json.dumps(content or {'accepted': accepted}).encode()
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+
+                if status in _RETRY_STATUS:
+                    self.send_header('Retry-After', str(node._retry_after))
+
+                if self.close_connection:
+                    self.send_header('Connection', 'close')
+
+                self.end_headers()
+
+                with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+                    self.wfile.write(body)
 
         return _Handler
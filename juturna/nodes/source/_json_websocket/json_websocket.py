@@ -7,24 +7,44 @@ JsonWebsocket
 Expose a websocket server and fetch input data from it.
 """
 
+import collections
 import json
 import queue
 import threading
 
 from websockets.sync.server import serve
+from websockets.sync.server import ServerConnection
 
 from juturna.components import Node
 from juturna.components import Message
 
-from juturna.payloads import BytesPayload
+from juturna.payloads import Batch
 from juturna.payloads import ObjectPayload
-from juturna.payloads import Draft
 
 
-class JsonWebsocket(Node[BytesPayload, ObjectPayload]):
+_CODECS = ('json', 'juturna')
+
+
+class _Client:
+    """Payloads received from a single connection, waiting to be sent"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pending: collections.deque[ObjectPayload] = collections.deque()
+        self.room = threading.Condition()
+
+
+class JsonWebsocket(Node[ObjectPayload, ObjectPayload]):
     """Node implementation class"""
 
-    def __init__(self, rtx_host: str, rtx_port: int, **kwargs):
+    def __init__(
+        self,
+        rtx_host: str,
+        rtx_port: int,
+        codec: str = 'json',
+        max_pending: int = 64,
+        **kwargs,
+    ):
         """
         Parameters
         ----------
@@ -32,20 +52,39 @@ class JsonWebsocket(Node[BytesPayload, ObjectPayload]):
             Websocket server host.
         rtx_port : int
             Websocket server port.
+        codec : str
+            How binary frames are decoded: ``json`` (UTF-8 encoded JSON, as
+            text frames) or ``juturna`` (messages encoded with the binary
+            message codec).
+        max_pending : int
+            Maximum number of messages received from a single client and not
+            yet sent. Once reached, the client is not read from until some of
+            its messages are sent.
         kwargs : dict
             Supernode args.
 
         """
         super().__init__(**kwargs)
 
+        if codec not in _CODECS:
+            raise ValueError(f'unknown codec: {codec}')
+
         self._rtx_host = rtx_host
         self._rtx_port = rtx_port
+        self._codec = codec
+        self._max_pending = max_pending
 
         self._sent = 0
-        self._queue: queue.Queue[Message[ObjectPayload]] = queue.Queue()
         self._thread: threading.Thread | None = None
         self._server = None
 
+        # clients with pending messages, each one queued once at most, so
+        # that clients take turns
+        self._turns: queue.Queue[_Client | None] = queue.Queue()
+        self._clients: set[_Client] = set()
+        self._clients_lock = threading.Lock()
+        self._closing = threading.Event()
+
     def warmup(self):
         """Prepare node for execution"""
         self._server = serve(self._ws_handler, self._rtx_host, self._rtx_port)
@@ -57,49 +96,139 @@ class JsonWebsocket(Node[BytesPayload, ObjectPayload]):
 
         self.logger.info('ws server created')
 
+    @property
+    def address(self) -> tuple[str, int]:
+        """Address the websocket server is listening on"""
+        return self._server.socket.getsockname()
+
     def start(self):
         """Start server thread and set source"""
-        self.set_source(self._queue.get)
+        self.set_source(self._next_message)
         self._thread.start()
 
         super().start()
 
     def stop(self):  # noqa: D102
+        self._release_clients()
+
         if self._server:
             self._server.shutdown()
         if self._thread:
             self._thread.join(timeout=2)
 
-    def update(self, message: Message[BytesPayload]):  # noqa: D102
-        self.logger.info(f'ws server message received: {message.payload.cnt}')
+        self._turns.put(None)
 
-        try:
-            json_content = json.loads(message.payload.cnt.decode())
-        except Exception:
-            self.logger.warning('bad JSON, skipped')
+        super().stop()
 
-            return
+    def update(self, message: Message[ObjectPayload]):  # noqa: D102
+        self.transmit(message)
 
-        to_send = Message[ObjectPayload](
-            creator=self.name, version=self._sent, payload=Draft(ObjectPayload)
-        )
+    def _next_message(self) -> Message[ObjectPayload]:
+        client = self._turns.get()
+
+        if client is None:
+            # the node is stopping, the returned message is discarded
+            self._stop_source_event.wait()
+
+            return Message[ObjectPayload](
+                creator=self.name, payload=ObjectPayload()
+            )
+
+        with client.room:
+            payload = client.pending.popleft()
 
-        for k, v in json_content.items():
-            to_send.payload[k] = v
+            if client.pending:
+                self._turns.put(client)
 
-        self.logger.info('ws source transmitting...')
-        self.transmit(to_send)
+            client.room.notify()
+
+        message = Message[ObjectPayload](
+            creator=self.name, version=self._sent, payload=payload
+        )
+
+        message.meta['client'] = client.name
         self._sent += 1
 
-    def _ws_handler(self, websocket):
+        return message
+
+    def _release_clients(self):
+        # handlers waiting for room give up, so that connections can close
+        self._closing.set()
+
+        # handler threads add and remove clients concurrently
+        with self._clients_lock:
+            clients = tuple(self._clients)
+
+        for client in clients:
+            with client.room:
+                client.room.notify_all()
+
+    def _ws_handler(self, websocket: ServerConnection):
+        host, port = websocket.remote_address[:2]
+        client = _Client(f'{host}:{port}')
+
+        with self._clients_lock:
+            self._clients.add(client)
+
         try:
             for raw in websocket:
-                payload = BytesPayload(cnt=raw)
+                try:
+                    payloads = self._decode(raw)
+                except Exception as exc:
+                    self.logger.warning(f'bad frame from {client.name}: {exc}')
 
-                msg = Message[BytesPayload](
-                    creator=self.name, version=self._sent, payload=payload
-                )
+                    continue
 
-                self._queue.put(msg)
+                # once the node is closing, frames are still read (and
+                # dropped) so that the connection can close cleanly
+                for payload in payloads:
+                    self._enqueue(client, payload)
         except Exception as exc:
             self.logger.warning('ws handler died: %s', exc)
+        finally:
+            with self._clients_lock:
+                self._clients.discard(client)
+
+    def _enqueue(self, client: _Client, payload: ObjectPayload):
+        # a client with too many pending messages is not read from, so that
+        # only its own connection is slowed down
+        with client.room:
+            client.room.wait_for(
+                lambda: (
+                    len(client.pending) < self._max_pending
+                    or self._closing.is_set()
+                )
+            )
+
+            if self._closing.is_set():
+                return
+
+            client.pending.append(payload)
+            first = len(client.pending) == 1
+
+        if first:
+            self._turns.put(client)
+
+    def _decode(self, raw: str | bytes) -> list[ObjectPayload]:
+        if isinstance(raw, bytes) and self._codec == 'juturna':
+            message = Message.from_bytes(raw)
+            messages = (
+                message.payload.messages
+                if isinstance(message.payload, Batch)
+                else (message,)
+            )
+
+            if not all(isinstance(m.payload, ObjectPayload) for m in messages):
+                raise ValueError('only object payloads are supported')
+
+            return [m.payload for m in messages]
+
+        content = json.loads(raw)
+
+        # an array of objects is a batch of messages
+        contents = content if isinstance(content, list) else [content]
+
+        if not all(isinstance(c, dict) for c in contents):
+            raise ValueError('messages must be JSON objects')
+
+        return [ObjectPayload.from_dict(c) for c in contents]
@@ -7,32 +7,86 @@ VideoFile
 Stream a local video file.
 """
 
-import subprocess
-import pathlib
-import json
+import collections
+import math
+import os
+import queue
+import tempfile
+import threading
 import time
 
+import av
 import numpy as np
 
 from juturna.components import Node
+from juturna.components import FramePool
 from juturna.components import Message
 from juturna.names import PixelFormat
-from juturna.payloads import BytesPayload, ImagePayload
+from juturna.payloads import ImagePayload
 
 
-class VideoFile(Node[BytesPayload, ImagePayload]):
+class VideoFile(Node[ImagePayload, ImagePayload]):
     """Read video file and steam it locally"""
 
-    def __init__(self, video_path: str, width: int, height: int, **kwargs):
+    def __init__(
+        self,
+        video_path: str,
+        width: int,
+        height: int,
+        pool_size: int,
+        start_time: float = 0.0,
+        end_time: float = 0.0,
+        fps: float = 0.0,
+        realtime: bool = True,
+        read_ahead: int = 8,
+        segments: int = 1,
+        max_spill_bytes: int = 1 << 30,
+        decode_threads: int = 0,
+        interpolation: str = 'fast_bilinear',
+        **kwargs,
+    ):
         """
         Parameters
         ----------
         video_path : str
             Path of the source video file.
         width : int
-            Output width of the produced video frames.
+            Output width of the produced video frames. If 0, the video width
+            is used.
         height : int
-            Output height of the produced video frames.
+            Output height of the produced video frames. If 0, the video height
+            is used.
+        pool_size : int
+            Number of preallocated frames that can be in use at the same time.
+        start_time : float
+            Position, in seconds, of the first frame to produce.
+        end_time : float
+            Position, in seconds, at which frames stop being produced. If 0,
+            frames are produced up to the end of the file.
+        fps : float
+            Rate at which frames are produced, in frames per second. Frames
+            are skipped to lower the video frame rate to this. If 0, every
+            frame is produced.
+        realtime : bool
+            If true, frames are produced at the pace of the video, otherwise
+            as fast as they are decoded.
+        read_ahead : int
+            Number of decoded frames held ahead of the node, in memory, for
+            the first segment.
+        segments : int
+            Number of disjoint segments the file is split into, and decoded
+            concurrently. Frames are still produced in order: those decoded
+            before their turn are held, raw, in temporary files.
+        max_spill_bytes : int
+            Maximum size of the temporary file of every segment. A segment
+            that far ahead of the produced frames waits for them to catch up.
+        decode_threads : int
+            Number of threads the codec decodes each segment with. If 0, it is
+            chosen by the codec.
+        interpolation : str
+            Scaling algorithm used when frames are resized, one of
+            ``fast_bilinear``, ``bilinear``, ``bicubic``, ``area`` and
+            ``point``.
         kwargs : dict
             Superclass arguments.
 
@@ -42,123 +96,353 @@ class VideoFile(Node[BytesPayload, ImagePayload]):
         self._video_path = video_path
         self._width = width
         self._height = height
+        self._pool_size = pool_size
+        self._start_time = start_time
+        self._end_time = end_time
+        self._fps = fps
+        self._realtime = realtime
+        self._read_ahead = read_ahead
+        self._segments = max(segments, 1)
+        self._max_spill_bytes = max_spill_bytes
+        self._decode_threads = decode_threads
+        self._interpolation = interpolation.upper()
 
         self._video_info = dict()
         self._sent = 0
 
-        self._ffmpeg_launcher_path = None
-        self._ffmpeg_proc = None
+        self._pool = None
+
+        # decoded frames of every segment, consumed in order; the first
+        # segment is read ahead in memory, the others spill to files
+        self._frames: list[queue.Queue | _Spill] = list()
+        self._decoders: list[threading.Thread] = list()
+        self._closing = threading.Event()
+        self._segment = 0
+        self._clock: tuple[float, float] | None = None
 
     def configure(self):
         """Configure the node"""
-        cmd = [
-            'ffprobe',
-            '-v',
-            'quiet',
-            '-print_format',
-            'json',
-            '-show_format',
-            '-show_streams',
-            str(self._video_path),
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        data = json.loads(result.stdout)
+        with av.open(str(self._video_path)) as container:
+            stream = container.streams.video[0]
+            duration = (
+                container.duration / av.time_base
+                if container.duration is not None
+                else -1
+            )
 
-        video_stream = next(
-            s for s in data['streams'] if s['codec_type'] == 'video'
-        )
+            self._video_info = {
+                'duration': duration,
+                'fps': float(stream.average_rate or 0),
+                'width': stream.width,
+                'height': stream.height,
+                'total_frames': stream.frames,
+            }
 
-        self._video_info = {
-            'duration': float(data['format'].get('duration', -1)),
-            'fps': eval(video_stream.get('r_frame_rate', -1)),
-            'width': video_stream['width'],
-            'height': video_stream['height'],
-            'total_frames': int(video_stream.get('nb_frames', 0)),
-        }
+        self._width = self._width or self._video_info['width']
+        self._height = self._height or self._video_info['height']
 
         self.logger.info('video info acquired')
         self.logger.info(self._video_info)
 
     def warmup(self):
         """Warmup the node"""
-        self._ffmpeg_launcher_path = self.ffmpeg_launcher
+        self._pool = FramePool(
+            (self._height, self._width, 3), size=self._pool_size
+        )
 
     def start(self):
         """Start the node"""
-        self.logger.info('starting file source proc...')
+        self.logger.info('starting file decoders...')
 
-        self._ffmpeg_proc = subprocess.Popen(
-            ['sh', self.ffmpeg_launcher],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            bufsize=10**8,
-        )
+        self._closing.clear()
+        self._segment = 0
+        self._clock = None
+        self._frames = list()
+        self._decoders = list()
 
-        self.set_source(
-            lambda: Message[BytesPayload](
-                creator=self.name,
-                payload=BytesPayload(
-                    cnt=self._ffmpeg_proc.stdout.read(
-                        self._width * self._height * 3
-                    )
-                ),
+        for segment_start, segment_end in self._segment_bounds():
+            frames = (
+                _Spill(self._pool, self._max_spill_bytes)
+                if self._frames
+                else queue.Queue(maxsize=self._read_ahead)
+            )
+            decoder = threading.Thread(
+                name=f'_decoder_{self.name}_{len(self._decoders)}',
+                target=self._decode,
+                args=(segment_start, segment_end, frames),
+                daemon=True,
             )
-        )
+
+            self._frames.append(frames)
+            self._decoders.append(decoder)
+            decoder.start()
+
+        self.set_source(self._next_frame)
 
         super().start()
 
     def stop(self):
         """Stop the node"""
-        try:
-            self._ffmpeg_proc.stdin.write('q\n')
-            self._ffmpeg_proc.stdin.flush()
-            self._ffmpeg_proc.stdin.close()
+        self._closing.set()
 
-            time.sleep(2)
+        super().stop()
 
-            self._ffmpeg_proc.terminate()
-            self._ffmpeg_proc.wait()
-            self._ffmpeg_proc = None
-        except Exception:
-            ...
+        for decoder in self._decoders:
+            decoder.join()
 
-        super().stop()
+        for frames in self._frames:
+            if isinstance(frames, _Spill):
+                frames.close()
+
+        self._decoders = list()
 
     def destroy(self):
         """Destroy the node"""
         self.stop()
 
-    def update(self, message: Message[BytesPayload]):
+    def update(self, message: Message[ImagePayload]):
         """Receive a message, transmit a message"""
+        if message.payload.image.size == 0:
+            return
+
+        self.transmit(message)
+
+    def _segment_bounds(self) -> list[tuple[float, float | None]]:
+        end = self._end_time or None
+        segments = self._segments
+
+        if segments > 1 and end is None:
+            end = self._video_info.get('duration', -1)
+
+            if end <= 0:
+                self.logger.warning('unknown duration, decoding sequentially')
+
+                end, segments = None, 1
+
+        if segments == 1:
+            return [(self._start_time, end)]
+
+        span = (end - self._start_time) / segments
+        bounds = [self._start_time + idx * span for idx in range(segments)]
+
+        # the last segment runs to the end, whatever the rounding
+        return list(
+            zip(bounds, bounds[1:] + [self._end_time or None], strict=True)
+        )
+
+    def _decode(
+        self, start: float, end: float | None, frames: 'queue.Queue | _Spill'
+    ):
         try:
-            full_frame = np.frombuffer(message.payload.cnt, np.uint8).reshape(
-                (self._height, self._width, 3)
-            )
-            to_send = Message(
+            with av.open(str(self._video_path)) as container:
+                stream = container.streams.video[0]
+                stream.thread_type = 'AUTO'
+                stream.codec_context.thread_count = self._decode_threads
+                period = 1 / float(stream.average_rate or 25)
+
+                # seeking lands on the keyframe before the start
+                if start > 0:
+                    container.seek(int(start / stream.time_base), stream=stream)
+
+                for frame in container.decode(stream):
+                    if self._closing.is_set():
+                        break
+
+                    position = frame.time
+
+                    if position is None or position < start:
+                        continue
+
+                    if end is not None and position >= end:
+                        break
+
+                    if not self._keep(position, period):
+                        continue
+
+                    if not self._hand_over(
+                        frames, (position, self._convert(frame))
+                    ):
+                        break
+        except Exception as e:
+            self.logger.error(f'decoding failed: {e}')
+        finally:
+            self._hand_over(frames, None)
+
+    def _keep(self, position: float, period: float) -> bool:
+        if not self._fps:
+            return True
+
+        # keep the first frame at or past every tick of the output rate;
+        # this only depends on the frame itself, so segments agree on it,
+        # and ticks falling on a frame are not missed to rounding errors
+        elapsed = (position - self._start_time) * self._fps + 1e-6
+
+        return math.floor(elapsed) > math.floor(elapsed - period * self._fps)
+
+    def _convert(self, frame: av.VideoFrame) -> np.ndarray:
+        rgb = frame.reformat(
+            self._width,
+            self._height,
+            PixelFormat.RGB24,
+            interpolation=self._interpolation,
+        )
+        plane = rgb.planes[0]
+
+        # rows of the plane can be padded past the frame width
+        rows = np.frombuffer(plane, np.uint8).reshape(-1, plane.line_size)
+        image = self._pool.acquire()
+        image.reshape(self._height, -1)[:] = rows[
+            : self._height, : self._width * 3
+        ]
+
+        return image
+
+    def _hand_over(self, frames: 'queue.Queue | _Spill', item) -> bool:
+        while not self._closing.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def _next_frame(self) -> Message[ImagePayload]:
+        while self._segment < len(self._frames):
+            try:
+                item = self._frames[self._segment].get(timeout=0.1)
+            except queue.Empty:
+                if self._stop_source_event.is_set():
+                    break
+
+                continue
+
+            if item is None:
+                if isinstance(self._frames[self._segment], _Spill):
+                    self._frames[self._segment].close()
+
+                self._segment += 1
+
+                continue
+
+            position, image = item
+            self._pace(position)
+
+            message = Message[ImagePayload](
                 creator=self.name,
                 version=self._sent,
                 payload=ImagePayload(
-                    image=full_frame,
+                    image=image,
                     width=self._width,
                     height=self._height,
+                    depth=3,
                     pixel_format=PixelFormat.RGB24,
                     timestamp=time.time(),
                 ),
             )
-
-            self.transmit(to_send)
+            message.meta['position'] = position
             self._sent += 1
-        except Exception as _:
-            ...
-
-    @property
-    def ffmpeg_launcher(self) -> pathlib.Path:
-        """Fetch the FFmpeg launcher script"""
-        return self._ffmpeg_launcher_path or self.prepare_template(
-            'ffmpeg_launcher.sh.template',
-            '_ffmpeg_launcher.sh',
-            {
-                '_video_path': self._video_path,
-                '_frame_shape': f'{self._width}x{self._height}',
-            },
+
+            return message
+
+        if self._segment == len(self._frames):
+            self.logger.info(f'end of file, {self._sent} frames produced')
+            self._segment += 1
+
+        # the source has nothing left to produce until the node stops
+        self._stop_source_event.wait()
+
+        return Message[ImagePayload](creator=self.name, payload=ImagePayload())
+
+    def _pace(self, position: float):
+        if not self._realtime:
+            return
+
+        now = time.monotonic()
+
+        if self._clock is None:
+            self._clock = (now, position)
+
+        delay = self._clock[0] + position - self._clock[1] - now
+
+        if delay > 0:
+            self._stop_source_event.wait(delay)
+
+
+class _Spill:
+    """
+    Frames of a segment decoded before its turn. Frames are written, raw, to a
+    temporary file used as a ring of frame slots, so that the decoder does not
+    wait for the segments before it until the ring is full, and read back into
+    the frame pool once the segment is consumed. The interface is the one of
+    the read ahead queue of the first segment.
+    """
+
+    def __init__(self, pool: FramePool, max_bytes: int):
+        self._pool = pool
+        # the file lives as long as the segment, and is closed by close()
+        self._file = tempfile.TemporaryFile()  # noqa: SIM115
+        self._fd = self._file.fileno()
+        self._frame_size = pool.nbytes
+        self._slots = max(max_bytes // self._frame_size, 1)
+
+        self._positions: collections.deque[float] = collections.deque()
+        self._done = False
+        self._written = 0
+        self._read = 0
+        self._ready = threading.Condition()
+
+    def put(self, item: tuple[float, np.ndarray] | None, timeout=None):
+        if item is None:
+            with self._ready:
+                self._done = True
+                self._ready.notify_all()
+
+            return
+
+        position, image = item
+
+        with self._ready:
+            if not self._ready.wait_for(
+                lambda: self._written - self._read < self._slots, timeout
+            ):
+                raise queue.Full
+
+            slot = self._written % self._slots
+
+        # only the decoder writes, and only to slots already read back
+        os.pwrite(self._fd, image.data, slot * self._frame_size)
+
+        with self._ready:
+            self._positions.append(position)
+            self._written += 1
+            self._ready.notify_all()
+
+    def get(self, timeout: float) -> tuple[float, np.ndarray] | None:
+        with self._ready:
+            if not self._ready.wait_for(
+                lambda: self._positions or self._done, timeout
+            ):
+                raise queue.Empty
+
+            if not self._positions:
+                return None
+
+            slot = self._read % self._slots
+            position = self._positions.popleft()
+
+        image = self._pool.acquire()
+        os.preadv(
+            self._fd, [memoryview(image).cast('B')], slot * self._frame_size
         )
+
+        # the slot can only be reused once it is read back
+        with self._ready:
+            self._read += 1
+            self._ready.notify_all()
+
+        return position, image
+
+    def close(self):
+        self._file.close()
@@ -1,20 +1,20 @@
 """VideoRTP source node"""
 
+import os
 import pathlib
 import time
 import subprocess
 
-import numpy as np
-
 from juturna.components import Message
 from juturna.components import Node
+from juturna.components import FramePool
 from juturna.components import _resource_broker as rb
 
 from juturna.names import PixelFormat
-from juturna.payloads import BytesPayload, ImagePayload
+from juturna.payloads import ImagePayload
 
 
-class VideoRTP(Node[BytesPayload, ImagePayload]):
+class VideoRTP(Node[ImagePayload, ImagePayload]):
     """Source node for video streaming"""
 
     def __init__(
@@ -25,6 +25,7 @@ class VideoRTP(Node[BytesPayload, ImagePayload]):
         codec: str,
         width: int,
         height: int,
+        pool_size: int,
         **kwargs,
     ):
         """
@@ -43,6 +44,8 @@ class VideoRTP(Node[BytesPayload, ImagePayload]):
             Width of the received RTP video stream.
         height : int
             Height of the received RTP video stream.
+        pool_size : int
+            Number of preallocated frames that can be in use at the same time.
         kwargs : dict
             Superclass arguments.
 
@@ -57,12 +60,19 @@ class VideoRTP(Node[BytesPayload, ImagePayload]):
 
         self._width = width
         self._height = height
+        self._pool_size = pool_size
 
         self._sdp_file_path = None
         self._ffmpeg_launcher_path = None
         self._ffmpeg_proc = None
+        self._pool = None
         self._sent = 0
 
+        # frame being filled from the ffmpeg output
+        self._frame = None
+        self._filled = 0
+        self._dropped = 0
+
     def configure(self):
         """Configure the node"""
         if self._rec_port == 'auto':
@@ -72,6 +82,9 @@ class VideoRTP(Node[BytesPayload, ImagePayload]):
         """Warmup the node"""
         self._sdp_file_path = self.sdp_descriptor
         self._ffmpeg_launcher_path = self.ffmpeg_launcher
+        self._pool = FramePool(
+            (self._height, self._width, 3), size=self._pool_size
+        )
 
     def start(self):
         """Start the node"""
@@ -79,19 +92,14 @@ class VideoRTP(Node[BytesPayload, ImagePayload]):
             ['sh', self.ffmpeg_launcher],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            bufsize=10**8,
+            # unbuffered, so frames are read straight into the pool slots
+            bufsize=0,
         )
 
-        self.set_source(
-            lambda: Message[BytesPayload](
-                creator=self.name,
-                payload=BytesPayload(
-                    cnt=self._ffmpeg_proc.stdout.read(  # type: ignore
-                        self._width * self._height * 3
-                    )
-                ),
-            )
-        )
+        os.set_blocking(self._ffmpeg_proc.stdout.fileno(), False)
+
+        self._frame = None
+        self.add_reader(self._ffmpeg_proc.stdout, self._read_frame)
 
         super().start()
 
@@ -101,6 +109,8 @@ class VideoRTP(Node[BytesPayload, ImagePayload]):
             assert self._ffmpeg_proc is not None
             assert self._ffmpeg_proc.stdin is not None
 
+            self.remove_reader(self._ffmpeg_proc.stdout)
+
             self._ffmpeg_proc.stdin.write(b'q\n')
             self._ffmpeg_proc.stdin.flush()
             self._ffmpeg_proc.stdin.close()
@@ -127,29 +137,61 @@ class VideoRTP(Node[BytesPayload, ImagePayload]):
 
         return base_config
 
-    def update(self, message: Message[BytesPayload]):
+    def update(self, message: Message[ImagePayload]):
         """Receive a message, transmit a message"""
-        try:
-            full_frame = np.frombuffer(message.payload.cnt, np.uint8).reshape(
-                (self._height, self._width, 3)
-            )
-
-            to_send = Message[ImagePayload](
-                creator=self.name,
-                version=self._sent,
-                payload=ImagePayload(
-                    image=full_frame,
-                    width=full_frame.shape[0],
-                    height=full_frame.shape[1],
-                    pixel_format=PixelFormat.RGB24,
-                    timestamp=time.time(),
-                ),
-            )
-
-            self.transmit(to_send)
-            self._sent += 1
-        except Exception as _:
-            ...
+        if message.payload.image.size == 0:
+            return
+
+        to_send = Message[ImagePayload](
+            creator=self.name,
+            version=self._sent,
+            payload=message.payload,
+        )
+
+        self.transmit(to_send)
+        self._sent += 1
+
+    def _read_frame(self):
+        # called by the reactor thread, which must never block
+        stdout = self._ffmpeg_proc.stdout
+
+        if self._frame is None:
+            self._frame = self._pool.acquire()
+            self._filled = 0
+
+        with memoryview(self._frame).cast('B') as view:
+            read = stdout.readinto(view[self._filled :])
+
+        if read is None:
+            return
+
+        if not read:
+            self.remove_reader(stdout)
+            self._frame = None
+
+            return
+
+        self._filled += read
+
+        if self._filled < self._pool.nbytes:
+            return
+
+        frame, self._frame = self._frame, None
+        message = Message[ImagePayload](
+            creator=self.name,
+            payload=ImagePayload(
+                image=frame,
+                width=self._width,
+                height=self._height,
+                depth=3,
+                pixel_format=PixelFormat.RGB24,
+                timestamp=time.time(),
+            ),
+        )
+
+        if not self.offer(message):
+            self._dropped += 1
+            self.logger.warning(f'node saturated, {self._dropped} dropped')
 
     @property
     def sdp_descriptor(self) -> pathlib.Path:
@@ -42,6 +42,12 @@ class VideoRtpAv(Node[BytesPayload, ImagePayload]):
         payload_type: int,
         codec: str,
         encoding_clock_chan: str,
+        out_width: int = 0,
+        out_height: int = 0,
+        pixel_format: str = 'rgb24',
+        interpolation: str = 'fast_bilinear',
+        decimation: int = 1,
+        keyframes_only: bool = False,
         **kwargs,
     ):
         """
@@ -60,6 +66,23 @@ class VideoRtpAv(Node[BytesPayload, ImagePayload]):
             encoding name/clock rate[/channels] for the RTP stream as defined
             in RFC 4566 (SDP) and in RFC 3555 (MIME type registration for RTP
             payload formats).
+        out_width : int
+            Width of the produced frames. If 0, it follows the stream width,
+            or keeps the stream aspect ratio when ``out_height`` is set.
+        out_height : int
+            Height of the produced frames. If 0, it follows the stream height,
+            or keeps the stream aspect ratio when ``out_width`` is set.
+        pixel_format : str
+            Pixel format of the produced frames, as listed in
+            ``PixelFormat``.
+        interpolation : str
+            Scaling algorithm used when the frame size changes, one of
+            ``fast_bilinear``, ``bilinear``, ``bicubic``, ``area`` and
+            ``point``.
+        decimation : int
+            Only one decoded frame out of this many is produced.
+        keyframes_only : bool
+            If true, only keyframes are decoded and produced.
         kwargs : dict
             Superclass arguments.
 
@@ -71,12 +94,19 @@ class VideoRtpAv(Node[BytesPayload, ImagePayload]):
         self._payload_type = payload_type
         self._codec = codec
         self._encoding_clock_chan = encoding_clock_chan
+        self._out_width = out_width
+        self._out_height = out_height
+        self._pixel_format = PixelFormat(pixel_format)
+        self._interpolation = interpolation.upper()
+        self._decimation = max(decimation, 1)
+        self._keyframes_only = keyframes_only
 
         self._container = None
         self._sdp_file_path = None
         self._t = None
         self._stop_event = threading.Event()
         self._sent = 0
+        self._decoded = 0
 
     def configure(self):
         """Configure the node"""
@@ -116,6 +146,10 @@ class VideoRtpAv(Node[BytesPayload, ImagePayload]):
             self._stream = self._container.streams.video[0]
             self._stream.thread_type = 'AUTO'
 
+            # non-key frames are discarded before being decoded
+            if self._keyframes_only:
+                self._stream.codec_context.skip_frame = 'NONKEY'
+
             for packet in self._container.demux(self._stream):
                 if self._stop_event.is_set():
                     break
@@ -142,16 +176,30 @@ class VideoRtpAv(Node[BytesPayload, ImagePayload]):
                     if self._stop_event.is_set():
                         break
 
-                    full_frame = frame.to_ndarray(format=PixelFormat.RGB24)
+                    self._decoded += 1
+
+                    if (self._decoded - 1) % self._decimation:
+                        continue
+
+                    # scaling and conversion happen in a single pass, before
+                    # the frame is copied into an array
+                    width, height = self._output_size(frame.width, frame.height)
+                    image = frame.to_ndarray(
+                        width=width,
+                        height=height,
+                        format=self._pixel_format,
+                        interpolation=self._interpolation,
+                    )
 
                     to_send = Message[ImagePayload](
                         creator=self.name,
                         version=self._sent,
                         payload=ImagePayload(
-                            image=full_frame,
-                            width=full_frame.shape[1],
-                            height=full_frame.shape[0],
-                            pixel_format=PixelFormat.RGB24,
+                            image=image,
+                            width=width,
+                            height=height,
+                            depth=image.shape[2] if image.ndim == 3 else 1,
+                            pixel_format=self._pixel_format,
                             timestamp=time.time(),
                         ),
                     )
@@ -163,6 +211,23 @@ class VideoRtpAv(Node[BytesPayload, ImagePayload]):
                     self.logger.info(f'source unavailable ({e}), retrying...')
                     self._stop_event.wait(2.0)
 
+    def _output_size(self, width: int, height: int) -> tuple[int, int]:
+        if self._out_width and self._out_height:
+            return self._out_width, self._out_height
+
+        # sizes keeping the aspect ratio are even, as chroma subsampling needs
+        if self._out_width:
+            return self._out_width, round(
+                height * self._out_width / width / 2
+            ) * 2
+
+        if self._out_height:
+            return round(
+                width * self._out_height / height / 2
+            ) * 2, self._out_height
+
+        return width, height
+
     @property
     def sdp_descriptor(self) -> pathlib.Path:
         """Fetch the SDP descriptor file"""
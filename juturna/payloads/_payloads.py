@@ -2,6 +2,7 @@ import base64
 import copy
 import json
 import sys
+import dataclasses
 
 from typing import Self
 from typing import Any
@@ -12,11 +13,111 @@ import numpy as np
 from juturna.payloads._control_signal import ControlSignal
 
 
+def _deep_size(obj: Any, _seen: set | None = None) -> int:
+    """
+    Estimate the memory footprint of an object, including its contents.
+    Arrays and byte buffers are measured by the size of their data, payloads by
+    their own ``size_bytes``, while containers are walked recursively. Objects
+    referenced more than once are only counted the first time.
+    """
+    if obj is None:
+        return 0
+
+    _seen = set() if _seen is None else _seen
+
+    if id(obj) in _seen:
+        return 0
+
+    _seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, bytes | bytearray):
+        return len(obj)
+    if isinstance(obj, memoryview):
+        return obj.nbytes
+    if isinstance(obj, BasePayload) and hasattr(obj, 'size_bytes'):
+        return obj.size_bytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            _deep_size(k, _seen) + _deep_size(v, _seen) for k, v in obj.items()
+        )
+    if isinstance(obj, list | tuple | set | frozenset):
+        return sys.getsizeof(obj) + sum(_deep_size(v, _seen) for v in obj)
+    if hasattr(obj, 'size_bytes'):
+        return obj.size_bytes
+
+    return sys.getsizeof(obj)
+
+
+def _set_read_only(obj: Any, _seen: set | None = None):
+    """
+    Mark every array reachable from an object as read-only. Payloads and
+    containers are walked recursively, while any other object is left as it is.
+    """
+    _seen = set() if _seen is None else _seen
+
+    if id(obj) in _seen:
+        return
+
+    _seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        obj.flags.writeable = False
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _set_read_only(value, _seen)
+    elif isinstance(obj, list | tuple | set | frozenset):
+        for value in obj:
+            _set_read_only(value, _seen)
+    elif isinstance(obj, BasePayload) and dataclasses.is_dataclass(obj):
+        for f in dataclasses.fields(obj):
+            _set_read_only(getattr(obj, f.name), _seen)
+
+
+def _writable(obj: Any) -> Any:
+    """Copy all the arrays in an object, leaving any other value shared."""
+    if isinstance(obj, np.ndarray):
+        return obj.copy()
+    if isinstance(obj, BasePayload):
+        return obj.writable_copy()
+    if isinstance(obj, dict):
+        return {k: _writable(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_writable(v) for v in obj]
+    if isinstance(obj, tuple):
+        return tuple(_writable(v) for v in obj)
+
+    return obj
+
+
 @dataclass(frozen=True, slots=True)
 class BasePayload:
     def clone(self) -> Self:
         return copy.deepcopy(self)
 
+    def writable_copy(self) -> Self:
+        """
+        Create a copy of the payload whose arrays can be modified in place.
+        Arrays in a transmitted payload are read-only, as they are shared with
+        every other destination node, so they must be copied before being
+        edited. Only arrays are copied, all the other fields are shared with
+        the original payload.
+
+        Returns
+        -------
+        Self
+            A new payload with writable arrays.
+
+        """
+        return dataclasses.replace(
+            self,
+            **{
+                f.name: _writable(getattr(self, f.name))
+                for f in dataclasses.fields(self)
+            },
+        )
+
     @staticmethod
     def serialize(obj):
         return json.JSONEncoder.default(obj)
@@ -85,7 +186,7 @@ class VideoPayload(BasePayload):
 
     def __post_init__(self):
         object.__setattr__(
-            self, 'size_bytes', sum([f.nbytes for f in self.video])
+            self, 'size_bytes', sum([f.size_bytes for f in self.video])
         )
 
     @staticmethod
@@ -119,7 +220,7 @@ class Batch(BasePayload):
         object.__setattr__(
             self,
             'size_bytes',
-            sum([m.payload.size_bytes for m in self.messages]),
+            sum([_deep_size(m) for m in self.messages]),
         )
 
     @staticmethod
@@ -131,10 +232,7 @@ class Batch(BasePayload):
 class ObjectPayload(dict, BasePayload):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        object.__setattr__(self, 'size_bytes', sys.getsizeof(self))
-
-    # def __post_init__(self):
-    #     object.__setattr__(self, 'size_bytes', sys.getsizeof(self))
+        object.__setattr__(self, 'size_bytes', _deep_size(dict(self)))
 
     def __setitem__(self, key: str, value: Any):
         raise TypeError(
@@ -159,6 +257,18 @@ class ObjectPayload(dict, BasePayload):
 
         return cls(**kwargs)
 
+    def writable_copy(self) -> Self:
+        """
+        Create a copy of the payload whose arrays can be modified in place.
+
+        Returns
+        -------
+        Self
+            A new payload with writable arrays.
+
+        """
+        return self.__class__(**{k: _writable(v) for k, v in self.items()})
+
     @staticmethod
     def from_dict(origin: dict):
         return ObjectPayload(**origin)
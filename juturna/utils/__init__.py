@@ -2,6 +2,8 @@
 from juturna.utils import net_utils
 from juturna.utils import proc_utils
 from juturna.utils import jt_utils
+from juturna.utils import audio_utils
+from juturna.utils import fs_utils
 
 
-__all__ = ['net_utils', 'proc_utils', 'jt_utils']
+__all__ = ['net_utils', 'proc_utils', 'jt_utils', 'audio_utils', 'fs_utils']
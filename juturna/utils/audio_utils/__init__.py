@@ -0,0 +1,7 @@
+# noqa: D104
+from juturna.utils.audio_utils._audio_ring_buffer import AudioRingBuffer
+from juturna.utils.audio_utils._g711 import decode_alaw
+from juturna.utils.audio_utils._g711 import decode_ulaw
+
+
+__all__ = ['AudioRingBuffer', 'decode_alaw', 'decode_ulaw']
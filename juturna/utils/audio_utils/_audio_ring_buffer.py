@@ -0,0 +1,211 @@
+from collections.abc import Iterator
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    A fixed-size accumulator for audio samples. Appending samples only costs
+    the size of the appended block, no matter how many samples are stored, and
+    the most recent samples can always be read as a single contiguous array
+    without copying them.
+
+    Every sample is written twice, once in each half of a storage twice as
+    large as the buffer capacity, so that any range of stored samples is
+    contiguous in memory, even when it wraps around the end of the ring.
+    """
+
+    def __init__(
+        self, capacity: int, dtype: np.dtype = np.float32, grow: bool = False
+    ):
+        """
+        Parameters
+        ----------
+        capacity : int
+            Maximum number of samples the buffer can hold.
+        dtype : np.dtype
+            Data type of the stored samples.
+        grow : bool
+            What to do when appended samples do not fit in the buffer. If
+            False, the oldest samples are dropped, otherwise the buffer
+            capacity is doubled until all the samples fit.
+
+        """
+        if capacity <= 0:
+            raise ValueError('ring buffer capacity must be positive')
+
+        self._dtype = np.dtype(dtype)
+        self._grow = grow
+
+        self._capacity = capacity
+        self._storage = np.zeros(2 * capacity, dtype=self._dtype)
+        self._end = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self):
+        return f'<AudioRingBuffer {self._size}/{self._capacity}>'
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples the buffer can hold"""
+        return self._capacity
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the stored samples"""
+        return self._dtype
+
+    def append(self, samples: np.ndarray):
+        """
+        Append samples at the end of the buffer. Samples are converted to the
+        buffer data type.
+
+        Parameters
+        ----------
+        samples : np.ndarray
+            One-dimensional array of samples to append.
+
+        """
+        if not isinstance(samples, np.ndarray) or samples.ndim != 1:
+            samples = np.asarray(samples).reshape(-1)
+
+        count = len(samples)
+
+        if self._size + count > self._capacity and self._grow:
+            self._resize(self._size + count)
+
+        if count > self._capacity:
+            samples = samples[-self._capacity :]
+            count = self._capacity
+
+        cap = self._capacity
+        head = min(count, cap - self._end)
+        tail = count - head
+
+        self._storage[self._end : self._end + head] = samples[:head]
+        self._storage[self._end + cap : self._end + cap + head] = samples[:head]
+
+        if tail:
+            self._storage[:tail] = samples[head:]
+            self._storage[cap : cap + tail] = samples[head:]
+
+        self._end = (self._end + count) % cap
+        self._size = min(self._size + count, cap)
+
+    def window(self, size: int | None = None) -> np.ndarray:
+        """
+        Get a view on the most recent samples in the buffer. The view is
+        read-only, and only valid until new samples are appended: it must be
+        copied if it needs to outlive the next append.
+
+        Parameters
+        ----------
+        size : int | None
+            Number of samples in the window. If None, the whole buffer content
+            is returned.
+
+        Returns
+        -------
+        np.ndarray
+            A contiguous view on the requested samples.
+
+        """
+        size = self._size if size is None else min(size, self._size)
+        start = (self._end - size) % self._capacity
+
+        view = self._storage[start : start + size]
+        view.flags.writeable = False
+
+        return view
+
+    def pop(self, size: int) -> np.ndarray:
+        """
+        Remove the oldest samples from the buffer, and return a copy of them.
+
+        Parameters
+        ----------
+        size : int
+            Number of samples to remove.
+
+        Returns
+        -------
+        np.ndarray
+            The removed samples.
+
+        """
+        size = min(size, self._size)
+        start = (self._end - self._size) % self._capacity
+        samples = self._storage[start : start + size].copy()
+
+        self._size -= size
+
+        return samples
+
+    def discard(self, size: int):
+        """
+        Remove the oldest samples from the buffer.
+
+        Parameters
+        ----------
+        size : int
+            Number of samples to remove.
+
+        """
+        self._size -= min(size, self._size)
+
+    def windows(self, size: int, hop: int) -> Iterator[np.ndarray]:
+        """
+        Extract sliding windows from the oldest samples in the buffer. Every
+        time a full window is available it is yielded as a view, and the
+        oldest ``hop`` samples are discarded. Samples that do not fill a whole
+        window are left in the buffer for the next call.
+
+        Parameters
+        ----------
+        size : int
+            Number of samples in a window.
+        hop : int
+            Number of samples between the start of consecutive windows.
+
+        Yields
+        ------
+        np.ndarray
+            A read-only view on the window samples, only valid until the next
+            window is requested.
+
+        """
+        if hop <= 0:
+            raise ValueError('window hop must be positive')
+
+        while self._size >= size:
+            start = (self._end - self._size) % self._capacity
+
+            view = self._storage[start : start + size]
+            view.flags.writeable = False
+
+            yield view
+
+            self.discard(hop)
+
+    def clear(self):
+        """Remove all the samples from the buffer"""
+        self._end = 0
+        self._size = 0
+
+    def _resize(self, size: int):
+        capacity = self._capacity
+
+        while capacity < size:
+            capacity *= 2
+
+        content = self.window()
+        storage = np.zeros(2 * capacity, dtype=self._dtype)
+        storage[: len(content)] = content
+        storage[capacity : capacity + len(content)] = content
+
+        self._storage = storage
+        self._capacity = capacity
+        self._end = len(content) % capacity
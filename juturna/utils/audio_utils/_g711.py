@@ -0,0 +1,64 @@
+import numpy as np
+
+
+def _ulaw_table() -> np.ndarray:
+    code = ~np.arange(256, dtype=np.int32) & 0xFF
+    exponent = (code >> 4) & 0x07
+    mantissa = code & 0x0F
+    magnitude = (((mantissa << 3) + 0x84) << exponent) - 0x84
+
+    return np.where(code & 0x80, -magnitude, magnitude).astype(np.int16)
+
+
+def _alaw_table() -> np.ndarray:
+    code = np.arange(256, dtype=np.int32) ^ 0x55
+    exponent = (code >> 4) & 0x07
+    mantissa = code & 0x0F
+    magnitude = np.where(
+        exponent == 0,
+        (mantissa << 4) + 8,
+        ((mantissa << 4) + 0x108) << np.maximum(exponent - 1, 0),
+    )
+
+    return np.where(code & 0x80, magnitude, -magnitude).astype(np.int16)
+
+
+# 16-bit linear sample of every G.711 code
+ULAW_TABLE = _ulaw_table()
+ALAW_TABLE = _alaw_table()
+
+
+def decode_ulaw(data: bytes | bytearray | memoryview) -> np.ndarray:
+    """
+    Decode G.711 mu-law (PCMU) audio.
+
+    Parameters
+    ----------
+    data : bytes | bytearray | memoryview
+        Encoded audio, one byte per sample.
+
+    Returns
+    -------
+    np.ndarray
+        16-bit linear samples.
+
+    """
+    return ULAW_TABLE[np.frombuffer(data, dtype=np.uint8)]
+
+
+def decode_alaw(data: bytes | bytearray | memoryview) -> np.ndarray:
+    """
+    Decode G.711 A-law (PCMA) audio.
+
+    Parameters
+    ----------
+    data : bytes | bytearray | memoryview
+        Encoded audio, one byte per sample.
+
+    Returns
+    -------
+    np.ndarray
+        16-bit linear samples.
+
+    """
+    return ALAW_TABLE[np.frombuffer(data, dtype=np.uint8)]
@@ -0,0 +1,5 @@
+# noqa: D104
+from juturna.utils.fs_utils._event_coalescer import EventCoalescer
+
+
+__all__ = ['EventCoalescer']
@@ -0,0 +1,223 @@
+import os
+import threading
+import time
+
+from collections.abc import Callable
+
+
+class _Entry:
+    __slots__ = ('event', 'last', 'stat', 'closed')
+
+    def __init__(self, event: dict):
+        self.event = event
+        self.last = 0.0
+        self.stat: tuple | None = None
+        self.closed = False
+
+
+class EventCoalescer:
+    """
+    Merge the filesystem events fired for the same path into a single event,
+    released once the path has been quiet for a debounce window. Copying a
+    large file fires one creation and dozens of modifications, which are
+    released as one creation, and only once the file is complete: either it
+    was closed after writing, or its size and modification time did not
+    change over the window. A path created and deleted within the window
+    releases nothing.
+
+    Events are pushed from the watcher thread, and released ones are polled
+    from another. When more than one event is released by the same poll, they
+    are grouped in batches.
+    """
+
+    def __init__(
+        self,
+        debounce: float,
+        batch_size: int = 0,
+        updates: bool = True,
+        stat: Callable[[str], os.stat_result] = os.stat,
+    ):
+        """
+        Parameters
+        ----------
+        debounce : float
+            Time, in seconds, a path must be quiet before its event is
+            released.
+        batch_size : int
+            Maximum number of events released together. If lower than 2,
+            events are always released one by one.
+        updates : bool
+            If false, modifications of paths with no pending event are
+            ignored; they still extend the window of pending events.
+        stat : Callable[[str], os.stat_result]
+            Function returning the status of a path.
+
+        """
+        if debounce < 0:
+            raise ValueError('debounce window cannot be negative')
+
+        self.debounce = debounce
+        self.batch_size = batch_size
+        self.updates = updates
+
+        self.received = 0
+        self.emitted = 0
+        self.batches = 0
+
+        self._stat = stat
+        self._lock = threading.Lock()
+
+        # pending events by path, in the order their paths were first seen
+        self._pending: dict[str, _Entry] = dict()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __repr__(self):
+        return (
+            f'<EventCoalescer {self.debounce}s: '
+            f'{self.received} received, {self.emitted} emitted>'
+        )
+
+    def push(self, event: dict, now: float | None = None):
+        """
+        Record an event. Creations, modifications and deletions of the same
+        path are merged; a close only marks the pending event of its path as
+        complete.
+
+        Parameters
+        ----------
+        event : dict
+            The event, with at least its ``event_type`` and ``src_path``.
+        now : float | None
+            Monotonic time of the event. If None, the current time is used.
+
+        """
+        now = time.monotonic() if now is None else now
+        path = str(event['src_path'])
+        event_type = event['event_type']
+        stat = None if event_type == 'deleted' else self._status(path)
+
+        with self._lock:
+            self.received += 1
+            entry = self._pending.get(path)
+
+            if event_type == 'closed':
+                # a close with nothing pending follows released events
+                if entry is not None:
+                    entry.closed = True
+                    entry.stat = stat
+
+                return
+
+            if entry is None:
+                if event_type == 'modified' and not self.updates:
+                    return
+
+                entry = self._pending[path] = _Entry(event)
+            elif event_type == 'deleted' and self._type(entry) == 'created':
+                del self._pending[path]
+
+                return
+            elif self._type(entry) == 'created':
+                event = event | {'event_type': 'created'}
+
+            entry.event = event
+            entry.last = now
+            entry.stat = stat
+            entry.closed = False
+
+    def poll(self, now: float | None = None) -> list[list[dict]]:
+        """
+        Release the events of the paths that are done changing.
+
+        Parameters
+        ----------
+        now : float | None
+            Monotonic time of the poll. If None, the current time is used.
+
+        Returns
+        -------
+        list[list[dict]]
+            The released events, in the order their paths were first seen,
+            grouped in batches.
+
+        """
+        now = time.monotonic() if now is None else now
+
+        with self._lock:
+            candidates = [
+                (path, entry, entry.last)
+                for path, entry in self._pending.items()
+                if entry.closed or now - entry.last >= self.debounce
+            ]
+
+        ready = list()
+
+        # status is read out of the lock, so that pushes are never delayed
+        for path, entry, last in candidates:
+            stat = None
+
+            if not entry.closed and self._type(entry) != 'deleted':
+                stat = self._status(path)
+
+            with self._lock:
+                # skip events pushed meanwhile, or released by a flush
+                if self._pending.get(path) is not entry or entry.last != last:
+                    continue
+
+                if entry.closed or self._type(entry) == 'deleted':
+                    ready.append(self._pending.pop(path).event)
+                elif stat is None:
+                    # gone before being released, a deletion may follow
+                    del self._pending[path]
+                elif stat == entry.stat:
+                    ready.append(self._pending.pop(path).event)
+                else:
+                    # still growing without events, wait another window
+                    entry.stat = stat
+                    entry.last = now
+
+        return self._group(ready)
+
+    def flush(self) -> list[list[dict]]:
+        """
+        Release every pending event, whether its path is done changing or not.
+
+        Returns
+        -------
+        list[list[dict]]
+            The released events, grouped in batches.
+
+        """
+        with self._lock:
+            ready = [entry.event for entry in self._pending.values()]
+            self._pending.clear()
+
+        return self._group(ready)
+
+    def _group(self, ready: list[dict]) -> list[list[dict]]:
+        self.emitted += len(ready)
+
+        if self.batch_size < 2 or len(ready) < 2:
+            return [[event] for event in ready]
+
+        batches = [
+            ready[pos : pos + self.batch_size]
+            for pos in range(0, len(ready), self.batch_size)
+        ]
+        self.batches += sum(1 for batch in batches if len(batch) > 1)
+
+        return batches
+
+    def _status(self, path: str) -> tuple | None:
+        try:
+            status = self._stat(path)
+        except OSError:
+            return None
+
+        return status.st_size, status.st_mtime_ns
+
+    @staticmethod
+    def _type(entry: _Entry) -> str:
+        return entry.event['event_type']
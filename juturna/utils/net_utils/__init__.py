@@ -1,7 +1,29 @@
 # noqa: D104
 from juturna.utils.net_utils._port_scanner import get_available_port
+from juturna.utils.net_utils._rtp_datagram import RTP_HEADER
 from juturna.utils.net_utils._rtp_datagram import RTPDatagram
 from juturna.utils.net_utils._rtp_client import RTPClient
+from juturna.utils.net_utils._reactor import Reactor
+from juturna.utils.net_utils._rtp_receiver import JitterBuffer
+from juturna.utils.net_utils._rtp_receiver import RTPReceiver
+from juturna.utils.net_utils._rtp_receiver import RTPSession
+from juturna.utils.net_utils._udp_fragments import FRAGMENT_HEADER
+from juturna.utils.net_utils._udp_fragments import fragment
+from juturna.utils.net_utils._udp_fragments import FragmentReassembler
+from juturna.utils.net_utils._udp_fragments import FragmentReceiver
 
 
-__all__ = ['get_available_port', 'RTPDatagram', 'RTPClient']
+__all__ = [
+    'get_available_port',
+    'RTP_HEADER',
+    'RTPDatagram',
+    'RTPClient',
+    'Reactor',
+    'JitterBuffer',
+    'RTPReceiver',
+    'RTPSession',
+    'FRAGMENT_HEADER',
+    'fragment',
+    'FragmentReassembler',
+    'FragmentReceiver',
+]
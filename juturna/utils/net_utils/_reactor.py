@@ -0,0 +1,214 @@
+import contextlib
+import selectors
+import socket
+import threading
+import time
+
+from collections.abc import Callable
+
+from juturna.utils.log_utils import jt_logger
+
+
+_logger = jt_logger()
+
+
+class Reactor:
+    """
+    Multiplex the readiness of any number of file objects (pipes, sockets) on
+    a single thread. Sources register a read callback for each of their file
+    objects instead of blocking a thread on them, and can also register
+    periodic timers. Callbacks run on the reactor thread, so they must consume
+    the available data and return without blocking. The reactor thread runs
+    as long as at least one reader or timer is registered.
+    """
+
+    _shared: 'Reactor | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._thread: threading.Thread | None = None
+        self._running: selectors.SelectorKey | None = None
+
+        # callback -> interval, next deadline
+        self._timers: dict[Callable, list[float]] = dict()
+
+        # wakes the thread up when readers or timers change
+        self._wakeup, self._notify = socket.socketpair()
+        self._wakeup.setblocking(False)
+        self._notify.setblocking(False)
+        self._selector.register(self._wakeup, selectors.EVENT_READ)
+
+    @classmethod
+    def shared(cls) -> 'Reactor':
+        """The reactor shared by every source of the process"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+
+        return cls._shared
+
+    def __len__(self) -> int:
+        return len(self._selector.get_map()) - 1
+
+    def add_reader(self, fileobj, callback: Callable[[], None]):
+        """
+        Start watching a file object, and call a function whenever it is
+        readable. Once the file object reaches its end, the callback should
+        remove it.
+
+        Parameters
+        ----------
+        fileobj : Any
+            A file object with a ``fileno`` method, or a file descriptor.
+        callback : Callable[[], None]
+            Function called with no arguments when the file object is
+            readable.
+
+        """
+        with self._lock:
+            self._selector.register(fileobj, selectors.EVENT_READ, callback)
+            self._wake(start=True)
+
+    def remove_reader(self, fileobj) -> bool:
+        """
+        Stop watching a file object. When called outside the reactor thread,
+        this waits for a running callback of the file object to return, so
+        that the file object can be safely closed afterwards.
+
+        Parameters
+        ----------
+        fileobj : Any
+            The file object to stop watching.
+
+        Returns
+        -------
+        bool
+            Whether the file object was being watched.
+
+        """
+        with self._lock:
+            try:
+                key = self._selector.unregister(fileobj)
+            except (KeyError, ValueError):
+                return False
+
+            if threading.current_thread() is not self._thread:
+                self._idle.wait_for(lambda: self._running is not key)
+
+            self._wake()
+
+        return True
+
+    def add_timer(self, callback: Callable[[], None], interval: float):
+        """
+        Call a function periodically on the reactor thread.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            Function called with no arguments.
+        interval : float
+            Interval between two calls, in seconds.
+
+        """
+        with self._lock:
+            self._timers[callback] = [interval, time.monotonic() + interval]
+            self._wake(start=True)
+
+    def remove_timer(self, callback: Callable[[], None]):
+        """
+        Stop calling a periodic function.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            The function to stop calling.
+
+        """
+        with self._lock:
+            self._timers.pop(callback, None)
+            self._wake()
+
+    def _wake(self, start: bool = False):
+        if self._thread is None:
+            if start:
+                self._thread = threading.Thread(
+                    name='_reactor', target=self._run, daemon=True
+                )
+
+                self._thread.start()
+
+            return
+
+        # a full socket means a wake up is already pending
+        with contextlib.suppress(BlockingIOError):
+            self._notify.send(b'\0')
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if len(self) == 0 and not self._timers:
+                    self._thread = None
+
+                    return
+
+                deadline = min(
+                    (timer[1] for timer in self._timers.values()),
+                    default=None,
+                )
+
+            timeout = None if deadline is None else deadline - time.monotonic()
+
+            for key, _ in self._selector.select(timeout):
+                if key.fileobj is self._wakeup:
+                    self._drain_wakeup()
+                else:
+                    self._dispatch(key)
+
+            self._fire_timers()
+
+    def _dispatch(self, key: selectors.SelectorKey):
+        with self._lock:
+            # removed while the thread was selecting
+            if self._selector.get_map().get(key.fd) is not key:
+                return
+
+            self._running = key
+
+        try:
+            key.data()
+        except Exception as e:
+            _logger.error(f'reader {key.fileobj} failed, removing it: {e}')
+            self.remove_reader(key.fileobj)
+        finally:
+            with self._lock:
+                self._running = None
+                self._idle.notify_all()
+
+    def _fire_timers(self):
+        now = time.monotonic()
+
+        with self._lock:
+            due = [
+                callback
+                for callback, timer in self._timers.items()
+                if timer[1] <= now
+            ]
+
+            for callback in due:
+                timer = self._timers[callback]
+                timer[1] = max(timer[1] + timer[0], now)
+
+        for callback in due:
+            try:
+                callback()
+            except Exception as e:
+                _logger.error(f'timer {callback} failed: {e}')
+
+    def _drain_wakeup(self):
+        with contextlib.suppress(BlockingIOError):
+            while self._wakeup.recv(4096):
+                ...
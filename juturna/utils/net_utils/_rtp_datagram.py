@@ -2,6 +2,26 @@ import typing
 
 from struct import unpack
 
+import numpy as np
+
+
+# header fields of a batch of datagrams; offset and end delimit the payload
+# of every datagram within the parsed buffer
+RTP_HEADER = np.dtype(
+    [
+        ('valid', '?'),
+        ('version', 'u1'),
+        ('marker', '?'),
+        ('payload_type', 'u1'),
+        ('csrc_count', 'u1'),
+        ('sequence_number', 'u2'),
+        ('timestamp', 'u4'),
+        ('sync_source_id', 'u4'),
+        ('offset', 'i8'),
+        ('end', 'i8'),
+    ]
+)
+
 
 class RTPDatagram:
     """
@@ -46,21 +66,116 @@ class RTPDatagram:
         self.marker = (m_pt & 0b10000000) >> 7
         self.payload_type = m_pt & 0b01111111
 
-        i = 0
+        i = self.csrc_count * 4
 
-        for i in range(0, self.csrc_count, 4):
-            self.csrs.append(unpack('!I', data[12 + i : 16 + i]))
+        self.csrs = list(unpack(f'!{self.csrc_count}I', data[12 : 12 + i]))
 
         if self.extension:
-            i = self.csrc_count * 4
             (self.extension_header_id, self.extension_header_len) = unpack(
                 '!HH', data[12 + i : 16 + i]
             )
-            self.extension_header = data[
-                16 + i : 16 + i + self.extension_header_len
-            ]
 
-            i += 4 + self.extension_header_len
+            # the extension length counts 32-bit words
+            ext_bytes = 4 * self.extension_header_len
+            self.extension_header = data[16 + i : 16 + i + ext_bytes]
+
+            i += 4 + ext_bytes
+
+        end = len(data) - (data[-1] if self.padding else 0)
 
-        self.payload = data[12 + i :]
+        self.payload = data[12 + i : end]
         self.__datagram = data
+
+    @staticmethod
+    def parse_batch(
+        buffer: bytes | bytearray | memoryview | np.ndarray,
+        sizes: typing.Sequence[int] | np.ndarray,
+        offsets: typing.Sequence[int] | np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Parse the headers of many datagrams stored in a single buffer, with
+        no per-datagram objects. Datagrams can be packed one after the other,
+        or stored at given offsets (for instance, in the fixed-size slots of a
+        receive buffer).
+
+        Parameters
+        ----------
+        buffer : bytes | bytearray | memoryview | np.ndarray
+            The contiguous buffer holding the datagrams.
+        sizes : Sequence[int] | np.ndarray
+            Size of every datagram, in bytes.
+        offsets : Sequence[int] | np.ndarray | None
+            Position of every datagram in the buffer. If None, datagrams are
+            expected to be packed.
+
+        Returns
+        -------
+        np.ndarray
+            Header fields of every datagram, as a structured array with the
+            ``RTP_HEADER`` dtype. Datagrams that are not valid RTP version 2
+            packets are flagged as not valid, and their other fields are
+            meaningless.
+
+        """
+        data = np.frombuffer(buffer, dtype=np.uint8).ravel()
+        sizes = np.asarray(sizes, dtype=np.int64)
+        starts = (
+            np.cumsum(sizes) - sizes
+            if offsets is None
+            else np.asarray(offsets, dtype=np.int64)
+        )
+
+        headers = np.zeros(len(sizes), RTP_HEADER)
+
+        if not len(sizes) or not len(data):
+            return headers
+
+        # reads past the buffer end only happen for invalid datagrams
+        last = len(data) - 1
+        fixed = data[np.minimum(starts[:, None] + _FIXED_RANGE, last)].view(
+            _FIXED_HEADER
+        )[:, 0]
+
+        first = fixed['first'].astype(np.int64)
+        second = fixed['second']
+
+        offset = starts + 12 + 4 * (first & 0x0F)
+        ext_at = np.minimum(offset[:, None] + _EXT_LEN_RANGE, last)
+        ext_len = data[ext_at].view('>u2')[:, 0].astype(np.int64)
+        offset += np.where(first & 0x10, 4 + 4 * ext_len, 0)
+
+        end = starts + sizes
+        end -= np.where(first & 0x20, data[np.clip(end - 1, 0, last)], 0)
+
+        headers['version'] = first >> 6
+        headers['marker'] = second >> 7
+        headers['payload_type'] = second & 0x7F
+        headers['csrc_count'] = first & 0x0F
+        headers['sequence_number'] = fixed['sequence_number']
+        headers['timestamp'] = fixed['timestamp']
+        headers['sync_source_id'] = fixed['sync_source_id']
+        headers['offset'] = offset
+        headers['end'] = end
+        headers['valid'] = (
+            (first >> 6 == 2)
+            & (sizes >= 12)
+            & (offset <= end)
+            & (starts + sizes <= len(data))
+        )
+
+        return headers
+
+
+# the 12 bytes every RTP datagram starts with, as stored on the wire
+_FIXED_HEADER = np.dtype(
+    [
+        ('first', 'u1'),
+        ('second', 'u1'),
+        ('sequence_number', '>u2'),
+        ('timestamp', '>u4'),
+        ('sync_source_id', '>u4'),
+    ]
+)
+
+_FIXED_RANGE = np.arange(12)
+_EXT_LEN_RANGE = np.arange(2, 4)
@@ -0,0 +1,467 @@
+import functools
+import socket
+import threading
+import time
+
+from collections.abc import Callable
+
+import numpy as np
+
+from juturna.utils.audio_utils import decode_alaw
+from juturna.utils.audio_utils import decode_ulaw
+from juturna.utils.log_utils import jt_logger
+from juturna.utils.net_utils._rtp_datagram import RTPDatagram
+from juturna.utils.net_utils._reactor import Reactor
+
+
+_logger = jt_logger()
+
+# sequence jumps larger than this are taken as a restart of the stream
+_MAX_DROPOUT = 3000
+
+_DECODERS = {
+    'L16': lambda data: np.frombuffer(data, dtype='>i2').astype(np.int16),
+    'PCMU': decode_ulaw,
+    'PCMA': decode_alaw,
+}
+
+_SAMPLE_BYTES = {'L16': 2, 'PCMU': 1, 'PCMA': 1}
+
+
+class JitterBuffer:
+    """
+    Reorder buffer for the packets of an RTP stream. Packets are released in
+    sequence order as soon as they are in order; when a packet is missing,
+    the following ones are held until the missing one arrives or the wait
+    exceeds the buffer delay, and it is then declared lost. The delay adapts
+    to the interarrival jitter of the stream (RFC 3550), so that it stays low
+    on steady networks.
+    """
+
+    def __init__(
+        self,
+        clock_rate: int,
+        min_delay: float = 0.01,
+        max_delay: float = 0.2,
+        max_packets: int = 512,
+    ):
+        """
+        Parameters
+        ----------
+        clock_rate : int
+            RTP clock rate of the stream.
+        min_delay : float
+            Minimum time, in seconds, packets wait for a missing one.
+        max_delay : float
+            Maximum time, in seconds, packets wait for a missing one.
+        max_packets : int
+            Maximum number of held packets. Once reached, missing packets are
+            declared lost without waiting.
+
+        """
+        self.clock_rate = clock_rate
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_packets = max_packets
+
+        # extended sequence -> timestamp, payload, arrival time
+        self._packets: dict[int, tuple[int, bytes, float]] = dict()
+        self._next: int | None = None
+        self._highest: int | None = None
+        self._last: tuple[int, float] | None = None
+
+        self.jitter = 0.0
+        self.received = 0
+        self.lost = 0
+        self.late = 0
+
+    def __len__(self) -> int:
+        return len(self._packets)
+
+    @property
+    def delay(self) -> float:
+        """Time, in seconds, packets currently wait for a missing one"""
+        return min(max(3 * self.jitter, self.min_delay), self.max_delay)
+
+    def reset(self):
+        """Forget every held packet and the stream state"""
+        self._packets.clear()
+        self._next = None
+        self._highest = None
+        self._last = None
+
+    def push(self, sequence: int, timestamp: int, payload: bytes, now: float):
+        """
+        Add a received packet.
+
+        Parameters
+        ----------
+        sequence : int
+            RTP sequence number.
+        timestamp : int
+            RTP timestamp.
+        payload : bytes
+            Packet payload.
+        now : float
+            Arrival time, in seconds (monotonic clock).
+
+        """
+        if self._highest is not None:
+            # sequence numbers are extended past their 16 bits
+            delta = ((sequence - self._highest + 0x8000) & 0xFFFF) - 0x8000
+
+            if abs(delta) > _MAX_DROPOUT:
+                self.reset()
+            else:
+                sequence = self._highest + delta
+
+        if self._highest is None:
+            self._next = sequence
+
+        self._highest = max(sequence, self._highest or sequence)
+
+        if sequence < self._next or sequence in self._packets:
+            self.late += 1
+
+            return
+
+        if self._last is not None:
+            # timestamps wrap around their 32 bits
+            elapsed = (timestamp - self._last[0]) & 0xFFFFFFFF
+            elapsed -= (elapsed >> 31) << 32
+            variation = abs(now - self._last[1] - elapsed / self.clock_rate)
+            self.jitter += (variation - self.jitter) / 16
+
+        self._last = (timestamp, now)
+        self._packets[sequence] = (timestamp, payload, now)
+        self.received += 1
+
+    def pop(self, now: float) -> list[tuple[int, bytes]]:
+        """
+        Release the packets that are ready to be consumed.
+
+        Parameters
+        ----------
+        now : float
+            Current time, in seconds (monotonic clock).
+
+        Returns
+        -------
+        list[tuple[int, bytes]]
+            Timestamp and payload of the released packets, in order.
+
+        """
+        released = list()
+
+        while self._packets:
+            packet = self._packets.pop(self._next, None)
+
+            if packet is not None:
+                released.append(packet[:2])
+                self._next += 1
+
+                continue
+
+            oldest = min(p[2] for p in self._packets.values())
+
+            if (
+                now - oldest < self.delay
+                and len(self._packets) < self.max_packets
+            ):
+                break
+
+            first = min(self._packets)
+            self.lost += first - self._next
+            self._next = first
+
+        return released
+
+
+class RTPSession:
+    """
+    An RTP audio stream received on a UDP port, with its jitter buffer and
+    decoder. Sessions are served by an ``RTPReceiver``, which calls the
+    session callback with the decoded audio, as interleaved 16-bit samples.
+    Lost packets are replaced with silence.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        callback: Callable[[np.ndarray], None],
+        host: str = '0.0.0.0',
+        encoding: str = 'PCMU',
+        clock_rate: int = 8000,
+        channels: int = 1,
+        payload_type: int | None = None,
+        min_delay: float = 0.01,
+        max_delay: float = 0.2,
+        max_gap: float = 1.0,
+        recv_buffer: int = 1 << 20,
+    ):
+        """
+        Parameters
+        ----------
+        port : int
+            Port to listen on.
+        callback : Callable[[np.ndarray], None]
+            Function receiving the decoded audio.
+        host : str
+            Address to listen on.
+        encoding : str
+            Audio encoding, one of ``L16``, ``PCMU`` and ``PCMA``.
+        clock_rate : int
+            RTP clock rate, which is the sampling rate of the audio.
+        channels : int
+            Number of interleaved audio channels.
+        payload_type : int | None
+            RTP payload type of the stream. If None, every payload type is
+            accepted.
+        min_delay : float
+            Minimum jitter buffer delay, in seconds.
+        max_delay : float
+            Maximum jitter buffer delay, in seconds.
+        max_gap : float
+            Longest gap, in seconds, filled with silence. Longer gaps are
+            taken as pauses of the stream.
+        recv_buffer : int
+            Size of the socket receive buffer, in bytes.
+
+        """
+        if encoding not in _DECODERS:
+            raise ValueError(f'unsupported encoding: {encoding}')
+
+        self.callback = callback
+        self.encoding = encoding
+        self.clock_rate = clock_rate
+        self.channels = channels
+        self.payload_type = payload_type
+        self.max_gap = int(max_gap * clock_rate)
+
+        self.jitter_buffer = JitterBuffer(clock_rate, min_delay, max_delay)
+        self.ssrc: int | None = None
+
+        self._decode = _DECODERS[encoding]
+        self._frame_bytes = _SAMPLE_BYTES[encoding] * channels
+        self._next_timestamp: int | None = None
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer)
+        self.socket.bind((host, port))
+        self.socket.setblocking(False)
+
+    def __repr__(self):
+        return f'<RTPSession {self.encoding} {self.address}>'
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self.socket.getsockname()
+
+    def close(self):
+        """Close the session socket"""
+        self.socket.close()
+
+    def push(self, packets: np.ndarray, sizes: np.ndarray, now: float):
+        """
+        Add a batch of received datagrams.
+
+        Parameters
+        ----------
+        packets : np.ndarray
+            Received datagrams, one per row.
+        sizes : np.ndarray
+            Size of every datagram.
+        now : float
+            Arrival time, in seconds (monotonic clock).
+
+        """
+        data = packets.reshape(-1)
+        headers = RTPDatagram.parse_batch(
+            data, sizes, np.arange(len(sizes)) * packets.shape[1]
+        )
+        accepted = headers['valid']
+
+        if self.payload_type is not None:
+            accepted &= headers['payload_type'] == self.payload_type
+
+        fields = zip(
+            *(
+                headers[field][accepted].tolist()
+                for field in ('sync_source_id', 'sequence_number', 'timestamp')
+            ),
+            headers['offset'][accepted].tolist(),
+            headers['end'][accepted].tolist(),
+            strict=True,
+        )
+
+        for ssrc, sequence, timestamp, start, end in fields:
+            # a new source restarts the stream
+            if ssrc != self.ssrc:
+                self.ssrc = ssrc
+                self.jitter_buffer.reset()
+                self._next_timestamp = None
+
+            self.jitter_buffer.push(
+                sequence, timestamp, data[start:end].tobytes(), now
+            )
+
+    def release(self, now: float):
+        """
+        Decode the packets released by the jitter buffer, and pass the audio
+        to the callback.
+
+        Parameters
+        ----------
+        now : float
+            Current time, in seconds (monotonic clock).
+
+        """
+        chunks = list()
+
+        for timestamp, payload in self.jitter_buffer.pop(now):
+            frames = len(payload) // self._frame_bytes
+
+            if self._next_timestamp is not None:
+                gap = (timestamp - self._next_timestamp) & 0xFFFFFFFF
+
+                if gap >> 31:
+                    # overlaps audio already released
+                    continue
+
+                if 0 < gap <= self.max_gap:
+                    chunks.append(np.zeros(gap * self.channels, np.int16))
+
+            chunks.append(self._decode(payload[: frames * self._frame_bytes]))
+            self._next_timestamp = (timestamp + frames) & 0xFFFFFFFF
+
+        if chunks:
+            self.callback(np.concatenate(chunks))
+
+
+class RTPReceiver:
+    """
+    Receive RTP sessions on any number of UDP ports, on the thread of a
+    ``Reactor``. Ready sockets are drained in batches into a preallocated
+    buffer, and the headers of every batch are parsed at once.
+    """
+
+    _shared: 'RTPReceiver | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        batch_size: int = 64,
+        slot_size: int = 2048,
+        tick: float = 0.005,
+        reactor: Reactor | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        batch_size : int
+            Maximum number of datagrams read from a socket at once.
+        slot_size : int
+            Maximum size of a datagram, in bytes.
+        tick : float
+            Interval, in seconds, at which jitter buffers are checked for
+            packets no longer worth waiting for.
+        reactor : Reactor | None
+            The reactor serving the sessions. If None, the shared reactor of
+            the process is used.
+
+        """
+        self.tick = tick
+        self.reactor = reactor or Reactor.shared()
+
+        self._packets = np.zeros((batch_size, slot_size), np.uint8)
+        self._sizes = np.zeros(batch_size, np.int64)
+
+        self._sessions: set[RTPSession] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'RTPReceiver':
+        """The receiver shared by every session of the process"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+
+        return cls._shared
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def add(self, session: RTPSession):
+        """
+        Start receiving a session.
+
+        Parameters
+        ----------
+        session : RTPSession
+            The session to receive.
+
+        """
+        with self._lock:
+            if not self._sessions:
+                self.reactor.add_timer(self._release, self.tick)
+
+            self._sessions.add(session)
+
+        self.reactor.add_reader(
+            session.socket, functools.partial(self._drain, session)
+        )
+
+    def remove(self, session: RTPSession):
+        """
+        Stop receiving a session.
+
+        Parameters
+        ----------
+        session : RTPSession
+            The session to stop receiving.
+
+        """
+        self.reactor.remove_reader(session.socket)
+
+        with self._lock:
+            if session not in self._sessions:
+                return
+
+            self._sessions.discard(session)
+
+            if not self._sessions:
+                self.reactor.remove_timer(self._release)
+
+    def _release(self):
+        now = time.monotonic()
+
+        for session in list(self._sessions):
+            try:
+                session.release(now)
+            except Exception as e:
+                _logger.error(f'{session} release failed: {e}')
+
+    def _drain(self, session: RTPSession):
+        now = time.monotonic()
+
+        while True:
+            count = 0
+
+            while count < len(self._sizes):
+                try:
+                    self._sizes[count] = session.socket.recv_into(
+                        self._packets[count]
+                    )
+                except (BlockingIOError, OSError):
+                    break
+
+                count += 1
+
+            if count:
+                session.push(self._packets[:count], self._sizes[:count], now)
+
+            if count < len(self._sizes):
+                break
+
+        # packets received in order need not wait for the next tick
+        session.release(now)
@@ -0,0 +1,257 @@
+import collections
+import socket
+import struct
+import time
+
+from collections.abc import Iterator
+
+
+# magic, version, flags, sequence, fragment, total fragments, message length,
+# fragment offset
+FRAGMENT_HEADER = struct.Struct('!2sBBIHHII')
+
+_MAGIC = b'JF'
+_VERSION = 1
+_MAX_FRAGMENTS = 0xFFFF
+
+
+def fragment(
+    data: bytes | bytearray | memoryview, sequence: int, payload_size: int
+) -> Iterator[tuple[bytes, memoryview]]:
+    """
+    Split an encoded message into datagram fragments. Fragments are produced
+    as a header and a view on the original data, so that they can be sent
+    with scatter-gather I/O without copying the data.
+
+    Parameters
+    ----------
+    data : bytes | bytearray | memoryview
+        The encoded message.
+    sequence : int
+        Sequence number of the message, wrapped to 32 bits.
+    payload_size : int
+        Maximum size of a datagram, header included.
+
+    Yields
+    ------
+    tuple[bytes, memoryview]
+        The header and the data of every fragment.
+
+    Raises
+    ------
+    ValueError
+        If the message needs more fragments than the header can count.
+
+    """
+    chunk = payload_size - FRAGMENT_HEADER.size
+
+    if chunk <= 0:
+        raise ValueError(f'payload size must exceed {FRAGMENT_HEADER.size}')
+
+    view = memoryview(data).cast('B')
+    total = max((len(view) + chunk - 1) // chunk, 1)
+
+    if total > _MAX_FRAGMENTS:
+        raise ValueError(f'message needs {total} fragments, too many')
+
+    sequence &= 0xFFFFFFFF
+
+    for idx in range(total):
+        offset = idx * chunk
+        header = FRAGMENT_HEADER.pack(
+            _MAGIC, _VERSION, 0, sequence, idx, total, len(view), offset
+        )
+
+        yield header, view[offset : offset + chunk]
+
+
+class FragmentReassembler:
+    """
+    Rebuild messages from their datagram fragments. Fragments can arrive in
+    any order and be duplicated; a message is complete once all its bytes
+    have been received. Incomplete messages are discarded when they are too
+    old, or when too many of them are pending.
+    """
+
+    def __init__(self, max_pending: int = 64, max_age: float = 5.0):
+        """
+        Parameters
+        ----------
+        max_pending : int
+            Maximum number of incomplete messages kept at the same time.
+        max_age : float
+            Time, in seconds, after which an incomplete message is discarded.
+
+        """
+        self.max_pending = max_pending
+        self.max_age = max_age
+
+        # sequence -> [buffer, missing fragments, first fragment time]
+        self._pending: dict[int, list] = dict()
+
+        # late duplicates of completed messages must not start new ones
+        self._recent = collections.deque(maxlen=max_pending)
+
+        self.completed = 0
+        self.discarded = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def push(self, datagram: bytes | bytearray | memoryview) -> bytes | None:
+        """
+        Add a fragment.
+
+        Parameters
+        ----------
+        datagram : bytes | bytearray | memoryview
+            A received datagram.
+
+        Returns
+        -------
+        bytes | None
+            The complete message, if the fragment was its last missing one.
+
+        Raises
+        ------
+        ValueError
+            If the datagram is not a valid fragment.
+
+        """
+        view = memoryview(datagram)
+
+        if len(view) < FRAGMENT_HEADER.size:
+            raise ValueError('datagram too short for a fragment header')
+
+        magic, version, _, sequence, idx, total, length, offset = (
+            FRAGMENT_HEADER.unpack_from(view)
+        )
+
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('datagram is not a fragment')
+
+        body = view[FRAGMENT_HEADER.size :]
+
+        if idx >= total or offset + len(body) > length:
+            raise ValueError('fragment out of the message bounds')
+
+        if total == 1:
+            self.completed += 1
+
+            return bytes(body)
+
+        now = time.monotonic()
+        entry = self._pending.get(sequence)
+
+        if entry is None and sequence in self._recent:
+            return None
+
+        if entry is None or len(entry[0]) != length:
+            self._evict(now)
+
+            entry = [bytearray(length), set(range(total)), now]
+            self._pending[sequence] = entry
+
+        if idx not in entry[1]:
+            return None
+
+        entry[0][offset : offset + len(body)] = body
+        entry[1].discard(idx)
+
+        if entry[1]:
+            return None
+
+        del self._pending[sequence]
+        self._recent.append(sequence)
+        self.completed += 1
+
+        return bytes(entry[0])
+
+    def _evict(self, now: float):
+        expired = [
+            s for s, e in self._pending.items() if now - e[2] > self.max_age
+        ]
+
+        for sequence in expired:
+            del self._pending[sequence]
+
+        # dictionaries keep insertion order, so the oldest messages go first
+        while len(self._pending) >= self.max_pending:
+            del self._pending[next(iter(self._pending))]
+            self.discarded += 1
+
+        self.discarded += len(expired)
+
+
+class FragmentReceiver:
+    """
+    Receive fragmented messages on a UDP socket. Datagrams are read into a
+    single preallocated buffer, and reassembled into complete messages.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        host: str = '0.0.0.0',
+        payload_size: int = 65507,
+        **kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        port : int
+            Port to listen on.
+        host : str
+            Address to listen on.
+        payload_size : int
+            Maximum size of a received datagram.
+        kwargs : dict
+            Reassembler arguments.
+
+        """
+        self.reassembler = FragmentReassembler(**kwargs)
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind((host, port))
+
+        self._buffer = bytearray(payload_size)
+        self._view = memoryview(self._buffer)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._socket.getsockname()
+
+    def receive(self, timeout: float | None = None) -> bytes | None:
+        """
+        Wait for the next complete message.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time to wait for a datagram, in seconds.
+
+        Returns
+        -------
+        bytes | None
+            The message, or None if no datagram arrived in time.
+
+        """
+        self._socket.settimeout(timeout)
+
+        while True:
+            try:
+                size = self._socket.recv_into(self._buffer)
+            except TimeoutError:
+                return None
+
+            try:
+                message = self.reassembler.push(self._view[:size])
+            except ValueError:
+                continue
+
+            if message is not None:
+                return message
+
+    def close(self):
+        """Close the receiving socket"""
+        self._socket.close()
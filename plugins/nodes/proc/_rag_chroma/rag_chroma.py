@@ -63,6 +63,9 @@ class RagChroma(Node[ObjectPayload, ObjectPayload]):
         self._collection = collection
         self._target = target
 
+        # results only depend on the queried text
+        self.cache_key = [target]
+
         self._client = None
         self._results = results
 
@@ -81,6 +84,10 @@ class RagChroma(Node[ObjectPayload, ObjectPayload]):
         if prop == 'results':
             self._results = value
 
+            # cached documents were queried with the old number of results
+            if self.cache is not None:
+                self.cache.clear()
+
     def start(self):
         """Start the node"""
         self._collection = self._client.get_collection(name=self._collection)
@@ -89,13 +96,7 @@ class RagChroma(Node[ObjectPayload, ObjectPayload]):
 
     def update(self, message: Message[ObjectPayload]):
         """Receive data from upstream, transmit data downstream"""
-        query = message.payload[self._target]
-
-        results = self._collection.query(
-            query_texts=[query], n_results=self._results
-        )
-
-        documents = results['documents'][0]
+        documents = self.memoise(message, lambda: self._query(message))
 
         to_send = Message[ObjectPayload](
             creator=self.name,
@@ -107,3 +108,11 @@ class RagChroma(Node[ObjectPayload, ObjectPayload]):
         to_send.payload['documents'] = documents
 
         self.transmit(to_send)
+
+    def _query(self, message: Message[ObjectPayload]) -> list:
+        results = self._collection.query(
+            query_texts=[message.payload[self._target]],
+            n_results=self._results,
+        )
+
+        return results['documents'][0]
@@ -12,6 +12,7 @@ from ultralytics import YOLO
 
 from juturna.components import Message
 from juturna.components import Node
+from juturna.names import PixelFormat
 
 from juturna.payloads import ImagePayload
 
@@ -26,6 +27,7 @@ class TrackerYolo(Node[ImagePayload, ImagePayload]):
         targets: list,
         confidence: float,
         half: bool,
+        target_latency: float = 0,
         **kwargs,
     ):
         """
@@ -41,6 +43,11 @@ class TrackerYolo(Node[ImagePayload, ImagePayload]):
             Minimum confidence to mark a positive.
         half : bool
             Enable half precision to speed up inference time.
+        target_latency : float
+            Target latency in seconds. When inference cannot keep up with the
+            incoming frames, frames are skipped to hold this latency, and
+            carry forward the last annotations. If 0, every frame is
+            processed.
         kwargs : dict
             Supernode arguments.
 
@@ -57,6 +64,9 @@ class TrackerYolo(Node[ImagePayload, ImagePayload]):
 
         self._model = None
         self._classes = None
+        self._last_results = None
+
+        self.shed_load(target_latency)
 
     def warmup(self):
         """Warmup the node"""
@@ -80,6 +90,7 @@ class TrackerYolo(Node[ImagePayload, ImagePayload]):
             half=self._half,
         )
 
+        self._last_results = results[0]
         annotated = results[0].plot()
 
         to_send = Message[ImagePayload](
@@ -90,7 +101,7 @@ class TrackerYolo(Node[ImagePayload, ImagePayload]):
                 width=annotated.shape[1],
                 height=annotated.shape[0],
                 depth=annotated.shape[2],
-                pixel_format=message.payload.pixel_format,
+                pixel_format=PixelFormat.BGR24,
                 timestamp=message.payload.timestamp,
             ),
             timers_from=message,
@@ -99,3 +110,32 @@ class TrackerYolo(Node[ImagePayload, ImagePayload]):
         to_send.meta['annotations'] = results[0]
 
         self.transmit(to_send)
+
+    def skip(self, message: Message[ImagePayload]):
+        """Forward a skipped frame, plotting the last annotations on it"""
+        image = message.payload.image
+        pixel_format = message.payload.pixel_format
+
+        # plotted images are BGR, whatever the input format
+        if self._last_results is not None:
+            image = self._last_results.plot(img=image)
+            pixel_format = PixelFormat.BGR24
+
+        to_send = Message[ImagePayload](
+            creator=self.name,
+            version=message.version,
+            payload=ImagePayload(
+                image=image,
+                width=image.shape[1],
+                height=image.shape[0],
+                depth=image.shape[2],
+                pixel_format=pixel_format,
+                timestamp=message.payload.timestamp,
+            ),
+            timers_from=message,
+        )
+
+        to_send.meta['annotations'] = self._last_results
+        to_send.meta['skipped'] = True
+
+        self.transmit(to_send)
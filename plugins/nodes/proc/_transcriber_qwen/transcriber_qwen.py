@@ -13,7 +13,6 @@ import tempfile
 import typing
 
 import soundfile as sf
-import numpy as np
 
 from nemo.collections.speechlm2 import SALM
 
@@ -24,6 +23,8 @@ from juturna.payloads import AudioPayload
 from juturna.payloads import ObjectPayload
 from juturna.payloads import Draft
 
+from juturna.utils.audio_utils import AudioRingBuffer
+
 
 class TranscriberQwen(Node[AudioPayload, ObjectPayload]):
     """Node implementation class"""
@@ -58,6 +59,7 @@ class TranscriberQwen(Node[AudioPayload, ObjectPayload]):
         )
 
         self._messages = collections.deque(maxlen=self._buffer_size)
+        self._speech = AudioRingBuffer(16000, grow=True)
 
     def configure(self):
         """Configure the node"""
@@ -103,15 +105,19 @@ class TranscriberQwen(Node[AudioPayload, ObjectPayload]):
 
             self.transmit(to_send)
             self._messages.clear()
+            self._speech.clear()
 
             self.logger.info(f'sent {to_send.version}')
 
             return
 
+        if len(self._messages) == self._buffer_size:
+            self._speech.discard(len(self._messages[0].payload.audio))
+
         self._messages.append(message)
+        self._speech.append(message.payload.audio)
 
-        speech = [m.payload.audio for m in self._messages]
-        speech = np.concatenate(speech)
+        speech = self._speech.window()
 
         prompt = {
             'role': 'user',
@@ -14,17 +14,171 @@ import collections
 import time
 import logging
 
+from dataclasses import dataclass, field
+
 import numpy as np
 
 from faster_whisper import WhisperModel
 
 from juturna.components import Message
 from juturna.components import Node
+from juturna.components import InferenceServer
+from juturna.components import FasterWhisperAdapter
 
 from juturna.payloads import AudioPayload
 from juturna.payloads import ObjectPayload
 from juturna.payloads import Draft
 
+from juturna.utils.audio_utils import AudioRingBuffer
+
+
+@dataclass
+class _StreamState:
+    """
+    Streaming transcription state for a single origin. Times are expressed in
+    stream seconds, counting all the audio received so far, and are only
+    mapped to absolute times when words are emitted.
+    """
+
+    rate: int = 16000
+    max_seconds: float = 30.0
+    audio: AudioRingBuffer = field(
+        default_factory=lambda: AudioRingBuffer(16000, grow=True)
+    )
+    start: float = 0.0
+    cursor: float = 0.0
+    timeline: list = field(default_factory=list)
+    committed: list = field(default_factory=list)
+    tentative: list = field(default_factory=list)
+
+    def append(self, message: Message[AudioPayload]):
+        """Buffer the message audio, and record where it sits in time"""
+        audio = message.payload.audio
+        segments = message.meta.get('speech_timestamps') or [
+            {'start_s': 0.0, 'end_s': len(audio) / self.rate}
+        ]
+        position = self.cursor
+
+        # speech clips are made of separate segments, each keeping its own
+        # absolute start time
+        for segment in segments:
+            duration = segment['end_s'] - segment['start_s']
+            self.timeline.append(
+                (position, message.payload.start + segment['start_s'], duration)
+            )
+            position += duration
+
+        self.audio.append(audio)
+        self.cursor += len(audio) / self.rate
+
+    def prompt(self, chars: int = 200) -> str:
+        """Text of the last committed words, used as decoding context"""
+        return ''.join(w['word'] for w in self.committed)[-chars:]
+
+    def insert(self, words: list) -> tuple[list, list]:
+        """
+        Commit the longest prefix on which the new hypothesis agrees with the
+        previous one, and trim the committed audio from the buffer.
+        """
+        last_end = self.committed[-1]['end'] if self.committed else 0.0
+        words = [
+            {
+                **w,
+                'start': self.start + w['start'],
+                'end': self.start + w['end'],
+            }
+            for w in words
+        ]
+        words = [w for w in words if w['start'] > last_end - 0.1]
+        words = self._drop_repeated(words, last_end)
+
+        commit = list()
+
+        for new, old in zip(words, self.tentative, strict=False):
+            if _normalise(new['word']) != _normalise(old['word']):
+                break
+
+            commit.append(new)
+
+        self.tentative = words[len(commit) :]
+
+        if self.cursor - self.start > self.max_seconds:
+            commit, self.tentative = words, list()
+
+        result = self._absolute(commit), self._absolute(self.tentative)
+
+        self._commit(commit)
+
+        if self.cursor - self.start > self.max_seconds:
+            self._trim(self.cursor - self.max_seconds / 2)
+
+        return result
+
+    def flush(self) -> list:
+        """Commit all the tentative words, and clear the buffer"""
+        commit, self.tentative = self.tentative, list()
+        result = self._absolute(commit)
+
+        self._commit(commit)
+        self._trim(self.cursor)
+
+        return result
+
+    def _commit(self, words: list):
+        # words are mapped to absolute times before calling this, as trimming
+        # drops the timeline of the committed audio
+        self.committed = (self.committed + words)[-50:]
+
+        if words:
+            self._trim(words[-1]['end'])
+
+    def _drop_repeated(self, words: list, last_end: float) -> list:
+        # whisper tends to repeat the last committed words at the start of
+        # the trimmed buffer
+        if not words or not self.committed or words[0]['start'] > last_end + 1:
+            return words
+
+        tail = [_normalise(w['word']) for w in self.committed]
+        head = [_normalise(w['word']) for w in words]
+
+        for size in range(min(5, len(tail), len(head)), 0, -1):
+            if tail[-size:] == head[:size]:
+                return words[size:]
+
+        return words
+
+    def _trim(self, until: float):
+        samples = int(round((until - self.start) * self.rate))
+
+        if samples <= 0:
+            return
+
+        self.audio.discard(samples)
+        self.start += samples / self.rate
+        self.timeline = [t for t in self.timeline if t[0] + t[2] > self.start]
+
+    def _absolute(self, words: list) -> list:
+        return [
+            {
+                'word': w['word'],
+                'start': self._to_absolute(w['start']),
+                'end': self._to_absolute(w['end']),
+                'probability': w['probability'],
+            }
+            for w in words
+        ]
+
+    def _to_absolute(self, t: float) -> float:
+        for position, absolute, duration in reversed(self.timeline):
+            if t >= position:
+                return absolute + min(t - position, duration)
+
+        return self.timeline[0][1] if self.timeline else t
+
+
+def _normalise(word: str) -> str:
+    return word.strip().lower().strip('.,!?;:')
+
 
 class TranscriberWhispy(Node[AudioPayload, ObjectPayload]):
     """Node implementation class"""
@@ -39,6 +193,8 @@ class TranscriberWhispy(Node[AudioPayload, ObjectPayload]):
         device: str,
         word_timestamps: bool = True,
         without_timestamps: bool = False,
+        streaming: bool = False,
+        shared_inference: bool = False,
         **kwargs,
     ):
         """
@@ -60,6 +216,15 @@ class TranscriberWhispy(Node[AudioPayload, ObjectPayload]):
             Whether to generate timestamps during transcription.
         without_timestamps : bool
             Skip timestamp generation.
+        streaming : bool
+            Only transcribe the audio that was not committed yet. Words are
+            committed once two consecutive transcriptions agree on them, and
+            emitted under the transcript key, while the remaining words are
+            emitted under the tentative key. In streaming mode buffer_size is
+            ignored, and word timestamps are always generated.
+        shared_inference : bool
+            Run transcriptions on a model shared with every other node using
+            the same model and device, instead of loading a dedicated one.
         kwargs : dict
             Supernode arguments.
 
@@ -67,9 +232,25 @@ class TranscriberWhispy(Node[AudioPayload, ObjectPayload]):
         super().__init__(**kwargs)
 
         self._only_local = only_local
-        self._model = WhisperModel(
-            model_name, local_files_only=self._only_local, device=device
-        )
+        self._model = None
+        self._server = None
+
+        if shared_inference:
+            self._server = InferenceServer.shared(
+                f'faster-whisper:{model_name}:{device}',
+                lambda: FasterWhisperAdapter(
+                    WhisperModel(
+                        model_name,
+                        local_files_only=self._only_local,
+                        device=device,
+                    )
+                ),
+            )
+        else:
+            self._model = WhisperModel(
+                model_name, local_files_only=self._only_local, device=device
+            )
+
         self._model_name = model_name
         self._buffer_size = buffer_size
 
@@ -77,6 +258,7 @@ class TranscriberWhispy(Node[AudioPayload, ObjectPayload]):
         self._task = task
         self._word_timestamps = word_timestamps
         self._without_timestamps = without_timestamps
+        self._streaming = streaming
 
         # self._data = collections.deque(maxlen=buffer_size)
         self.logger.info(f'init sources: {self.origins}')
@@ -89,6 +271,10 @@ class TranscriberWhispy(Node[AudioPayload, ObjectPayload]):
         self._data = {
             k: collections.deque(maxlen=self._buffer_size) for k in self.origins
         }
+        self._speech = {
+            k: AudioRingBuffer(16000, grow=True) for k in self.origins
+        }
+        self._streams = {k: _StreamState() for k in self.origins}
 
         self.logger.info(f'warmup sources: {self.origins}')
 
@@ -107,6 +293,11 @@ class TranscriberWhispy(Node[AudioPayload, ObjectPayload]):
 
         to_send.meta['origin'] = origin
 
+        if self._streaming:
+            self._update_stream(message, to_send)
+
+            return
+
         if message.meta.get('silence', False):
             self.logger.info('silence detected, sending silence...')
             to_send.payload['transcript'] = list()
@@ -114,30 +305,33 @@ class TranscriberWhispy(Node[AudioPayload, ObjectPayload]):
 
             self.transmit(to_send)
             self._data[origin].clear()
+            self._speech[origin].clear()
 
             self.logger.info(f'sent {to_send.version}')
 
             return
 
         self.logger.info('transcribing audio content')
+        if len(self._data[origin]) == self._buffer_size:
+            evicted = self._data[origin][0]
+            self._speech[origin].discard(len(evicted.payload.audio))
+
         self._data[origin].append(message)
+        self._speech[origin].append(message.payload.audio)
 
-        speech = [m.payload.audio for m in self._data[origin]]
-        speech = np.concatenate(speech)
-
-        transcript, trx_info = self._model.transcribe(
-            speech,
-            language=self._language,
-            task=self._task,
-            word_timestamps=self._word_timestamps,
-            without_timestamps=self._without_timestamps,
-            condition_on_previous_text=False,
-            prompt_reset_on_temperature=True,
-            vad_filter=False,
-        )
+        speech = self._speech[origin].window()
 
         with to_send.timeit(self.name):
-            transcript = list(transcript)
+            transcript = self._transcribe(
+                speech,
+                language=self._language,
+                task=self._task,
+                word_timestamps=self._word_timestamps,
+                without_timestamps=self._without_timestamps,
+                condition_on_previous_text=False,
+                prompt_reset_on_temperature=True,
+                vad_filter=False,
+            )
 
         word_list = [
             {
@@ -162,6 +356,52 @@ class TranscriberWhispy(Node[AudioPayload, ObjectPayload]):
         self.transmit(to_send)
         self.logger.info(f'transmit: {to_send.version}')
 
+    def _update_stream(
+        self, message: Message[AudioPayload], to_send: Message[ObjectPayload]
+    ):
+        stream = self._streams[message.creator]
+
+        if message.meta.get('silence', False):
+            self.logger.info('silence detected, committing tentative words')
+            committed, tentative = stream.flush(), list()
+            to_send.timer(self.name, -1)
+        else:
+            stream.append(message)
+
+            with to_send.timeit(self.name):
+                transcript = self._transcribe(
+                    stream.audio.window(),
+                    language=self._language,
+                    task=self._task,
+                    word_timestamps=True,
+                    initial_prompt=stream.prompt() or None,
+                    condition_on_previous_text=False,
+                    prompt_reset_on_temperature=True,
+                    vad_filter=False,
+                )
+
+                words = [
+                    {
+                        'word': w.word,
+                        'start': float(w.start),
+                        'end': float(w.end),
+                        'probability': float(w.probability),
+                    }
+                    for segment in transcript
+                    for w in segment.words
+                ]
+
+            committed, tentative = stream.insert(words)
+
+        to_send.payload['transcript'] = committed
+        to_send.payload['tentative'] = tentative
+
+        self.transmit(to_send)
+        self.logger.info(
+            f'transmit: {to_send.version}, '
+            f'{len(committed)} committed, {len(tentative)} tentative'
+        )
+
     @staticmethod
     def _rescale_trx_words(words, buffer):
         if not buffer or not words:
@@ -232,9 +472,23 @@ class TranscriberWhispy(Node[AudioPayload, ObjectPayload]):
         """Destroy the node"""
         self._release_model()
 
+    def _transcribe(self, audio: np.ndarray, **options) -> list:
+        if self._server is not None:
+            return self._server.infer(audio, **options)
+
+        segments, _ = self._model.transcribe(audio, **options)
+
+        return list(segments)
+
     def _release_model(self):
         self.logger.info(f'releasing model: {self._model_name}')
 
+        if self._server is not None:
+            self._server.release()
+            self._server = None
+
+            return
+
         if hasattr(self._model, 'model'):
             self.logger.info('purging model object...')
             # self._model.model.unload_model(to_cpu=True)
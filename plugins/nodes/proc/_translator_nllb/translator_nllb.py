@@ -79,7 +79,10 @@ class TranslatorNllb(Node[ObjectPayload, ObjectPayload]):
         self._max_length = max_length
         self._buffer_length = buffer_length
 
-        self._buffer = collections.deque(maxlen=buffer_length)
+        # translations only depend on the buffered texts
+        self.cache_key = ['suggestion']
+
+        self._messages = collections.deque(maxlen=buffer_length)
 
         logging.getLogger('transformers').setLevel(logging.ERROR)
 
@@ -126,21 +129,26 @@ class TranslatorNllb(Node[ObjectPayload, ObjectPayload]):
 
     def update(self, message: Message[ObjectPayload]):
         """Receive data from upstream, transmit data downstream"""
-        self._buffer.append(message)
+        self._messages.append(message)
 
-        if len(self._buffer) < self._buffer_length:
+        if len(self._messages) < self._buffer_length:
             return
 
-        content = ' '.join([m.payload['suggestion'] for m in self._buffer])
-        ids = [m.version for m in self._buffer]
+        messages = list(self._messages)
+        content = ' '.join([m.payload['suggestion'] for m in messages])
+        ids = [m.version for m in messages]
 
         self.logger.info(f'original   : {content or "<SILENCE>"}')
-        self._buffer.clear()
+        self._messages.clear()
 
         if content.isspace():
             return
 
-        translation = self._translator([content])[0]['translation_text']
+        translation = self.memoise(
+            message,
+            lambda: self._translator([content])[0]['translation_text'],
+            payloads=[m.payload for m in messages],
+        )
 
         self.logger.info(f'translation: {translation}')
 
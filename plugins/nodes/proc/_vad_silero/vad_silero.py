@@ -8,6 +8,8 @@ Use the Silero VAD model to perform voice activity detection on audio content.
 Find the model here: https://github.com/snakers4/silero-vad
 """
 
+import warnings
+
 from collections import deque
 
 import silero_vad
@@ -20,6 +22,8 @@ from juturna.components import Node
 from juturna.payloads import Draft
 from juturna.payloads import AudioPayload
 
+from juturna.utils.audio_utils import AudioRingBuffer
+
 
 class VadSilero(Node[AudioPayload, AudioPayload]):
     """Node implementation class"""
@@ -34,6 +38,7 @@ class VadSilero(Node[AudioPayload, AudioPayload]):
         min_silence_duration_ms: int,
         speech_pad_ms: int,
         keep: int,
+        streaming: bool = False,
         **kwargs,
     ):
         """
@@ -58,6 +63,11 @@ class VadSilero(Node[AudioPayload, AudioPayload]):
             Pad final speech chunks with this quantity.
         keep : int
             How many audio chunks to keep to perform voice activity detection.
+        streaming : bool
+            Carry the model state across chunks, so that every sample is only
+            analysed once, and emit speech segments as they are detected. In
+            streaming mode keep, min_speech_duration_ms and
+            max_speech_duration_s are ignored.
         **kwargs:
             Supernode arguments.
 
@@ -74,19 +84,39 @@ class VadSilero(Node[AudioPayload, AudioPayload]):
         self._min_silence_duration_ms = min_silence_duration_ms
         self._speech_pad_ms = speech_pad_ms
         self._keep = keep
-
-        self._data = deque(maxlen=self._keep)
+        self._streaming = streaming
+
+        self._lengths = deque(maxlen=self._keep)
+        self._audio = AudioRingBuffer(self._rate, grow=True)
+
+        self._iterator = None
+        self._window = 512 if self._rate == 16000 else 256
+        self._processed = 0
+        self._speech_active = False
+
+        if self._streaming:
+            self._iterator = silero_vad.VADIterator(
+                self._model,
+                threshold=self._threshold,
+                sampling_rate=self._rate,
+                min_silence_duration_ms=self._min_silence_duration_ms,
+                speech_pad_ms=self._speech_pad_ms,
+            )
 
     def update(self, message: Message[AudioPayload]):
         """Update the node"""
-        assert isinstance(self._data, deque)
+        assert isinstance(self._lengths, deque)
         self.logger.info(f'receive: {message.version}')
 
-        self._data.append(message)
+        if self._streaming:
+            lag = len(self._audio) / self._rate
+            waveform = self._accumulate_stream(message.payload.audio)
+            run_vad = self._stream_vad
+        else:
+            waveform = self._accumulate(message.payload.audio)
+            run_vad = self._run_vad
 
-        waveform = [m.payload.audio for m in self._data]
-        waveform = np.concatenate(waveform)
-        version = self._data[-1].version
+        version = message.version
 
         to_send = Message[AudioPayload](
             creator=self.name,
@@ -101,14 +131,23 @@ class VadSilero(Node[AudioPayload, AudioPayload]):
         to_send.meta['sequence_number'] = version
         to_send.meta['original_audio'] = waveform
 
+        if self._streaming:
+            # processed samples start with those left over by the previous
+            # chunk, and are only closed by a whole model window
+            start = message.payload.start - lag
+
+            to_send.payload.start = start
+            to_send.payload.end = start + len(waveform) / self._rate
+
         with to_send.timeit(self.name):
-            speech_timestamps, clip, duration_after_vad = self._run_vad(
-                waveform
-            )
+            speech_timestamps, clip, duration_after_vad = run_vad(waveform)
 
         to_send.payload.audio = clip
         to_send.meta['duration_after_vad'] = duration_after_vad
 
+        if self._streaming:
+            to_send.meta['speech_active'] = self._speech_active
+
         if duration_after_vad == 0.0:
             to_send.meta['silence'] = True
 
@@ -124,14 +163,94 @@ class VadSilero(Node[AudioPayload, AudioPayload]):
 
     def destroy(self):
         """Destroy the node"""
-        self._data = None
+        self._lengths = None
+        self._audio = None
+        self._iterator = None
+
+    def _accumulate(self, audio: np.ndarray) -> np.ndarray:
+        if self._keep == 1:
+            return audio
+
+        if len(self._lengths) == self._keep:
+            self._audio.discard(self._lengths[0])
+
+        self._lengths.append(len(audio))
+        self._audio.append(audio)
+
+        # the ring window is only valid until the next append, while the
+        # waveform is also sent downstream
+        return self._audio.window().copy()
+
+    def _accumulate_stream(self, audio: np.ndarray) -> np.ndarray:
+        # samples that do not fill a whole model window wait for the next
+        # chunk in the ring buffer
+        self._audio.append(audio)
+
+        return self._audio.pop(
+            len(self._audio) - len(self._audio) % self._window
+        )
+
+    def _stream_vad(self, audio: np.ndarray) -> tuple:
+        offset = self._processed
+        limit = offset + len(audio)
+        self._processed = limit
+
+        wav = torch.from_numpy(audio).to(self._device)
+
+        # segment boundaries are clamped to the samples being processed, so
+        # that emitted segments never need to be revised later
+        spans = list()
+        start = offset if self._speech_active else None
+
+        for idx in range(0, len(audio), self._window):
+            event = self._iterator(wav[idx : idx + self._window])
+
+            if not event:
+                continue
+
+            if 'start' in event:
+                start = max(event['start'], spans[-1][1] if spans else offset)
+
+            if 'end' in event and start is not None:
+                spans.append((start, min(event['end'], limit)))
+                start = None
+
+        self._speech_active = start is not None
+
+        if self._speech_active:
+            spans.append((start, limit))
+
+        speech_ts = [
+            {
+                'start': s - offset,
+                'end': e - offset,
+                'start_s': (s - offset) / self._rate,
+                'end_s': (e - offset) / self._rate,
+            }
+            for s, e in spans
+            if e > s
+        ]
+
+        if len(speech_ts) > 0:
+            clipped_audio = np.concatenate(
+                [audio[ts['start'] : ts['end']] for ts in speech_ts]
+            )
+        else:
+            clipped_audio = np.ndarray(0, dtype=np.float32)
+
+        return speech_ts, clipped_audio, clipped_audio.shape[0] / self._rate
 
     def _run_vad(self, audio: np.ndarray) -> tuple:
-        if self._device == 'cuda':
-            audio = torch.from_numpy(audio).to('cuda')
+        # silero never writes into its input, so read-only payload arrays can
+        # be wrapped without copying them
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            wav = torch.from_numpy(audio.astype(np.float32, copy=False))
+
+        wav = wav.to(self._device)
 
         speech_ts = silero_vad.get_speech_timestamps(
-            audio,
+            wav,
             self._model,
             threshold=self._threshold,
             sampling_rate=self._rate,
@@ -141,8 +260,6 @@ class VadSilero(Node[AudioPayload, AudioPayload]):
             speech_pad_ms=self._speech_pad_ms,
         )
 
-        wav = audio if self._device == 'cuda' else torch.from_numpy(audio)
-
         if len(speech_ts) > 0:
             clipped_audio = (
                 silero_vad.collect_chunks(tss=speech_ts, wav=wav).cpu().numpy()
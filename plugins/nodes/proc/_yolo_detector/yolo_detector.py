@@ -14,6 +14,8 @@ import numpy as np
 
 from juturna.components import Message
 from juturna.components import Node
+from juturna.components import InferenceServer
+from juturna.components import UltralyticsAdapter
 
 from juturna.payloads._payloads import ImagePayload
 
@@ -30,6 +32,8 @@ class YoloDetector(Node[ImagePayload, ImagePayload]):
         half: bool,
         plot: bool,
         warmup: list,
+        shared_inference: bool = False,
+        target_latency: float = 0,
         **kwargs,
     ):
         """
@@ -49,6 +53,14 @@ class YoloDetector(Node[ImagePayload, ImagePayload]):
             Whether to plot annotations on the image or not.
         warmup : list
             List of image sizes to use for warmup inferences.
+        shared_inference : bool
+            Run inference on a model shared with every other node using the
+            same model and device, batching requests from all of them.
+        target_latency : float
+            Target latency in seconds. When inference cannot keep up with the
+            incoming frames, frames are skipped to hold this latency, and
+            carry forward the last annotations. If 0, every frame is
+            processed.
         kwargs : dict
             Supernode arguments.
 
@@ -62,13 +74,25 @@ class YoloDetector(Node[ImagePayload, ImagePayload]):
         self._half = half
         self._plot = plot
         self._warmup = warmup
+        self._shared_inference = shared_inference
         self._model = None
+        self._server = None
         self._classes = None
+        self._last_results = None
+
+        self.shed_load(target_latency)
 
     def warmup(self):
         """Load model and run dummy inferences to speed up later processing"""
-        self._model = YOLO(self._model_name)
-        self._model.to(self._device)
+        if self._shared_inference:
+            self._server = InferenceServer.shared(
+                f'ultralytics:{self._model_name}:{self._device}',
+                lambda: UltralyticsAdapter(self._load_model()),
+            )
+            self._model = self._server.adapter.model
+        else:
+            self._model = self._load_model()
+
         self._classes = (
             [
                 {v: k for k, v in self._model.names.items()}[t]
@@ -80,10 +104,16 @@ class YoloDetector(Node[ImagePayload, ImagePayload]):
 
         for size in self._warmup:
             dummy_img = np.zeros((size, size, 3), dtype=np.uint8)
-            _ = self._model.predict(dummy_img, verbose=False, imgsz=size)
+            _ = self._predict(dummy_img, imgsz=size)
 
         self.logger.info('tracker ready')
 
+    def destroy(self):
+        """Release the shared inference server"""
+        if self._server is not None:
+            self._server.release()
+            self._server = None
+
     def update(self, message: Message[ImagePayload]):
         """Process an incoming message"""
         assert self._model is not None
@@ -103,27 +133,19 @@ class YoloDetector(Node[ImagePayload, ImagePayload]):
         )
 
         with to_send.timeit(self.name + '_image_preprocessing_numpy'):
-            if image.shape[2] == 4 and image_format == 'RGB':
-                normalized_image = image[
-                    :, :, 2::-1
-                ]  # remove alpha and convert RGB→BGR
-            elif image.shape[2] == 4:
-                normalized_image = image[:, :, :3]  # remove alpha only
-            elif image_format == 'RGB':
-                normalized_image = image[:, :, ::-1]  # only RGB→BGR
-            else:
-                normalized_image = image  # no modification
+            normalized_image = _normalize(image, image_format)
 
         with to_send.timeit(self.name + '_inference'):
-            results = self._model.predict(
+            results = self._predict(
                 normalized_image,
-                verbose=False,
                 classes=self._classes,
                 conf=self._confidence,
                 half=self._half,
                 imgsz=max(image.shape[0], image.shape[1]),
             )
 
+        self._last_results = results[0]
+
         annotated = None
         pixel_format = None
 
@@ -140,11 +162,75 @@ class YoloDetector(Node[ImagePayload, ImagePayload]):
             timestamp=message.payload.timestamp,
         )
 
-        if 'annotations' not in meta:
-            meta['annotations'] = {}
+        # annotations from upstream are shared with every other destination
+        # node, so they are extended into a new dictionary
+        meta['annotations'] = {
+            **meta.get('annotations', {}),
+            self.name: results[0],
+        }
+
+        to_send.meta = meta
+
+        self.transmit(to_send)
+
+    def skip(self, message: Message[ImagePayload]):
+        """Forward a skipped frame with the last annotations"""
+        image = message.payload.image
+        image_format = message.payload.pixel_format
+        meta = dict(message.meta)
+
+        if self._last_results is not None:
+            meta['annotations'] = {
+                **meta.get('annotations', {}),
+                self.name: self._last_results,
+            }
+
+        if self._plot and self._last_results is not None:
+            image = self._last_results.plot(img=_normalize(image, image_format))
+            image_format = 'BGR'
 
-        meta['annotations'][self.name] = results[0]
+        meta['skipped'] = True
 
+        to_send = Message[ImagePayload](
+            creator=self.name,
+            version=message.version,
+            payload=ImagePayload(
+                image=image,
+                width=image.shape[1],
+                height=image.shape[0],
+                depth=image.shape[2],
+                pixel_format=image_format,
+                timestamp=message.payload.timestamp,
+            ),
+            timers_from=message,
+        )
         to_send.meta = meta
 
         self.transmit(to_send)
+
+    def _load_model(self) -> YOLO:
+        model = YOLO(self._model_name)
+        model.to(self._device)
+
+        return model
+
+    def _predict(self, image: np.ndarray, **options) -> list:
+        # the shared model can only be used through its server, as other
+        # nodes may be running inference on it at the same time
+        if self._server is not None:
+            return [self._server.infer(image, **options)]
+
+        return self._model.predict(image, verbose=False, **options)
+
+
+def _normalize(image: np.ndarray, image_format: str) -> np.ndarray:
+    if image.shape[2] == 4 and image_format == 'RGB':
+        return image[:, :, 2::-1]  # remove alpha and convert RGB→BGR
+
+    if image.shape[2] == 4:
+        return image[:, :, :3]  # remove alpha only
+
+    if image_format == 'RGB':
+        return image[:, :, ::-1]  # only RGB→BGR
+
+    return image  # no modification
@@ -7,13 +7,28 @@ NotifierMongo
 Transmit messages to a Mongo endpoint.
 """
 
+import contextlib
+import dataclasses
+import queue
+import threading
+import time
+
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
 import pymongo
 
+from pymongo.errors import BulkWriteError
+
 from juturna.components import Message
 from juturna.components import Node
 
+from juturna.payloads import Batch
 from juturna.payloads import ObjectPayload
 
+from juturna.meta import JUTURNA_THREAD_JOIN_TIMEOUT
+
 
 class NotifierMongo(Node[ObjectPayload, None]):
     """Node implementation class"""
@@ -24,6 +39,10 @@ class NotifierMongo(Node[ObjectPayload, None]):
         database: str,
         collection: str,
         timeout: int,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_pending: int = 10000,
+        arrays: str = 'binary',
         **kwargs,
     ):
         """
@@ -37,19 +56,43 @@ class NotifierMongo(Node[ObjectPayload, None]):
             The destination collection.
         timeout : int
             The timeout before dropping a message transmission.
+        batch_size : int
+            Maximum number of messages written with a single insert.
+        flush_interval : float
+            Maximum time, in seconds, a message waits before being written.
+        max_pending : int
+            Maximum number of messages waiting to be written. Once reached,
+            the node stops processing messages until some are written.
+        arrays : str
+            How numpy arrays are stored: ``binary`` (raw bytes, with dtype and
+            shape), ``list`` (nested lists of numbers) or ``drop``.
         kwargs : dict
             Superclass arguments.
 
         """
         super().__init__(**kwargs)
 
+        if arrays not in _ARRAY_ENCODERS:
+            raise ValueError(f'unknown array encoding: {arrays}')
+
         self._endpoint = endpoint
         self._database = database
         self._collection = collection
         self._timeout = timeout
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._arrays = arrays
 
         self._client: pymongo.MongoClient | None = None
         self._db: pymongo.database.Database | None = None
+        self._cl: pymongo.collection.Collection | None = None
+
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._writer: threading.Thread | None = None
+
+        self.written = 0
+        self.failed = 0
+        self._stats_lock = threading.Lock()
 
     def warmup(self):
         """Warmup the node"""
@@ -59,17 +102,160 @@ class NotifierMongo(Node[ObjectPayload, None]):
 
         self.logger.info(f'[{self.name}] set to endpoint {self._endpoint}')
 
+    def start(self):
+        """Start the writer thread, then the node"""
+        if self._writer is None:
+            self._writer = threading.Thread(
+                name=f'_writer_{self.name}', target=self._write, daemon=True
+            )
+
+            self._writer.start()
+
+        super().start()
+
+    def stop(self):
+        """Stop the node, then the writer thread once pending data is written"""
+        super().stop()
+
+        if self._writer is None:
+            return
+
+        # a writer stuck on an unreachable endpoint is not waited for
+        with contextlib.suppress(queue.Full):
+            self._pending.put(None, timeout=JUTURNA_THREAD_JOIN_TIMEOUT)
+
+        self._writer.join(timeout=JUTURNA_THREAD_JOIN_TIMEOUT)
+
+        if self._writer.is_alive():
+            self.logger.warning(f'{self._writer.name} still writing, detached')
+
+        self._writer = None
+
     def update(self, message: Message[ObjectPayload]):
         """Receive a message, transmit a message"""
-        message = message.to_dict()
-        message['session_id'] = self.pipe_id
+        # synchronised batches are stored as one document per message
+        for received in _unpack(message):
+            try:
+                document = _document(
+                    received.to_dict(), _ARRAY_ENCODERS[self._arrays]
+                )
+            except TypeError as e:
+                self.logger.error(f'message not storable, dropping: {e}')
+                self._account(failed=1)
+
+                continue
 
-        with pymongo.timeout(self._timeout):
-            _ = self._cl.insert_one(message)
+            document['session_id'] = self.pipe_id
 
-            self.logger.info('message sent')
+            self._pending.put(document)
 
     def destroy(self):
         """Close the connection with mongo"""
         if self._client:
             self._client.close()
+
+    def _write(self):
+        stopping = False
+
+        while not stopping:
+            document = self._pending.get()
+
+            if document is None:
+                break
+
+            batch = [document]
+            deadline = time.monotonic() + self._flush_interval
+
+            while len(batch) < self._batch_size:
+                try:
+                    document = self._pending.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+
+                if document is None:
+                    stopping = True
+                    break
+
+                batch.append(document)
+
+            self._insert(batch)
+
+    def _insert(self, batch: list):
+        try:
+            # unordered inserts keep going past failed documents
+            with pymongo.timeout(self._timeout):
+                self._cl.insert_many(batch, ordered=False)
+
+            self._account(written=len(batch))
+        except BulkWriteError as e:
+            errors = len(e.details.get('writeErrors', []))
+
+            self._account(written=len(batch) - errors, failed=errors)
+            self.logger.warning(f'{errors} messages not written')
+        except Exception as e:
+            self._account(failed=len(batch))
+            self.logger.error(f'{len(batch)} messages not written: {e}')
+
+        self.logger.debug(f'{len(batch)} messages sent')
+
+    def _account(self, written: int = 0, failed: int = 0):
+        with self._stats_lock:
+            self.written += written
+            self.failed += failed
+
+
+def _unpack(message: Message) -> list[Message]:
+    if not isinstance(message.payload, Batch):
+        return [message]
+
+    return [m for b in message.payload.messages for m in _unpack(b)]
+
+
+def _binary_array(value: np.ndarray) -> dict:
+    return {
+        'dtype': value.dtype.str,
+        'shape': list(value.shape),
+        'data': np.ascontiguousarray(value).tobytes(),
+    }
+
+
+_ARRAY_ENCODERS = {
+    'binary': _binary_array,
+    'list': lambda value: value.tolist(),
+    'drop': lambda _: None,
+}
+
+
+def _document(value: Any, encode_array) -> Any:
+    # BSON only knows about basic types, so payloads, numpy values and
+    # read-only mappings are converted before insertion
+    if value is None or isinstance(value, bool | int | float | str | bytes):
+        return value
+
+    if isinstance(value, np.ndarray):
+        return encode_array(value)
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, Mapping):
+        return {str(k): _document(v, encode_array) for k, v in value.items()}
+
+    if dataclasses.is_dataclass(value):
+        return {
+            f.name: _document(getattr(value, f.name), encode_array)
+            for f in dataclasses.fields(value)
+        }
+
+    if isinstance(value, list | tuple | set):
+        return [_document(v, encode_array) for v in value]
+
+    if isinstance(value, bytearray | memoryview):
+        return bytes(value)
+
+    if isinstance(value, Message):
+        return _document(value.to_dict(), encode_array)
+
+    raise TypeError(f'cannot store {type(value).__name__} values')
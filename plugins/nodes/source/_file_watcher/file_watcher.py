@@ -9,11 +9,12 @@ Watch a location on the filesystem, and fire desired events.
 
 This is a source node, it however does not set a source function. Internally,
 the node creates event handlers for the desired events to watch, and those
-handlers write directly on the node inbound queue.
+handlers hand events to a coalescer. Events are merged by path, and written on
+the node inbound queue once their paths are done changing.
 """
 
 import pathlib
-import queue
+import threading
 import typing
 
 from watchdog.events import FileSystemEvent
@@ -23,8 +24,11 @@ from watchdog.observers import Observer
 from juturna.components import Node
 from juturna.components import Message
 
+from juturna.payloads import Batch
 from juturna.payloads import ObjectPayload
 
+from juturna.utils.fs_utils import EventCoalescer
+
 
 class FileWatcher(Node[ObjectPayload, ObjectPayload]):
     """Node implementation class"""
@@ -37,6 +41,8 @@ class FileWatcher(Node[ObjectPayload, ObjectPayload]):
         ignore_directories: bool,
         ignore_updates: bool,
         ignore_deletions: bool,
+        debounce: float = 0.5,
+        batch_size: int = 32,
         **kwargs,
     ):
         """
@@ -54,6 +60,13 @@ class FileWatcher(Node[ObjectPayload, ObjectPayload]):
             Do not fire for updated files.
         ignore_deletions : bool
             Do not fire for deleted files
+        debounce : float
+            Time, in seconds, a path must be quiet before its events are
+            fired, merged into one. Files being written are only fired once
+            closed, or once their size is stable over this time.
+        batch_size : int
+            Maximum number of events fired together in a batch, when several
+            are ready at once. If lower than 2, events are fired one by one.
         kwargs : dict
             Supernode arguments.
 
@@ -61,12 +74,12 @@ class FileWatcher(Node[ObjectPayload, ObjectPayload]):
         super().__init__(**kwargs)
 
         self._location = location
+        self._coalescer = EventCoalescer(
+            debounce, batch_size=batch_size, updates=not ignore_updates
+        )
         self._handler = _Handler(
-            self.name,
-            self._queue,
-            self.logger,
+            self._coalescer,
             ignore_directories=ignore_directories,
-            ignore_updates=ignore_updates,
             ignore_deletions=ignore_deletions,
         )
 
@@ -75,6 +88,10 @@ class FileWatcher(Node[ObjectPayload, ObjectPayload]):
             self._handler, self._location, recursive=recursive
         )
 
+        self._flusher: threading.Thread | None = None
+        self._closing = threading.Event()
+        self._events = 0
+
     def configure(self):
         """Configure the node"""
         ...
@@ -89,6 +106,14 @@ class FileWatcher(Node[ObjectPayload, ObjectPayload]):
 
     def start(self):
         """Start the node"""
+        if self._flusher is None:
+            self._closing.clear()
+            self._flusher = threading.Thread(
+                name=f'_flusher_{self.name}', target=self._flush, daemon=True
+            )
+
+            self._flusher.start()
+
         # after custom start code, invoke base node start
         super().start()
 
@@ -102,6 +127,16 @@ class FileWatcher(Node[ObjectPayload, ObjectPayload]):
         self._observer.stop()
         self._observer.join()
 
+        if self._flusher is not None:
+            self._closing.set()
+            self._flusher.join()
+            self._flusher = None
+
+        self.logger.info(
+            f'{self._coalescer.received} events received, '
+            f'{self._coalescer.emitted} fired, {len(self._coalescer)} pending'
+        )
+
     def destroy(self):
         """Destroy the node"""
         ...
@@ -110,55 +145,69 @@ class FileWatcher(Node[ObjectPayload, ObjectPayload]):
         """Receive data from upstream, transmit data downstream"""
         self.transmit(message)
 
+    def _flush(self):
+        # events are checked a few times per debounce window
+        interval = max(self._coalescer.debounce / 4, 0.01)
+
+        while not self._closing.wait(interval):
+            for events in self._coalescer.poll():
+                self.put(self._new_message(events))
+
+    def _new_message(self, events: list[dict]) -> Message:
+        messages = tuple(
+            Message(creator=self.name, payload=ObjectPayload.from_dict(evt))
+            for evt in events
+        )
+
+        for message in messages:
+            message.version = self._events
+            self._events += 1
+
+        if len(messages) == 1:
+            return messages[0]
+
+        return Message(
+            creator=self.name,
+            version=messages[-1].version,
+            payload=Batch(messages=messages),
+        )
+
 
 class _Handler(PatternMatchingEventHandler):
     """File watcher for pattern matching"""
 
     def __init__(  # noqa
         self,
-        creator: str,
-        q: queue.Queue,
-        logger,
+        coalescer: EventCoalescer,
         ignore_directories: bool,
-        ignore_updates: bool,
         ignore_deletions: bool,
     ):
         super().__init__(ignore_directories=ignore_directories)
-        self._creator = creator
-        self._q = q
-        self._logger = logger
+        self._coalescer = coalescer
 
-        self._ignore_updates = ignore_updates
         self._ignore_deletions = ignore_deletions
 
-        self._events = 0
-
     def on_created(self, event: FileSystemEvent):
         """Catch creation events"""
-        self._q.put(self._new_message(event))
-
-        self._events += 1
+        self._coalescer.push(self._new_event(event))
 
     def on_deleted(self, event: FileSystemEvent):
         """Catch deletion events"""
         if not self._ignore_deletions:
-            self._q.put(self._new_message(event))
-
-            self._events += 1
+            self._coalescer.push(self._new_event(event))
 
     def on_modified(self, event: FileSystemEvent):
         """Catch update events"""
-        if not self._ignore_updates:
-            self._q.put(self._new_message(event))
+        # ignored updates still extend the window of pending creations
+        self._coalescer.push(self._new_event(event))
 
-            self._events += 1
+    def on_closed(self, event: FileSystemEvent):
+        """Catch events of files closed after writing"""
+        self._coalescer.push(self._new_event(event))
 
-    def _new_message(self, event: FileSystemEvent) -> Message[ObjectPayload]:
-        evt = event.__dict__
+    def _new_event(self, event: FileSystemEvent) -> dict:
+        evt = dict(event.__dict__)
         evt['src_path'] = pathlib.Path(evt['src_path']).resolve()
+        evt['event_type'] = event.event_type
 
-        return Message(
-            creator=self._creator,
-            version=self._events,
-            payload=ObjectPayload.from_dict(evt),
-        )
+        return evt
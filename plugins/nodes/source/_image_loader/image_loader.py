@@ -8,13 +8,21 @@ Watch a location on the filesystem and load images when available.
 
 This is a source node, it however does not set a source function. Internally,
 the node creates event handlers for the desired events to watch, and those
-handlers write directly on the node inbound queue.
+handlers hand events to a coalescer, that writes them on the node inbound
+queue once their files are complete. Images are decoded by a pool of workers,
+and transmitted in the order their events were received.
 """
 
+import math
 import pathlib
+import queue
+import threading
 import typing
 import time
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from PIL import UnidentifiedImageError
@@ -27,9 +35,12 @@ from watchdog.observers import Observer
 from juturna.components import Node
 from juturna.components import Message
 
+from juturna.payloads import Batch
 from juturna.payloads import ObjectPayload
 from juturna.payloads import ImagePayload
 
+from juturna.utils.fs_utils import EventCoalescer
+
 
 class ImageLoader(Node[ObjectPayload, ImagePayload]):
     """Node implementation class"""
@@ -43,6 +54,11 @@ class ImageLoader(Node[ObjectPayload, ImagePayload]):
         convert_rgb: bool,
         reduce_by: int,
         resize_by: list[int],
+        workers: int = 4,
+        max_pending: int = 64,
+        draft: bool = True,
+        debounce: float = 0.5,
+        batch_size: int = 32,
         **kwargs,
     ):
         """
@@ -63,6 +79,21 @@ class ImageLoader(Node[ObjectPayload, ImagePayload]):
             resizing factor is passed.
         resize_by : list[int]
             Desiderd dimensions of the output images.
+        workers : int
+            Number of images decoded at the same time.
+        max_pending : int
+            Number of images being decoded or waiting to be transmitted. When
+            reached, new events wait for a slot.
+        draft : bool
+            If true, JPEG images are decoded straight at the smallest scale
+            still larger than the output size, when reducing or resizing.
+        debounce : float
+            Time, in seconds, a file must be quiet before it is loaded. Files
+            being written are only loaded once closed, or once their size is
+            stable over this time.
+        batch_size : int
+            Maximum number of files queued together for loading, when several
+            are ready at once. If lower than 2, files are queued one by one.
         kwargs : dict
             Supernode arguments.
 
@@ -74,19 +105,26 @@ class ImageLoader(Node[ObjectPayload, ImagePayload]):
         self._convert_rgb = convert_rgb
         self._reduce_by = reduce_by
         self._resize_by = resize_by
+        self._workers = workers
+        self._draft = draft
+
+        # decoded images, as futures queued in the order of their events
+        self._pending: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._decoder: ThreadPoolExecutor | None = None
+        self._emitter: threading.Thread | None = None
 
-        self._handler = _Handler(
-            self._queue,
-            self.logger,
-            ignore_updates=ignore_updates,
-            patterns=patterns,
+        self._coalescer = EventCoalescer(
+            debounce, batch_size=batch_size, updates=not ignore_updates
         )
+        self._handler = _Handler(self._coalescer, patterns=patterns)
 
         self._observer = Observer()
         self._observer.schedule(
             self._handler, self._location, recursive=recursive
         )
 
+        self._flusher: threading.Thread | None = None
+        self._closing = threading.Event()
         self._sent = 0
 
     def configure(self):
@@ -103,6 +141,25 @@ class ImageLoader(Node[ObjectPayload, ImagePayload]):
 
     def start(self):
         """Start the node"""
+        if self._emitter is None:
+            self._decoder = ThreadPoolExecutor(
+                max_workers=self._workers,
+                thread_name_prefix=f'_decoder_{self.name}',
+            )
+            self._emitter = threading.Thread(
+                name=f'_emitter_{self.name}', target=self._emit, daemon=True
+            )
+
+            self._emitter.start()
+
+        if self._flusher is None:
+            self._closing.clear()
+            self._flusher = threading.Thread(
+                name=f'_flusher_{self.name}', target=self._flush, daemon=True
+            )
+
+            self._flusher.start()
+
         # after custom start code, invoke base node start
         super().start()
 
@@ -116,35 +173,93 @@ class ImageLoader(Node[ObjectPayload, ImagePayload]):
         self._observer.stop()
         self._observer.join()
 
+        if self._flusher is not None:
+            self._closing.set()
+            self._flusher.join()
+            self._flusher = None
+
+        self.logger.info(
+            f'{self._coalescer.received} events received, '
+            f'{self._coalescer.emitted} loaded, {len(self._coalescer)} pending'
+        )
+
+        # images already being decoded are still transmitted
+        if self._emitter is not None:
+            self._pending.put(None)
+            self._emitter.join()
+            self._decoder.shutdown()
+
+            self._emitter = None
+            self._decoder = None
+
     def destroy(self):
         """Destroy the node"""
         ...
 
-    def update(self, message: Message[ObjectPayload]):
-        """Receive data from upstream, transmit data downstream"""
-        try:
-            image = Image.open(message.payload['src_path'])
+    def update(self, message: Message[ObjectPayload | Batch]):
+        """Receive data from upstream, queue images for decoding"""
+        if isinstance(message.payload, Batch):
+            events = [m.payload for m in message.payload.messages]
+        else:
+            events = [message.payload]
+
+        # blocks while max_pending images are in flight
+        for event in events:
+            self._pending.put(self._decoder.submit(self._load, event.src_path))
+
+    def _flush(self):
+        # events are checked a few times per debounce window
+        interval = max(self._coalescer.debounce / 4, 0.01)
+
+        while not self._closing.wait(interval):
+            for events in self._coalescer.poll():
+                self.put(self._new_message(events))
+
+    def _new_message(self, events: list[dict]) -> Message:
+        messages = tuple(
+            Message(creator=self.name, payload=ObjectPayload.from_dict(evt))
+            for evt in events
+        )
 
-            if self._convert_rgb:
-                image = image.convert('RGB')
+        if len(messages) == 1:
+            return messages[0]
 
-            image.load()
-        except UnidentifiedImageError:
-            self.logger.warn(f'cannot load image {message.payload["src_path"]}')
+        return Message(creator=self.name, payload=Batch(messages=messages))
 
-            return
+    def _emit(self):
+        while (future := self._pending.get()) is not None:
+            to_send = self._result(future)
 
-        to_send = Message[ImagePayload](
-            creator=self.name,
-            version=self._sent,
-        )
+            if to_send is None:
+                continue
 
-        if self._resize_by[0] > 0:
-            with to_send.timeit(f'{self.name}_resize'):
-                image = image.resize(self._resize_by)
-        elif self._reduce_by > 0:
-            with to_send.timeit(f'{self.name}_reduce'):
-                image = image.reduce(self._reduce_by)
+            to_send.version = self._sent
+
+            self.transmit(to_send)
+
+            self._sent += 1
+
+    def _result(self, future: Future) -> Message[ImagePayload] | None:
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.error(f'image decoding failed: {e}')
+
+            return None
+
+    def _load(self, src_path: pathlib.Path) -> Message[ImagePayload] | None:
+        to_send = Message[ImagePayload](creator=self.name)
+
+        try:
+            with (
+                Image.open(src_path) as source,
+                to_send.timeit(f'{self.name}_decode'),
+            ):
+                image = self._decode(source)
+        except (UnidentifiedImageError, OSError):
+            self.logger.warning(f'cannot load image {src_path}')
+
+            return None
 
         image_arr = np.array(image)
 
@@ -152,41 +267,75 @@ class ImageLoader(Node[ObjectPayload, ImagePayload]):
             image=image_arr,
             width=image.width,
             height=image.height,
-            depth=image_arr.shape[2],
+            depth=image_arr.shape[2] if image_arr.ndim == 3 else 1,
             pixel_format=image.mode,
             timestamp=time.time(),
         )
 
-        to_send.meta['src_path'] = message.payload['src_path']
+        to_send.meta['src_path'] = src_path
+
+        return to_send
 
-        self.transmit(to_send)
+    def _decode(self, image: Image.Image) -> Image.Image:
+        width, height = image.size
+        mode = 'RGB' if self._convert_rgb else None
 
-        self._sent += 1
+        if self._resize_by[0] > 0:
+            size = tuple(self._resize_by)
+        elif self._reduce_by > 0:
+            size = (
+                math.ceil(width / self._reduce_by),
+                math.ceil(height / self._reduce_by),
+            )
+        else:
+            size = None
+
+        # JPEG decoders scale by 1/2, 1/4 or 1/8 while decoding, other
+        # formats ignore drafts
+        if size is not None and self._draft:
+            image.draft(mode, size)
+
+        if self._convert_rgb:
+            image = image.convert('RGB')
+
+        image.load()
+
+        if image.size == size or size is None:
+            return image
+
+        scale = round(width / image.width)
+
+        if self._resize_by[0] <= 0 and self._reduce_by % scale == 0:
+            return image.reduce(self._reduce_by // scale)
+
+        return image.resize(size)
 
 
 class _Handler(PatternMatchingEventHandler):
     """File watcher for pattern matching"""
 
     def __init__(  # noqa
-        self, q, logger, ignore_updates: bool, patterns: list
+        self, coalescer: EventCoalescer, patterns: list
     ):
         super().__init__(ignore_directories=True, patterns=patterns)
-        self._q = q
-        self._logger = logger
-
-        self._ignore_updates = ignore_updates
+        self._coalescer = coalescer
 
     def on_created(self, event: FileSystemEvent):
         """Catch creation events"""
-        self._q.put(self._new_message(event))
+        self._coalescer.push(self._new_event(event))
 
     def on_modified(self, event: FileSystemEvent):
         """Catch update events"""
-        if not self._ignore_updates:
-            self._q.put(self._new_message(event))
+        # ignored updates still extend the window of pending creations
+        self._coalescer.push(self._new_event(event))
+
+    def on_closed(self, event: FileSystemEvent):
+        """Catch events of files closed after writing"""
+        self._coalescer.push(self._new_event(event))
 
-    def _new_message(self, event: FileSystemEvent) -> Message[ObjectPayload]:
-        evt = event.__dict__
+    def _new_event(self, event: FileSystemEvent) -> dict:
+        evt = dict(event.__dict__)
         evt['src_path'] = pathlib.Path(evt['src_path']).resolve()
+        evt['event_type'] = event.event_type
 
-        return Message(payload=ObjectPayload.from_dict(evt))
+        return evt
@@ -0,0 +1,112 @@
+import av
+import numpy as np
+import pytest
+
+from juturna.nodes.source._audio_file.audio_file import AudioFile
+
+
+@pytest.fixture(scope='module')
+def audio_path(tmp_path_factory) -> str:
+    path = str(tmp_path_factory.mktemp('audio') / 'audio.wav')
+
+    # 2.5 seconds of stereo 44.1 kHz audio, a slow ramp on both channels
+    samples = np.linspace(-16000, 16000, 110250).astype(np.int16)
+    interleaved = np.repeat(samples, 2).reshape(1, -1)
+
+    with av.open(path, 'w') as container:
+        stream = container.add_stream('pcm_s16le', rate=44100, layout='stereo')
+
+        for pos in range(0, interleaved.shape[1], 4096):
+            frame = av.AudioFrame.from_ndarray(
+                np.ascontiguousarray(interleaved[:, pos : pos + 4096]),
+                format='s16',
+                layout='stereo',
+            )
+            frame.sample_rate = 44100
+
+            for packet in stream.encode(frame):
+                container.mux(packet)
+
+        for packet in stream.encode(None):
+            container.mux(packet)
+
+    return path
+
+
+def _read(audio_path: str, **kwargs) -> tuple[AudioFile, list]:
+    arguments = dict(
+        file_source=audio_path,
+        block_size=1,
+        audio_rate=16000,
+        node_name='audio_file',
+        pipe_name='test_pipe',
+    )
+
+    node = AudioFile(**(arguments | kwargs))
+    node.warmup()
+
+    return node, list(node._audio_chunks)
+
+
+def test_chunks(audio_path):
+    _, chunks = _read(audio_path)
+
+    assert [offset for _, offset in chunks] == [0, 16000, 32000]
+    assert all(chunk.shape == (16000,) for chunk, _ in chunks)
+    assert all(chunk.dtype == np.float32 for chunk, _ in chunks)
+
+    # the ramp rises through the file, and the last chunk is padded
+    audio = np.concatenate([chunk for chunk, _ in chunks])
+
+    assert audio[100] < -0.4 and audio[39900] > 0.4
+    assert not audio[40100:].any()
+
+
+def test_streaming_matches_full_decode(audio_path):
+    _, chunks = _read(audio_path)
+    node, streamed = _read(audio_path, streaming=True)
+
+    assert node._audio is None
+    assert [o for _, o in streamed] == [o for _, o in chunks]
+
+    for (chunk, _), (expected, _) in zip(streamed, chunks, strict=True):
+        np.testing.assert_allclose(chunk, expected, atol=1e-4)
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_cache(audio_path, tmp_path, streaming):
+    _, chunks = _read(audio_path, streaming=streaming, cache_dir=tmp_path)
+    cached = list(tmp_path.iterdir())
+
+    assert len(cached) == 1
+    assert cached[0].name.endswith('_16000_flt.pcm')
+
+    # the second run maps the cache instead of decoding the file
+    node, mapped = _read(audio_path, streaming=streaming, cache_dir=tmp_path)
+
+    assert isinstance(node._audio, np.memmap)
+
+    for (chunk, _), (expected, _) in zip(mapped, chunks, strict=True):
+        np.testing.assert_array_equal(chunk, expected)
+
+    # other rates are cached apart
+    _read(audio_path, audio_rate=8000, cache_dir=tmp_path)
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_interrupted_stream_is_not_cached(audio_path, tmp_path):
+    node = AudioFile(
+        audio_path,
+        1,
+        16000,
+        streaming=True,
+        cache_dir=tmp_path,
+        node_name='audio_file',
+        pipe_name='test_pipe',
+    )
+    node.warmup()
+    next(node._audio_chunks)
+    node.stop()
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,75 @@
+import pytest
+
+import numpy as np
+
+from juturna.utils.audio_utils import AudioRingBuffer
+
+
+def test_ring_buffer_append_window():
+    ring = AudioRingBuffer(8)
+
+    ring.append(np.arange(5))
+    ring.append(np.arange(5, 11))
+
+    assert len(ring) == 8
+    assert ring.dtype == np.float32
+    np.testing.assert_array_equal(ring.window(), np.arange(3, 11))
+    np.testing.assert_array_equal(ring.window(3), np.arange(8, 11))
+
+
+def test_ring_buffer_window_zero_copy():
+    ring = AudioRingBuffer(4)
+
+    for chunk in range(5):
+        ring.append(np.full(3, chunk))
+
+    window = ring.window()
+
+    assert window.flags.c_contiguous
+    assert not window.flags.writeable
+    assert np.shares_memory(window, ring.window())
+    np.testing.assert_array_equal(window, [3, 4, 4, 4])
+
+
+def test_ring_buffer_pop_discard():
+    ring = AudioRingBuffer(6, dtype=np.int16)
+
+    ring.append(np.arange(6))
+    popped = ring.pop(4)
+    ring.append(np.arange(6, 9))
+
+    np.testing.assert_array_equal(popped, np.arange(4))
+    assert popped.dtype == np.int16
+
+    ring.discard(2)
+
+    np.testing.assert_array_equal(ring.window(), np.arange(6, 9))
+
+    ring.clear()
+
+    assert len(ring) == 0
+    assert len(ring.window()) == 0
+
+
+def test_ring_buffer_grow():
+    ring = AudioRingBuffer(4, grow=True)
+
+    ring.append(np.arange(3))
+    ring.append(np.arange(3, 10))
+
+    assert ring.capacity == 16
+    np.testing.assert_array_equal(ring.window(), np.arange(10))
+
+
+def test_ring_buffer_windows():
+    ring = AudioRingBuffer(16)
+    ring.append(np.arange(9))
+
+    windows = [w.copy() for w in ring.windows(4, 2)]
+
+    assert len(windows) == 3
+    np.testing.assert_array_equal(windows[-1], np.arange(4, 8))
+    np.testing.assert_array_equal(ring.window(), np.arange(6, 9))
+
+    with pytest.raises(ValueError):
+        next(ring.windows(4, 0))
@@ -0,0 +1,146 @@
+import os
+
+import pytest
+
+from juturna.utils.fs_utils import EventCoalescer
+
+
+class _Files:
+    """Sizes of fake files, stat by the coalescer"""
+
+    def __init__(self):
+        self.sizes = dict()
+
+    def stat(self, path: str) -> os.stat_result:
+        if path not in self.sizes:
+            raise FileNotFoundError(path)
+
+        return os.stat_result((0,) * 6 + (self.sizes[path], 0, 0, 0))
+
+
+def _event(event_type: str, path: str) -> dict:
+    return {'event_type': event_type, 'src_path': path}
+
+
+def _released(batches: list) -> list:
+    return [(e['event_type'], e['src_path']) for b in batches for e in b]
+
+
+@pytest.fixture
+def files() -> _Files:
+    return _Files()
+
+
+def test_events_are_merged_by_path(files):
+    coalescer = EventCoalescer(1.0, stat=files.stat)
+    files.sizes['a'] = 10
+
+    coalescer.push(_event('created', 'a'), now=0.0)
+
+    for tick in range(20):
+        coalescer.push(_event('modified', 'a'), now=0.1 + tick * 0.01)
+
+    # nothing is released while the file keeps changing
+    assert coalescer.poll(now=0.5) == []
+    assert _released(coalescer.poll(now=1.5)) == [('created', 'a')]
+    assert (coalescer.received, coalescer.emitted) == (21, 1)
+    assert len(coalescer) == 0
+
+
+def test_growing_files_wait_for_a_stable_size(files):
+    coalescer = EventCoalescer(1.0, stat=files.stat)
+    files.sizes['a'] = 0
+
+    coalescer.push(_event('created', 'a'), now=0.0)
+    files.sizes['a'] = 100
+
+    # the size changed without events, another window is waited
+    assert coalescer.poll(now=1.0) == []
+    assert coalescer.poll(now=1.5) == []
+    assert _released(coalescer.poll(now=2.0)) == [('created', 'a')]
+
+
+def test_closed_files_are_released_at_once(files):
+    coalescer = EventCoalescer(10.0, stat=files.stat)
+    files.sizes['a'] = 0
+
+    coalescer.push(_event('created', 'a'), now=0.0)
+    files.sizes['a'] = 100
+    coalescer.push(_event('modified', 'a'), now=0.1)
+    coalescer.push(_event('closed', 'a'), now=0.2)
+
+    assert _released(coalescer.poll(now=0.3)) == [('created', 'a')]
+
+    # closes with nothing pending are ignored
+    coalescer.push(_event('closed', 'a'), now=0.4)
+
+    assert len(coalescer) == 0
+
+
+def test_deletions(files):
+    coalescer = EventCoalescer(1.0, stat=files.stat)
+    files.sizes['a'] = files.sizes['b'] = 10
+
+    # created and deleted in the window, nothing happened
+    coalescer.push(_event('created', 'a'), now=0.0)
+    coalescer.push(_event('deleted', 'a'), now=0.1)
+    coalescer.push(_event('modified', 'b'), now=0.0)
+    coalescer.push(_event('deleted', 'b'), now=0.1)
+    del files.sizes['a'], files.sizes['b']
+
+    assert _released(coalescer.poll(now=2.0)) == [('deleted', 'b')]
+
+
+def test_vanished_files_are_dropped(files):
+    coalescer = EventCoalescer(1.0, stat=files.stat)
+    files.sizes['a'] = 10
+
+    coalescer.push(_event('created', 'a'), now=0.0)
+    del files.sizes['a']
+
+    assert coalescer.poll(now=2.0) == []
+    assert len(coalescer) == 0
+
+
+def test_ignored_updates(files):
+    coalescer = EventCoalescer(1.0, updates=False, stat=files.stat)
+    files.sizes['a'] = files.sizes['b'] = 10
+
+    coalescer.push(_event('modified', 'a'), now=0.0)
+    coalescer.push(_event('created', 'b'), now=0.0)
+    coalescer.push(_event('modified', 'b'), now=0.9)
+
+    # modifications only extend the pending creation
+    assert coalescer.poll(now=1.5) == []
+    assert _released(coalescer.poll(now=2.0)) == [('created', 'b')]
+
+
+def test_storms_are_batched(files):
+    coalescer = EventCoalescer(1.0, batch_size=4, stat=files.stat)
+
+    for idx in range(10):
+        files.sizes[str(idx)] = 10
+        coalescer.push(_event('created', str(idx)), now=idx * 0.01)
+
+    batches = coalescer.poll(now=2.0)
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [e['src_path'] for b in batches for e in b] == [
+        str(idx) for idx in range(10)
+    ]
+    assert coalescer.batches == 3
+
+    # a single event is never batched
+    coalescer.push(_event('created', '0'), now=3.0)
+
+    assert [len(b) for b in coalescer.poll(now=5.0)] == [1]
+
+
+def test_flush(files):
+    coalescer = EventCoalescer(1.0, stat=files.stat)
+    files.sizes['a'] = 10
+
+    coalescer.push(_event('created', 'a'), now=0.0)
+
+    assert _released(coalescer.flush()) == [('created', 'a')]
+    assert coalescer.poll(now=2.0) == []
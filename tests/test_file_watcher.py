@@ -0,0 +1,118 @@
+import importlib.util
+import pathlib
+import threading
+import time
+
+import pytest
+
+from juturna.payloads import Batch
+
+
+pytest.importorskip('watchdog')
+
+_PLUGIN = pathlib.Path(
+    pathlib.Path(__file__).parent.parent,
+    'plugins/nodes/source/_file_watcher/file_watcher.py',
+)
+
+
+class _Collector:
+    def __init__(self):
+        self.messages = list()
+        self.arrived = threading.Event()
+
+    def put(self, message):
+        self.messages.append(message)
+        self.arrived.set()
+
+    def events(self) -> list:
+        events = list()
+
+        for message in self.messages:
+            if isinstance(message.payload, Batch):
+                events.extend(m.payload for m in message.payload.messages)
+            else:
+                events.append(message.payload)
+
+        return events
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    spec = importlib.util.spec_from_file_location('file_watcher', _PLUGIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    node = module.FileWatcher(
+        location=str(tmp_path),
+        pattern='*',
+        recursive=False,
+        ignore_directories=True,
+        ignore_updates=False,
+        ignore_deletions=False,
+        debounce=0.2,
+        batch_size=8,
+        node_name='file_watcher',
+        pipe_name='test_pipe',
+    )
+    node.add_destination('sink', _Collector())
+    node.start()
+
+    yield node
+
+    node.stop()
+
+
+def _wait_quiet(collector: _Collector, quiet: float = 1.0):
+    # wait until nothing has arrived for a while
+    while collector.arrived.wait(timeout=quiet):
+        collector.arrived.clear()
+
+
+def test_writes_are_coalesced(watcher, tmp_path):
+    collector = watcher._destinations['sink']
+
+    # a slow copy, in many small writes
+    with open(tmp_path / 'copy.bin', 'wb') as target:
+        for _ in range(20):
+            target.write(b'x' * 4096)
+            target.flush()
+            time.sleep(0.005)
+
+    _wait_quiet(collector)
+
+    events = collector.events()
+
+    assert [(e['event_type'], e['src_path'].name) for e in events] == [
+        ('created', 'copy.bin')
+    ]
+    assert watcher._coalescer.received > watcher._coalescer.emitted
+
+
+def test_storms_are_batched(watcher, tmp_path):
+    collector = watcher._destinations['sink']
+
+    for idx in range(20):
+        (tmp_path / f'{idx:02}.txt').write_text('content')
+
+    _wait_quiet(collector)
+
+    events = collector.events()
+
+    assert [e['src_path'].name for e in events] == [
+        f'{idx:02}.txt' for idx in range(20)
+    ]
+    assert len(collector.messages) < 20
+    assert any(isinstance(m.payload, Batch) for m in collector.messages)
+
+
+def test_created_and_deleted_files_are_not_fired(watcher, tmp_path):
+    collector = watcher._destinations['sink']
+
+    (tmp_path / 'short.txt').write_text('content')
+    (tmp_path / 'short.txt').unlink()
+    (tmp_path / 'long.txt').write_text('content')
+
+    _wait_quiet(collector)
+
+    assert [e['src_path'].name for e in collector.events()] == ['long.txt']
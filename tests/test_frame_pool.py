@@ -0,0 +1,72 @@
+import io
+import gc
+
+import numpy as np
+
+from juturna.components import FramePool
+from juturna.components import Message
+from juturna.payloads import ImagePayload
+
+
+def test_frame_pool_recycle():
+    pool = FramePool((4, 4, 3), size=2)
+
+    frame = pool.acquire()
+    frame[:] = 7
+
+    assert frame.shape == (4, 4, 3)
+    assert frame.dtype == np.uint8
+    assert pool.in_use == 1
+
+    del frame
+    gc.collect()
+
+    assert pool.in_use == 0
+
+    _ = pool.acquire()
+
+    assert pool.hits == 1
+    assert pool.misses == 1
+
+
+def test_frame_pool_derived_views_hold_slot():
+    pool = FramePool((4, 4, 3), size=1)
+
+    frame = pool.acquire()
+    message = Message(payload=ImagePayload(image=frame[:, :, ::-1]))
+    message._freeze()
+
+    del frame
+    gc.collect()
+
+    assert pool.in_use == 1
+
+    del message
+    gc.collect()
+
+    assert pool.in_use == 0
+
+
+def test_frame_pool_overflow():
+    pool = FramePool((2, 2), dtype=np.float32, size=1)
+
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert second.dtype == np.float32
+    assert not np.shares_memory(first, second)
+    assert pool.in_use == 1
+    assert pool.misses == 2
+
+
+def test_frame_pool_fill():
+    pool = FramePool((2, 2, 3), size=2)
+    stream = io.BufferedReader(
+        io.BytesIO(bytes(range(12)) + bytes(6)), buffer_size=5
+    )
+
+    frame = pool.fill(stream)
+
+    np.testing.assert_array_equal(frame.ravel(), np.arange(12))
+    assert pool.fill(stream) is None
+    assert pool.in_use == 1
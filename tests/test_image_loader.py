@@ -0,0 +1,170 @@
+import importlib.util
+import pathlib
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from juturna.components import Message
+from juturna.payloads import ObjectPayload
+
+
+Image = pytest.importorskip('PIL.Image')
+pytest.importorskip('watchdog')
+
+_PLUGIN = pathlib.Path(
+    pathlib.Path(__file__).parent.parent,
+    'plugins/nodes/source/_image_loader/image_loader.py',
+)
+
+
+class _Collector:
+    def __init__(self, expected: int):
+        self.messages = list()
+        self.expected = expected
+        self.done = threading.Event()
+
+    def put(self, message):
+        self.messages.append(message)
+
+        if len(self.messages) == self.expected:
+            self.done.set()
+
+
+@pytest.fixture
+def loader_class():
+    spec = importlib.util.spec_from_file_location('image_loader', _PLUGIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module.ImageLoader
+
+
+def _write(path: pathlib.Path, width: int, height: int, fmt: str = 'JPEG'):
+    rng = np.random.default_rng(width)
+    image = rng.integers(0, 255, (height // 8, width // 8, 3), np.uint8)
+
+    # smooth content, so that scaled decodes can be compared
+    Image.fromarray(image).resize((width, height)).save(path, fmt)
+
+
+def _load(loader_class, tmp_path, paths: list, expected: int, **kwargs):
+    arguments = dict(
+        location=str(tmp_path),
+        patterns=['*'],
+        recursive=False,
+        ignore_updates=True,
+        convert_rgb=True,
+        reduce_by=-1,
+        resize_by=[-1, -1],
+        node_name='image_loader',
+        pipe_name='test_pipe',
+    )
+
+    node = loader_class(**(arguments | kwargs))
+    node.add_destination('sink', _Collector(expected))
+    node.start()
+
+    for path in paths:
+        node.update(
+            Message(payload=ObjectPayload.from_dict({'src_path': path}))
+        )
+
+    assert node._destinations['sink'].done.wait(timeout=10)
+    node.stop()
+
+    return node._destinations['sink'].messages
+
+
+def test_order_is_preserved(loader_class, tmp_path):
+    # large and small images alternate, so decodes complete out of order
+    paths = list()
+
+    for idx in range(12):
+        paths.append(tmp_path / f'{idx:02}.jpg')
+        _write(paths[-1], 1600 if idx % 2 == 0 else 64, 48)
+
+    messages = _load(loader_class, tmp_path, paths, 12, workers=4)
+
+    assert [m.meta['src_path'] for m in messages] == paths
+    assert [m.version for m in messages] == list(range(12))
+
+
+def test_unreadable_images_are_skipped(loader_class, tmp_path):
+    paths = [tmp_path / 'a.jpg', tmp_path / 'b.txt', tmp_path / 'c.jpg']
+
+    _write(paths[0], 64, 48)
+    paths[1].write_text('not an image')
+    _write(paths[2], 64, 48)
+
+    messages = _load(loader_class, tmp_path, paths, 2)
+
+    assert [m.meta['src_path'] for m in messages] == [paths[0], paths[2]]
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'reduce_by': 4},
+        {'reduce_by': 3},
+        {'resize_by': [200, 150]},
+    ],
+)
+@pytest.mark.parametrize('fmt', ['JPEG', 'PNG'])
+def test_draft_matches_full_decode(loader_class, tmp_path, kwargs, fmt):
+    path = tmp_path / 'image'
+    _write(path, 800, 600, fmt)
+
+    (full,) = _load(loader_class, tmp_path, [path], 1, draft=False, **kwargs)
+    (drafted,) = _load(loader_class, tmp_path, [path], 1, **kwargs)
+
+    assert drafted.payload.image.shape == full.payload.image.shape
+    assert drafted.payload.image.dtype == np.uint8
+
+    difference = np.abs(
+        drafted.payload.image.astype(int) - full.payload.image.astype(int)
+    )
+
+    assert difference.mean() < 8
+
+
+def test_watched_images_are_loaded_once_complete(loader_class, tmp_path):
+    source = tmp_path / 'source'
+    target = tmp_path / 'watched'
+    source.mkdir()
+    target.mkdir()
+
+    _write(source / 'image.jpg', 640, 480)
+    content = (source / 'image.jpg').read_bytes()
+
+    node = loader_class(
+        location=str(target),
+        patterns=['*.jpg'],
+        recursive=False,
+        ignore_updates=True,
+        convert_rgb=True,
+        reduce_by=2,
+        resize_by=[-1, -1],
+        debounce=0.2,
+        node_name='image_loader',
+        pipe_name='test_pipe',
+    )
+    node.add_destination('sink', _Collector(1))
+    node.start()
+
+    # a slow copy, that cannot be decoded before it is complete
+    with open(target / 'image.jpg', 'wb') as copy:
+        for pos in range(0, len(content), 1024):
+            copy.write(content[pos : pos + 1024])
+            copy.flush()
+            time.sleep(0.002)
+
+    assert node._destinations['sink'].done.wait(timeout=10)
+    time.sleep(0.5)
+    node.stop()
+
+    (message,) = node._destinations['sink'].messages
+
+    assert message.payload.image.shape == (240, 320, 3)
+    assert node._coalescer.received > 1
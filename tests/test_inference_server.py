@@ -0,0 +1,200 @@
+import threading
+
+import pytest
+
+from juturna.components import InferenceServer
+from juturna.components import InferenceAdapter
+
+
+class _DoublingAdapter(InferenceAdapter):
+    def __init__(self):
+        super().__init__(model=None)
+        self.batches = list()
+
+    def predict(self, inputs: list, **options) -> list:
+        self.batches.append((list(inputs), options))
+
+        if options.get('fail'):
+            raise ValueError('inference failed')
+
+        return [x * options.get('factor', 2) for x in inputs]
+
+
+def test_inference_server_dynamic_batches():
+    adapter = _DoublingAdapter()
+    server = InferenceServer(
+        'test', adapter, max_batch_size=4, max_latency=0.2
+    )
+    server.start()
+
+    futures = [server.submit(i) for i in range(6)]
+    results = [f.result(timeout=2) for f in futures]
+
+    server.stop()
+
+    assert results == [0, 2, 4, 6, 8, 10]
+    assert [len(b[0]) for b in adapter.batches] == [4, 2]
+    assert server.mean_batch_size == 3
+
+
+def test_inference_server_concurrent_clients():
+    adapter = _DoublingAdapter()
+    server = InferenceServer('test', adapter, max_latency=0.1)
+    server.start()
+
+    results = dict()
+
+    def client(idx):
+        results[idx] = server.infer(idx, timeout=2)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(8)]
+
+    for t in threads:
+        t.start()
+
+    for t in threads:
+        t.join()
+
+    server.stop()
+
+    assert results == {i: 2 * i for i in range(8)}
+    assert len(adapter.batches) < 8
+
+
+def test_inference_server_options_groups():
+    adapter = _DoublingAdapter()
+    server = InferenceServer('test', adapter, max_latency=0.2)
+    server.start()
+
+    first = server.submit(1, factor=3)
+    second = server.submit(1)
+    failing = server.submit(1, fail=True)
+
+    assert first.result(timeout=2) == 3
+    assert second.result(timeout=2) == 2
+
+    with pytest.raises(ValueError):
+        failing.result(timeout=2)
+
+    server.stop()
+
+    assert len(adapter.batches) == 3
+
+    with pytest.raises(RuntimeError):
+        server.submit(1)
+
+
+def test_inference_server_shared():
+    created = list()
+
+    def factory():
+        created.append(_DoublingAdapter())
+
+        return created[-1]
+
+    first = InferenceServer.shared('test_shared', factory)
+    second = InferenceServer.shared('test_shared', factory)
+
+    assert first is second
+    assert len(created) == 1
+
+    first.release()
+
+    assert second.infer(4, timeout=2) == 8
+
+    second.release()
+
+    with pytest.raises(RuntimeError):
+        second.submit(1)
+
+    third = InferenceServer.shared('test_shared', factory)
+
+    assert third is not first
+    assert len(created) == 2
+
+    third.release()
+
+
+def test_inference_adapter_abstract():
+    class _Incomplete(InferenceAdapter):
+        pass
+
+    with pytest.raises(TypeError):
+        _Incomplete(None)
+
+
+def test_inference_server_shared_slow_factory():
+    loading = threading.Event()
+    loaded = threading.Event()
+
+    def slow_factory():
+        loading.set()
+        loaded.wait(timeout=5)
+
+        return _DoublingAdapter()
+
+    creator = threading.Thread(
+        target=InferenceServer.shared, args=('test_slow', slow_factory)
+    )
+    creator.start()
+
+    assert loading.wait(timeout=2)
+
+    # loading a model must not block servers with a different name
+    other = InferenceServer.shared('test_fast', _DoublingAdapter)
+
+    assert not loaded.is_set()
+    assert other.infer(2, timeout=2) == 4
+
+    other.release()
+    loaded.set()
+    creator.join(timeout=5)
+
+    slow = InferenceServer.shared('test_slow', slow_factory)
+
+    assert slow.infer(3, timeout=2) == 6
+
+    slow.release()
+    slow.release()
+
+
+def test_inference_server_stop_resolves_requests():
+    server = InferenceServer('test_stop', _DoublingAdapter(), max_latency=0.01)
+    server.start()
+
+    futures = list()
+    refused = list()
+
+    def submit_all():
+        for i in range(200):
+            try:
+                futures.append(server.submit(i))
+            except RuntimeError:
+                refused.append(i)
+
+    submitters = [threading.Thread(target=submit_all) for _ in range(4)]
+
+    for submitter in submitters:
+        submitter.start()
+
+    server.stop()
+
+    for submitter in submitters:
+        submitter.join()
+
+    # every request is either refused or served, none is left waiting
+    assert len(futures) + len(refused) == 800
+    assert all(f.result(timeout=2) is not None for f in futures)
+    assert server.logger.name == 'jt.inference.test_stop'
+
+
+def test_inference_server_creation_locks():
+    first = InferenceServer.shared('test_locks', _DoublingAdapter)
+    second = InferenceServer.shared('test_locks', _DoublingAdapter)
+
+    assert 'test_locks' not in InferenceServer._creation_locks
+
+    first.release()
+    second.release()
+
+    assert 'test_locks' not in InferenceServer._creation_locks
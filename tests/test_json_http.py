@@ -0,0 +1,117 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from juturna.nodes.source._json_http.json_http import JsonHttp
+
+
+@pytest.fixture
+def source(request):
+    node = JsonHttp(
+        host='127.0.0.1',
+        port=0,
+        endpoint='juturna',
+        node_name='source',
+        pipe_name='test_pipe',
+        **getattr(request, 'param', dict()),
+    )
+
+    node.warmup()
+
+    # only the server is started, so that received messages stay queued
+    thread = threading.Thread(target=node._httpd.serve_forever, daemon=True)
+    thread.start()
+
+    yield node
+
+    node._httpd.shutdown()
+    node._httpd.server_close()
+
+
+def _post(node, path: str, body: bytes, content_type: str):
+    conn = http.client.HTTPConnection('127.0.0.1', node._httpd.server_port)
+    conn.request('POST', path, body, {'Content-Type': content_type})
+
+    response = conn.getresponse()
+    content = response.read()
+    conn.close()
+
+    if response.getheader('Content-Type') != 'application/json':
+        return response, None
+
+    return response, json.loads(content)
+
+
+def _queued(node) -> list:
+    return [node._queue.get_nowait() for _ in range(node._queue.qsize())]
+
+
+def test_json_http_batches(source):
+    single, _ = _post(source, '/juturna', b'{"idx": 0}', 'application/json')
+    array, content = _post(
+        source,
+        '/juturna/batch',
+        json.dumps([{'idx': 1}, {'idx': 2}]).encode(),
+        'application/json',
+    )
+    ndjson, _ = _post(
+        source,
+        '/juturna/batch',
+        b'{"idx": 3}\n\n{"idx": 4}\n',
+        'application/x-ndjson; charset=utf-8',
+    )
+
+    assert (single.status, array.status, ndjson.status) == (202, 202, 202)
+    assert content == {'accepted': 2}
+
+    queued = _queued(source)
+
+    assert [m.payload['idx'] for m in queued] == [0, 1, 2, 3, 4]
+    assert [m.version for m in queued] == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize('source', [{'max_backlog': 3}], indirect=True)
+def test_json_http_saturated(source):
+    batch = json.dumps([{'idx': i} for i in range(5)]).encode()
+    response, content = _post(
+        source, '/juturna/batch', batch, 'application/json'
+    )
+
+    assert response.status == 503
+    assert response.getheader('Retry-After') == '1'
+    assert content == {'accepted': 3}
+
+    response, content = _post(
+        source, '/juturna', b'{"idx": 5}', 'application/json'
+    )
+
+    assert response.status == 503
+    assert content == {'accepted': 0}
+    assert (source.accepted, source.refused) == (3, 3)
+
+
+@pytest.mark.parametrize('source', [{'max_requests': 0}], indirect=True)
+def test_json_http_throttled(source):
+    response, _ = _post(source, '/juturna', b'{"idx": 0}', 'application/json')
+
+    assert response.status == 429
+    assert source.throttled == 1
+    assert source.backlog == 0
+
+
+def test_json_http_bad_requests(source):
+    assert (
+        _post(source, '/juturna/batch', b'{}', 'application/json')[0].status
+        == 400
+    )
+    assert (
+        _post(source, '/juturna', b'[1]', 'application/json')[0].status == 400
+    )
+    assert (
+        _post(source, '/juturna', b'{}', 'application/x-ndjson')[0].status
+        == 400
+    )
+    assert _post(source, '/other', b'{}', 'application/json')[0].status == 404
+    assert source.backlog == 0
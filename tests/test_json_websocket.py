@@ -0,0 +1,110 @@
+import json
+import threading
+import time
+
+from websockets.sync.client import connect
+
+from juturna.components import Message
+from juturna.nodes.source._json_websocket.json_websocket import JsonWebsocket
+from juturna.payloads import Batch
+from juturna.payloads import ObjectPayload
+
+
+class _Collector:
+    def __init__(self, expected: int):
+        self.messages = list()
+        self.expected = expected
+        self.done = threading.Event()
+
+    def put(self, message):
+        self.messages.append(message)
+
+        if len(self.messages) == self.expected:
+            self.done.set()
+
+
+def _source(**kwargs) -> JsonWebsocket:
+    node = JsonWebsocket(
+        rtx_host='127.0.0.1',
+        rtx_port=0,
+        node_name='source',
+        pipe_name='test_pipe',
+        **kwargs,
+    )
+
+    node.warmup()
+
+    return node
+
+
+def _wait(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert condition()
+
+
+def test_json_websocket_frames():
+    node = _source(codec='juturna')
+    collector = _Collector(6)
+
+    node.add_destination('sink', collector)
+    node.start()
+
+    batch = Message[Batch](
+        creator='remote',
+        payload=Batch(
+            messages=tuple(
+                Message[ObjectPayload](
+                    creator='remote', payload=ObjectPayload(idx=idx)
+                )
+                for idx in (3, 4)
+            )
+        ),
+    )
+
+    with connect(f'ws://127.0.0.1:{node.address[1]}') as ws:
+        ws.send(json.dumps({'idx': 0}))
+        ws.send(json.dumps([{'idx': 1}, {'idx': 2}]))
+        ws.send('not json')
+        ws.send(batch.to_bytes())
+        ws.send(json.dumps({'idx': 5}))
+
+        assert collector.done.wait(timeout=5)
+
+    node.stop()
+
+    assert [m.payload['idx'] for m in collector.messages] == list(range(6))
+    assert [m.version for m in collector.messages] == list(range(6))
+    assert collector.messages[0].meta['client'].startswith('127.0.0.1:')
+
+
+def test_json_websocket_fair_clients():
+    node = _source(max_pending=2)
+
+    # only the server is started, so that messages are routed on demand
+    node._thread.start()
+
+    url = f'ws://127.0.0.1:{node.address[1]}'
+
+    with connect(url) as noisy, connect(url) as quiet:
+        for idx in range(50):
+            noisy.send(json.dumps({'client': 'noisy', 'idx': idx}))
+
+        _wait(lambda: sum(len(c.pending) for c in node._clients) == 2)
+
+        for idx in range(2):
+            quiet.send(json.dumps({'client': 'quiet', 'idx': idx}))
+
+        _wait(lambda: sum(len(c.pending) for c in node._clients) == 4)
+
+        routed = [node._next_message().payload['client'] for _ in range(4)]
+
+        assert routed.count('quiet') == 2
+
+        node._release_clients()
+
+    node._server.shutdown()
+    node._thread.join(timeout=2)
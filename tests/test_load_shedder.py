@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from juturna.components import LoadShedder
+from juturna.components import Message
+from juturna.components import Node
+from juturna.payloads import BytesPayload
+from juturna.payloads import ControlPayload
+from juturna.payloads import ControlSignal
+
+
+class _SheddingNode(Node):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.updated = list()
+        self.skipped = list()
+
+    def update(self, message: Message):
+        time.sleep(0.02)
+        self.updated.append(message.version)
+
+    def skip(self, message: Message):
+        self.skipped.append(message.version)
+
+
+def test_load_shedder_decisions():
+    shedder = LoadShedder(0.1, smoothing=0.5)
+
+    assert not shedder.should_skip(time.time(), 0)
+
+    shedder.observe(0.04)
+    shedder.observe(0.02)
+
+    assert shedder.processing_time == pytest.approx(0.03)
+    assert not shedder.should_skip(time.time(), 1)
+    assert shedder.should_skip(time.time(), 3)
+    assert shedder.should_skip(time.time() - 0.2, 1)
+    assert not shedder.should_skip(time.time() - 0.2, 0)
+    assert shedder.skip_ratio == pytest.approx(0.5)
+
+    with pytest.raises(ValueError):
+        LoadShedder(0)
+
+
+def test_node_load_shedding(wait_for_condition):
+    node = _SheddingNode(node_name='shedding_node', pipe_name='test_pipe')
+    node.shed_load(0.05)
+    node.start()
+
+    payload = BytesPayload(cnt=b'frame')
+
+    for i in range(50):
+        node.put(Message(payload=payload, creator='test_source', version=i))
+
+    assert wait_for_condition(
+        lambda: len(node.updated) + len(node.skipped) == 50, timeout=5
+    )
+    assert node.backlog == 0
+
+    node.put(
+        Message(
+            payload=ControlPayload(ControlSignal.STOP),
+            creator='test_control',
+            version=-1,
+        )
+    )
+
+    assert len(node.skipped) > len(node.updated)
+    assert node.updated[-1] == 49
+    assert node.load_shedder.skipped == len(node.skipped)
@@ -0,0 +1,145 @@
+import time
+
+import numpy as np
+import pytest
+
+from juturna.components import MemoCache
+from juturna.components import Message
+from juturna.components import Node
+from juturna.payloads import AudioPayload
+from juturna.payloads import ObjectPayload
+
+
+def test_memo_cache_lru():
+    cache = MemoCache(2)
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+
+    assert cache.put('c', 3) == 1
+    assert 'b' not in cache
+    assert cache.get('a') == (True, 1)
+    assert cache.get('b') == (False, None)
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 1, 1)
+
+
+def test_memo_cache_lfu():
+    cache = MemoCache(2, policy='lfu')
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+
+    for _ in range(3):
+        cache.get('b')
+
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert 'a' not in cache
+    assert 'b' in cache
+
+    # ties are broken by recency
+    cache.put('d', 4)
+
+    assert 'c' not in cache
+    assert len(cache) == 2
+
+    with pytest.raises(ValueError):
+        MemoCache(2, policy='fifo')
+
+
+def test_memo_cache_ttl():
+    cache = MemoCache(4, ttl=0.05)
+    cache.put('a', 1)
+
+    assert cache.get('a') == (True, 1)
+
+    time.sleep(0.1)
+
+    assert cache.get('a') == (False, None)
+    assert cache.evictions == 1
+
+
+def test_memo_cache_persistence(tmp_path):
+    path = tmp_path / 'cache.db'
+
+    cache = MemoCache(3, policy='lfu', path=path)
+
+    for key in 'abcd':
+        cache.put(key, {'value': key})
+
+    cache.get('d')
+    cache.save()
+
+    restored = MemoCache(2, policy='lfu', path=path)
+
+    assert len(restored) == 2
+    assert restored.get('d') == (True, {'value': 'd'})
+
+    restored.put('e', None)
+
+    assert 'c' not in restored
+    assert 'd' in restored
+
+
+def test_node_memoise():
+    node = Node(node_name='cached_node', pipe_name='test_pipe')
+    calls = list()
+
+    def compute(message):
+        calls.append(message.version)
+
+        return message.payload['query'].upper()
+
+    messages = [
+        Message[ObjectPayload](
+            creator='test_source',
+            version=i,
+            payload=ObjectPayload(query=query, ts=i),
+        )
+        for i, query in enumerate(['hello', 'bye', 'hello'])
+    ]
+
+    assert node.memoise(messages[0], lambda: compute(messages[0])) == 'HELLO'
+    assert len(calls) == 1
+
+    node.set_cache(8, key=['query'])
+
+    results = [node.memoise(m, lambda m=m: compute(m)) for m in messages]
+
+    assert results == ['HELLO', 'BYE', 'HELLO']
+    assert calls == [0, 0, 1]
+    assert node.cache.hit_ratio == pytest.approx(1 / 3)
+
+
+def test_memo_cache_array_keys():
+    cache = MemoCache(8)
+    audio = np.zeros(16000, dtype=np.float32)
+    other = audio.copy()
+
+    # the arrays only differ where their repr is abbreviated
+    other[8000] = 1
+
+    assert cache.project(AudioPayload(audio=audio)) != cache.project(
+        AudioPayload(audio=other)
+    )
+    assert cache.project({'v': audio}) == cache.project({'v': audio.copy()})
+    assert cache.project({'v': audio}) != cache.project(
+        {'v': audio.astype(np.float64)}
+    )
+    assert cache.project({'v': audio}) != cache.project(
+        {'v': audio.reshape(100, 160)}
+    )
+
+
+def test_node_cache_key():
+    node = Node(node_name='cached_node', pipe_name='test_pipe')
+    node.cache_key = ['query']
+    node.set_cache(8)
+
+    assert node.cache.key == ['query']
+
+    node.set_cache(8, key=['other'])
+
+    assert node.cache.key == ['other']
@@ -365,3 +365,150 @@ def test_message_immutable_payload():
 
     assert "cannot assign to field 'channels'" in str(context.value)
     assert test_message.payload.channels == 2
+
+
+def test_message_freeze_read_only_arrays():
+    audio = np.zeros(16, dtype=np.float32)
+    frame = ImagePayload(image=np.zeros((2, 2, 3), dtype=np.uint8))
+
+    test_message = Message(
+        creator='tester',
+        payload=Draft(VideoPayload),
+    )
+
+    test_message.payload.video = [frame]
+    test_message.meta['original_audio'] = audio
+    test_message.meta['nested'] = {'arrays': [np.arange(4)]}
+
+    test_message._freeze()
+
+    assert not test_message.payload.video[0].image.flags.writeable
+    assert not test_message.meta['original_audio'].flags.writeable
+    assert not test_message.meta['nested']['arrays'][0].flags.writeable
+
+    with pytest.raises(ValueError):
+        test_message.payload.video[0].image[0, 0, 0] = 1
+
+    np.testing.assert_array_equal(audio, np.zeros(16))
+
+
+def test_message_to_bytes_audio():
+    test_payload = AudioPayload(
+        audio=np.arange(16_000, dtype=np.float32),
+        sampling_rate=16_000,
+        channels=1,
+        audio_format='flt',
+        start=0,
+        end=1
+    )
+
+    test_message = Message(creator='tester', version=7, payload=test_payload)
+    test_message.meta['session_id'] = 'session'
+    test_message.timer('timer1', 1.0)
+
+    decoded = Message.from_bytes(test_message.to_bytes())
+
+    assert isinstance(decoded.payload, AudioPayload)
+    np.testing.assert_array_equal(decoded.payload.audio, test_payload.audio)
+    assert decoded.payload.audio.dtype == np.float32
+    assert decoded.payload.sampling_rate == 16_000
+    assert decoded.payload.audio_format == 'flt'
+    assert decoded.creator == 'tester'
+    assert decoded.version == 7
+    assert decoded.id == test_message.id
+    assert decoded.created_at == test_message.created_at
+    assert decoded.meta == {'session_id': 'session'}
+    assert decoded.timers == {'timer1': 1.0}
+
+
+def test_message_to_bytes_image_zero_copy():
+    test_image = np.random.randint(0, 255, (48, 64, 3), dtype=np.uint8)
+    test_payload = ImagePayload(
+        image=test_image,
+        width=64,
+        height=48,
+        depth=3,
+        pixel_format='rgb24',
+        timestamp=111.11
+    )
+
+    data = bytearray(Message(payload=test_payload).to_bytes())
+    decoded = Message.from_bytes(data)
+
+    np.testing.assert_array_equal(decoded.payload.image, test_image)
+    assert decoded.payload.image.shape == (48, 64, 3)
+    assert np.shares_memory(
+        decoded.payload.image, np.frombuffer(data, dtype=np.uint8)
+    )
+
+
+def test_message_to_bytes_object_and_meta_arrays():
+    test_message = Message(
+        creator='tester',
+        payload=Draft(ObjectPayload)
+    )
+
+    test_message.payload.words = [{'word': 'hello', 'start': 0.5}]
+    test_message.payload.raw = b'\x00\x01\x02'
+    test_message.meta['original_audio'] = np.ones((10, 2), dtype=np.int16)
+    test_message.meta['score'] = np.float32(0.5)
+
+    decoded = Message.from_bytes(test_message.to_bytes())
+
+    assert isinstance(decoded.payload, ObjectPayload)
+    assert decoded.payload['words'] == [{'word': 'hello', 'start': 0.5}]
+    assert decoded.payload['raw'] == b'\x00\x01\x02'
+    np.testing.assert_array_equal(
+        decoded.meta['original_audio'], np.ones((10, 2), dtype=np.int16)
+    )
+    assert decoded.meta['score'] == 0.5
+
+
+def test_message_to_bytes_batch():
+    messages = tuple(
+        Message(
+            creator=f'source_{i}',
+            version=i,
+            payload=BytesPayload(cnt=bytes([i] * 10))
+        )
+        for i in range(3)
+    )
+
+    test_message = Message(creator='sync', payload=Batch(messages=messages))
+    decoded = Message.from_bytes(test_message.to_bytes())
+
+    assert isinstance(decoded.payload, Batch)
+    assert len(decoded.payload.messages) == 3
+
+    for idx, message in enumerate(decoded.payload.messages):
+        assert message.creator == f'source_{idx}'
+        assert message.payload.cnt == bytes([idx] * 10)
+
+
+def test_message_to_bytes_custom_encoder():
+    test_message = Message(creator='tester')
+    test_message.meta['unknown'] = object()
+
+    with pytest.raises(TypeError):
+        test_message.to_bytes()
+
+    decoded = Message.from_bytes(
+        test_message.to_bytes(encoder=lambda x: 'custom_serialised')
+    )
+
+    assert decoded.meta['unknown'] == 'custom_serialised'
+
+
+def test_message_from_bytes_invalid():
+    with pytest.raises(ValueError) as context:
+        Message.from_bytes(b'not a juturna message')
+
+    assert 'data is not a binary message' in str(context.value)
+
+    data = bytearray(Message().to_bytes())
+    data[4] = 99
+
+    with pytest.raises(ValueError) as context:
+        Message.from_bytes(data)
+
+    assert 'unsupported binary message version 99' in str(context.value)
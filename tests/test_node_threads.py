@@ -56,3 +56,159 @@ def test_stop_draining_no_deadlock_with_real_work(wait_for_condition):
 
     assert not stop_thread.is_alive(), "Deadlock detected in node.stop()"
     assert node._last_data_source_evt_id == 29, f"Not all messages were processed during draining, last processed ID: {node._last_data_source_evt_id}"
+
+def test_byte_budget_blocks_senders(wait_for_condition):
+    node = SlowNode(node_name="budget_node", pipe_name="test_pipe")
+    node.set_byte_budget(max_bytes=4096)
+
+    payload = BytesPayload(cnt=b"x" * 1024)
+    sender_done = threading.Event()
+
+    def send_all():
+        for i in range(20):
+            node.put(Message(payload=payload, creator="test_source", version=i))
+        sender_done.set()
+
+    sender = threading.Thread(target=send_all, daemon=True)
+    sender.start()
+
+    # nothing is consuming yet, so the sender must be blocked by the budget
+    time.sleep(0.5)
+    assert not sender_done.is_set()
+    assert node._byte_budget.used <= 4096
+
+    node.start()
+
+    try:
+        assert wait_for_condition(sender_done.is_set, timeout=5)
+        assert wait_for_condition(
+            lambda: node._last_data_source_evt_id == 19, timeout=5
+        )
+        assert wait_for_condition(
+            lambda: node._byte_budget.used == 0, timeout=5
+        )
+    finally:
+        node.put(generate_stop_message())
+
+
+def test_byte_budget_shared_pipeline_progress(wait_for_condition):
+    from juturna.components._byte_budget import ByteBudget
+
+    shared = ByteBudget("test_pipe", max_bytes=1024)
+    first = SlowNode(node_name="first", pipe_name="test_pipe")
+    second = SlowNode(node_name="second", pipe_name="test_pipe")
+
+    first.set_byte_budget(0, shared)
+    second.set_byte_budget(0, shared)
+
+    payload = BytesPayload(cnt=b"x" * 2048)
+
+    # the shared budget is exhausted by the first node, but an empty node
+    # must still be able to accept a message
+    first.put(Message(payload=payload, creator="test_source", version=0))
+    second.put(Message(payload=payload, creator="test_source", version=0))
+
+    assert first._byte_budget.used > 1024
+    assert second._byte_budget.used > 1024
+    assert shared.used == first._byte_budget.used + second._byte_budget.used
+
+
+def test_byte_budget_batching_synchroniser(wait_for_condition):
+    received = list()
+
+    class BatchNode(Node):
+        def update(self, message: Message):
+            received.append(message)
+
+    def every_four(sources: dict) -> dict:
+        if sum(len(messages) for messages in sources.values()) < 4:
+            return dict()
+
+        return {source: list(range(len(sources[source]))) for source in sources}
+
+    node = BatchNode(
+        node_name="batch_node", pipe_name="test_pipe", synchroniser=every_four
+    )
+
+    # the budget fits two messages, the synchroniser waits for four
+    node.set_byte_budget(max_bytes=2500)
+    node.start()
+
+    payload = BytesPayload(cnt=b"x" * 1024)
+    sender_done = threading.Event()
+
+    def send_all():
+        for i in range(8):
+            node.put(Message(payload=payload, creator="test_source", version=i))
+        sender_done.set()
+
+    sender = threading.Thread(target=send_all, daemon=True)
+    sender.start()
+
+    try:
+        assert wait_for_condition(sender_done.is_set, timeout=5)
+        assert wait_for_condition(lambda: len(received) == 2, timeout=5)
+        assert node._byte_budget.used == 0
+        assert node._charged == dict()
+    finally:
+        node.put(generate_stop_message())
+
+
+def test_byte_budget_same_message_twice(wait_for_condition):
+    node = SlowNode(node_name="twice_node", pipe_name="test_pipe")
+    node.set_byte_budget(max_bytes=4096)
+
+    message = Message(
+        payload=BytesPayload(cnt=b"x" * 1024), creator="test_source", version=0
+    )
+
+    node.put(message)
+    node.put(message)
+
+    assert len(node._charged[id(message)]) == 2
+
+    node.start()
+
+    try:
+        assert wait_for_condition(
+            lambda: node._byte_budget.used == 0, timeout=5
+        )
+    finally:
+        node.put(generate_stop_message())
+
+
+def test_byte_budget_bounds_buffer(wait_for_condition):
+    class SlowerNode(Node):
+        def update(self, message: Message):
+            time.sleep(0.2)
+
+    node = SlowerNode(node_name="bounded_node", pipe_name="test_pipe")
+    node.set_byte_budget(max_bytes=4096)
+    node.start()
+
+    payload = BytesPayload(cnt=b"x" * 100000)
+    sender_done = threading.Event()
+
+    def send_all():
+        for i in range(10):
+            node.put(Message(payload=payload, creator="test_source", version=i))
+        sender_done.set()
+
+    sender = threading.Thread(target=send_all, daemon=True)
+    sender.start()
+
+    try:
+        # messages waiting for update() are still charged, so the sender
+        # can only be one message ahead of the node
+        time.sleep(0.5)
+
+        assert not sender_done.is_set()
+        assert node.backlog <= 1
+        assert node._byte_budget.used <= 2 * payload.size_bytes + 4096
+
+        assert wait_for_condition(sender_done.is_set, timeout=5)
+        assert wait_for_condition(
+            lambda: node._byte_budget.used == 0, timeout=5
+        )
+    finally:
+        node.put(generate_stop_message())
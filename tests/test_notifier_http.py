@@ -0,0 +1,137 @@
+import json
+import threading
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from juturna.components import Message
+from juturna.nodes.sink import NotifierHTTP
+from juturna.payloads import ObjectPayload
+
+
+class _Endpoint(BaseHTTPRequestHandler):
+    def do_POST(self):  # noqa: N802
+        body = self.rfile.read(int(self.headers['Content-Length']))
+
+        with self.server.lock:
+            self.server.attempts += 1
+            failing = self.server.attempts <= self.server.failures
+
+            if not failing:
+                self.server.bodies.append(json.loads(body))
+
+        self.send_response(503 if failing else 200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args): ...
+
+
+@pytest.fixture
+def endpoint():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Endpoint)
+    server.lock = threading.Lock()
+    server.attempts = 0
+    server.failures = 0
+    server.bodies = list()
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def _notify(server, count: int, **kwargs) -> NotifierHTTP:
+    node = NotifierHTTP(
+        endpoint=f'http://127.0.0.1:{server.server_port}',
+        timeout=2,
+        content_type='application/json',
+        node_name='notifier',
+        pipe_name='test_pipe',
+        **kwargs,
+    )
+
+    node.warmup()
+    node.start()
+
+    for i in range(count):
+        node.update(
+            Message[ObjectPayload](
+                creator='test_source',
+                version=i,
+                payload=ObjectPayload(value=i),
+            )
+        )
+
+    node.stop()
+    node.destroy()
+
+    return node
+
+
+def test_notifier_http_ordered_batches(endpoint):
+    node = _notify(endpoint, 25, batch_size=10, batch_delay=1, ordered=True)
+
+    assert [len(b) for b in endpoint.bodies] == [10, 10, 5]
+    assert [m['version'] for b in endpoint.bodies for m in b] == list(range(25))
+    assert node.sent == 25
+
+
+def test_notifier_http_workers(endpoint):
+    node = _notify(endpoint, 40, workers=4)
+
+    assert sorted(b['version'] for b in endpoint.bodies) == list(range(40))
+    assert all(b['payload']['value'] == b['version'] for b in endpoint.bodies)
+    assert node.sent == 40
+
+
+def test_notifier_http_retries(endpoint):
+    endpoint.failures = 2
+
+    node = _notify(endpoint, 1, retries=2, backoff=0.01)
+
+    assert endpoint.attempts == 3
+    assert node.sent == 1
+
+    endpoint.attempts = 0
+    node = _notify(endpoint, 1, retries=1, backoff=0.01)
+
+    assert endpoint.attempts == 2
+    assert node.failed == 1
+
+
+def test_notifier_http_unserialisable(endpoint):
+    node = NotifierHTTP(
+        endpoint=f'http://127.0.0.1:{endpoint.server_port}',
+        timeout=2,
+        content_type='application/json',
+        workers=1,
+        max_pending=1,
+        node_name='notifier',
+        pipe_name='test_pipe',
+    )
+
+    node.warmup()
+    node.start()
+
+    for i in range(5):
+        message = Message[ObjectPayload](
+            creator='test_source', version=i, payload=ObjectPayload(value=i)
+        )
+
+        # content the encoder cannot serialise is dropped, not sent
+        if i % 2 == 0:
+            message.meta['features'] = object()
+
+        node.update(message)
+
+    node.stop()
+    node.destroy()
+
+    assert [b['version'] for b in endpoint.bodies] == [1, 3]
+    assert (node.sent, node.failed) == (2, 3)
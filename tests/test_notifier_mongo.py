@@ -0,0 +1,238 @@
+import contextlib
+import importlib.util
+import pathlib
+import sys
+import threading
+import types
+
+import numpy as np
+import pytest
+
+from juturna.components import Message
+from juturna.payloads import AudioPayload
+from juturna.payloads import Batch
+from juturna.payloads import ObjectPayload
+
+
+try:
+    import bson
+    import pymongo
+except ImportError:
+    bson = pymongo = None
+
+_PLUGIN = pathlib.Path(
+    pathlib.Path(__file__).parent.parent,
+    'plugins/nodes/sink/_notifier_mongo/notifier_mongo.py',
+)
+
+_BSON_TYPES = (type(None), bool, int, float, str, bytes)
+
+
+def _bson_roundtrip(document: dict) -> dict:
+    if bson is not None:
+        return bson.decode(bson.encode(document))
+
+    def check(value):
+        if isinstance(value, dict):
+            assert all(isinstance(k, str) for k in value)
+            return {k: check(v) for k, v in value.items()}
+
+        if isinstance(value, list):
+            return [check(v) for v in value]
+
+        assert isinstance(value, _BSON_TYPES), type(value)
+
+        return value
+
+    return check(document)
+
+
+class _BulkWriteError(Exception):
+    def __init__(self, details: dict):
+        super().__init__('bulk write error')
+        self.details = details
+
+
+def _fake_pymongo() -> types.ModuleType:
+    # the write-behind logic only needs the client, the timeout context and
+    # the bulk error, so it can be tested without the driver installed
+    errors = types.ModuleType('pymongo.errors')
+    errors.BulkWriteError = _BulkWriteError
+
+    module = types.ModuleType('pymongo')
+    module.errors = errors
+    module.MongoClient = None
+    module.timeout = lambda _: contextlib.nullcontext()
+
+    return module
+
+
+class _Collection:
+    """A minimal in-memory stand-in for a mongo collection"""
+
+    def __init__(self, error: type, rejected: set | None = None):
+        self.documents = list()
+        self.inserts = list()
+        self.rejected = rejected or set()
+        self._error = error
+        self._lock = threading.Lock()
+
+    def insert_many(self, documents: list, ordered: bool = True):
+        errors = list()
+
+        with self._lock:
+            self.inserts.append((len(documents), ordered))
+
+            for idx, document in enumerate(documents):
+                if document['version'] in self.rejected:
+                    errors.append({'index': idx, 'code': 11000})
+
+                    if ordered:
+                        break
+
+                    continue
+
+                # documents must only hold BSON-encodable content
+                self.documents.append(_bson_roundtrip(document))
+
+        if errors:
+            raise self._error({'writeErrors': errors})
+
+
+@pytest.fixture
+def notifier_module(monkeypatch):
+    if pymongo is None:
+        fake = _fake_pymongo()
+
+        monkeypatch.setitem(sys.modules, 'pymongo', fake)
+        monkeypatch.setitem(sys.modules, 'pymongo.errors', fake.errors)
+
+    spec = importlib.util.spec_from_file_location('notifier_mongo', _PLUGIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+@pytest.fixture
+def notifier_class(notifier_module):
+    return notifier_module.NotifierMongo
+
+
+@pytest.fixture
+def collection(notifier_module):
+    def make(rejected: set | None = None) -> _Collection:
+        return _Collection(notifier_module.BulkWriteError, rejected)
+
+    return make
+
+
+def _node(notifier_class, collection: _Collection, **kwargs):
+    node = notifier_class(
+        endpoint='mongodb://127.0.0.1:27017',
+        database='test',
+        collection='test',
+        timeout=2,
+        node_name='notifier',
+        pipe_name='test_pipe',
+        **kwargs,
+    )
+
+    node._cl = collection
+    node.start()
+
+    return node
+
+
+def _message(version: int, payload) -> Message:
+    message = Message(creator='test_source', version=version, payload=payload)
+    message._freeze()
+
+    return message
+
+
+def test_notifier_mongo_batches(notifier_class, collection):
+    collection = collection()
+    node = _node(notifier_class, collection, batch_size=10, flush_interval=5)
+
+    for i in range(25):
+        node.update(_message(i, ObjectPayload(value=i)))
+
+    node.stop()
+
+    assert collection.inserts == [(10, False), (10, False), (5, False)]
+    assert [d['version'] for d in collection.documents] == list(range(25))
+    assert node.written == 25
+
+
+def test_notifier_mongo_unordered_errors(notifier_class, collection):
+    collection = collection(rejected={1, 3})
+    node = _node(notifier_class, collection, batch_size=5, flush_interval=5)
+
+    for i in range(5):
+        node.update(_message(i, ObjectPayload(value=i)))
+
+    node.stop()
+
+    assert [d['version'] for d in collection.documents] == [0, 2, 4]
+    assert (node.written, node.failed) == (3, 2)
+
+
+def test_notifier_mongo_arrays(notifier_class, collection):
+    audio = np.arange(6, dtype=np.float32).reshape(2, 3)
+    payload = AudioPayload(
+        audio=audio, sampling_rate=16000, channels=2, start=0, end=1
+    )
+
+    for arrays, expected in [
+        ('binary', {'dtype': '<f4', 'shape': [2, 3], 'data': audio.tobytes()}),
+        ('list', audio.tolist()),
+        ('drop', None),
+    ]:
+        target = collection()
+        node = _node(notifier_class, target, arrays=arrays)
+        node.update(_message(0, payload))
+        node.stop()
+
+        document = target.documents[0]
+
+        assert document['payload']['audio'] == expected
+        assert document['payload']['sampling_rate'] == 16000
+
+    with pytest.raises(ValueError):
+        _node(notifier_class, collection(), arrays='pickle')
+
+
+def test_notifier_mongo_batch_payloads(notifier_class, collection):
+    target = collection()
+    node = _node(notifier_class, target, flush_interval=0.1)
+
+    batch = Message(
+        creator='test_sync',
+        version=-1,
+        payload=Batch(
+            messages=tuple(
+                _message(i, ObjectPayload(value=i)) for i in range(3)
+            )
+        ),
+    )
+
+    node.update(batch)
+    node.stop()
+
+    assert [d['version'] for d in target.documents] == [0, 1, 2]
+    assert [d['payload']['value'] for d in target.documents] == [0, 1, 2]
+    assert all(d['session_id'] == node.pipe_id for d in target.documents)
+    assert node.written == 3
+
+
+def test_notifier_mongo_unstorable(notifier_class, collection):
+    target = collection()
+    node = _node(notifier_class, target, flush_interval=0.1)
+
+    node.update(_message(0, ObjectPayload(value=object())))
+    node.update(_message(1, ObjectPayload(value=1)))
+    node.stop()
+
+    assert [d['version'] for d in target.documents] == [1]
+    assert (node.written, node.failed) == (1, 1)
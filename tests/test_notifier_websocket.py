@@ -0,0 +1,185 @@
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from websockets.sync.server import serve
+
+from juturna.components import Message
+from juturna.nodes.sink import NotifierWebsocket
+from juturna.payloads import ObjectPayload
+
+
+class _Endpoint:
+    def __init__(self, port: int, drop_after: int = 0):
+        self.port = port
+        self.drop_after = drop_after
+        self.received = list()
+        self.connections = 0
+
+        self._server = None
+
+    def start(self):
+        self._server = serve(self._handle, '127.0.0.1', self.port)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._server.shutdown()
+
+    def _handle(self, ws):
+        self.connections += 1
+
+        for frame in ws:
+            self.received.append(json.loads(frame)['version'])
+
+            # drop the first connection once enough messages are received
+            if self.connections == 1 and len(self.received) == self.drop_after:
+                return
+
+
+@pytest.fixture
+def port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+
+        return s.getsockname()[1]
+
+
+def _node(port: int, **kwargs) -> NotifierWebsocket:
+    node = NotifierWebsocket(
+        endpoint=f'ws://127.0.0.1:{port}',
+        reconnect_delay=0.05,
+        node_name='notifier',
+        pipe_name='test_pipe',
+        **kwargs,
+    )
+
+    node.warmup()
+    node.start()
+
+    return node
+
+
+def _send(node: NotifierWebsocket, versions):
+    for i in versions:
+        node.update(
+            Message[ObjectPayload](
+                creator='test_source',
+                version=i,
+                payload=ObjectPayload(value=i),
+            )
+        )
+
+
+def test_notifier_websocket_single_connection(port, wait_for_condition):
+    endpoint = _Endpoint(port)
+    endpoint.start()
+
+    node = _node(port)
+    _send(node, range(50))
+
+    assert wait_for_condition(lambda: len(endpoint.received) == 50)
+
+    node.stop()
+    endpoint.stop()
+
+    assert endpoint.received == list(range(50))
+    assert endpoint.connections == 1
+
+
+def test_notifier_websocket_backlog(port, wait_for_condition):
+    endpoint = _Endpoint(port)
+
+    # messages are queued while the endpoint is down
+    node = _node(port, max_pending=100)
+    _send(node, range(20))
+
+    time.sleep(0.2)
+    endpoint.start()
+
+    assert wait_for_condition(lambda: len(endpoint.received) == 20)
+
+    node.stop()
+    endpoint.stop()
+
+    assert endpoint.received == list(range(20))
+
+
+def test_notifier_websocket_replay(port, wait_for_condition):
+    endpoint = _Endpoint(port, drop_after=5)
+    endpoint.start()
+
+    node = _node(port, replay=2)
+    _send(node, range(5))
+
+    assert wait_for_condition(lambda: endpoint.connections == 1)
+    assert wait_for_condition(lambda: len(endpoint.received) == 5)
+
+    _send(node, range(5, 10))
+
+    assert wait_for_condition(lambda: endpoint.received[-1:] == [9])
+
+    node.stop()
+    endpoint.stop()
+
+    # the last messages sent before the drop are replayed, the rest is sent
+    # in order
+    assert endpoint.connections == 2
+    assert endpoint.received[:5] == list(range(5))
+    assert endpoint.received[-5:] == list(range(5, 10))
+    assert set(endpoint.received[5:-5]) <= {3, 4, 5}
+
+
+def test_notifier_websocket_unserialisable(port, wait_for_condition):
+    endpoint = _Endpoint(port)
+    endpoint.start()
+
+    node = _node(port)
+
+    for i in range(4):
+        message = Message[ObjectPayload](
+            creator='test_source', version=i, payload=ObjectPayload(value=i)
+        )
+
+        # content the encoder cannot serialise is dropped, not sent
+        if i % 2 == 0:
+            message.meta['features'] = object()
+
+        node.update(message)
+
+    assert wait_for_condition(lambda: endpoint.received == [1, 3], timeout=5)
+
+    node.stop()
+    endpoint.stop()
+
+
+def test_notifier_websocket_stop_bounded(port, monkeypatch):
+    monkeypatch.setattr(
+        'juturna.nodes.sink._notifier_websocket.notifier_websocket.'
+        'JUTURNA_THREAD_JOIN_TIMEOUT',
+        0.2,
+    )
+
+    node = NotifierWebsocket(
+        endpoint=f'ws://127.0.0.1:{port}',
+        max_pending=1,
+        node_name='notifier',
+        pipe_name='test_pipe',
+    )
+
+    # a sender stuck in a send, with a full queue behind it
+    stuck = threading.Event()
+    monkeypatch.setattr(node, '_send_messages', stuck.wait)
+
+    node.start()
+    _send(node, [0])
+
+    stopper = threading.Thread(target=node.stop, daemon=True)
+    stopper.start()
+    stopper.join(timeout=10)
+    stuck.set()
+
+    assert not stopper.is_alive()
+    assert node._t is None
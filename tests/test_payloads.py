@@ -172,4 +172,72 @@ def test_draft_copy_from_object():
     test_payload = test_draft.compile()
 
     assert test_payload['prop_a'] == 10
-    assert test_payload.prop_b == 'value'
\ No newline at end of file
+    assert test_payload.prop_b == 'value'
+
+def test_payload_size_bytes():
+    audio = AudioPayload(audio=np.zeros(16_000, dtype=np.float32))
+    image = ImagePayload(image=np.zeros((480, 640, 3), dtype=np.uint8))
+    video = VideoPayload(video=[image, image])
+
+    assert audio.size_bytes == 64_000
+    assert image.size_bytes == 921_600
+    assert video.size_bytes == 2 * 921_600
+    assert BytesPayload(cnt=b'x' * 100).size_bytes == 100
+
+
+def test_object_payload_deep_size_bytes():
+    shallow = ObjectPayload(prop_a=10)
+    deep = ObjectPayload(
+        prop_a=10,
+        nested={'waveform': np.zeros(10_000, dtype=np.float64)},
+        frames=[b'x' * 5_000, b'y' * 5_000],
+    )
+
+    assert deep.size_bytes > shallow.size_bytes + 90_000
+
+
+def test_message_size_bytes_includes_meta():
+    from juturna.components import Message
+
+    message = Message(
+        payload=AudioPayload(audio=np.zeros(1_000, dtype=np.float32))
+    )
+    base_size = message.size_bytes
+
+    message.meta['original_audio'] = np.zeros(8_000, dtype=np.float32)
+
+    assert message.size_bytes >= base_size + 32_000
+
+    message._freeze()
+
+    assert message.size_bytes == message._size_bytes
+
+
+def test_writable_copy():
+    audio = np.zeros(10, dtype=np.float32)
+    audio.flags.writeable = False
+
+    payload = AudioPayload(audio=audio, sampling_rate=16_000)
+    copied = payload.writable_copy()
+
+    copied.audio[0] = 1.0
+
+    assert copied.sampling_rate == 16_000
+    assert copied.size_bytes == payload.size_bytes
+    assert audio[0] == 0.0
+    assert not np.shares_memory(copied.audio, payload.audio)
+
+
+def test_writable_copy_nested():
+    image = ImagePayload(image=np.zeros((2, 2, 3), dtype=np.uint8))
+    video = VideoPayload(video=[image], frames_per_second=25.0)
+    obj = ObjectPayload(frame=image.image, label='cat')
+
+    copied_video = video.writable_copy()
+    copied_obj = obj.writable_copy()
+
+    assert isinstance(copied_obj, ObjectPayload)
+    assert copied_obj.label == 'cat'
+    assert copied_video.frames_per_second == 25.0
+    assert not np.shares_memory(copied_video.video[0].image, image.image)
+    assert not np.shares_memory(copied_obj.frame, image.image)
@@ -0,0 +1,188 @@
+import os
+import socket
+import threading
+import time
+
+from juturna.components import Message, Node
+from juturna.nodes.source._audio_rtp.audio_rtp import AudioRTP
+from juturna.payloads import BytesPayload
+from juturna.utils.net_utils import Reactor
+
+
+class _Collector:
+    def __init__(self, expected: int):
+        self.messages = list()
+        self.expected = expected
+        self.done = threading.Event()
+
+    def put(self, message):
+        self.messages.append(message)
+
+        if len(self.messages) == self.expected:
+            self.done.set()
+
+
+class _PipeSource(Node):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+
+        self.add_reader(self.read_fd, self._read)
+
+    def _read(self):
+        data = os.read(self.read_fd, 4096)
+
+        if not data:
+            self.remove_reader(self.read_fd)
+
+            return
+
+        self.offer(
+            Message[BytesPayload](
+                creator=self.name, payload=BytesPayload(cnt=data)
+            )
+        )
+
+    def update(self, message):
+        self.transmit(message)
+
+
+def test_reactor_readers_and_timers():
+    reactor = Reactor()
+    pairs = [socket.socketpair() for _ in range(50)]
+    received = [list() for _ in pairs]
+    ticks = list()
+
+    for idx, (left, _) in enumerate(pairs):
+        left.setblocking(False)
+        reactor.add_reader(
+            left, lambda s=left, r=received[idx]: r.append(s.recv(64))
+        )
+
+    reactor.add_timer(lambda: ticks.append(time.monotonic()), 0.01)
+
+    for idx, (_, right) in enumerate(pairs):
+        right.send(str(idx).encode())
+
+    deadline = time.monotonic() + 5
+
+    while (not all(received) or len(ticks) < 2) and (
+        time.monotonic() < deadline
+    ):
+        time.sleep(0.01)
+
+    assert [r[0] for r in received] == [str(i).encode() for i in range(50)]
+    assert len(reactor) == 50
+    assert len(ticks) > 1
+
+    # the reactor thread is the only one serving readers and timers
+    assert sum(t.name == '_reactor' for t in threading.enumerate()) == 1
+
+    for left, right in pairs:
+        assert reactor.remove_reader(left)
+        assert not reactor.remove_reader(left)
+
+        left.close()
+        right.close()
+
+    reactor.remove_timer(list(reactor._timers)[0])
+    deadline = time.monotonic() + 5
+
+    while reactor._thread is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert reactor._thread is None
+
+
+def test_reactor_remove_waits_for_callback():
+    reactor = Reactor()
+    left, right = socket.socketpair()
+    entered = threading.Event()
+    finished = threading.Event()
+
+    def _slow():
+        left.recv(64)
+        entered.set()
+        time.sleep(0.2)
+        finished.set()
+
+    reactor.add_reader(left, _slow)
+    right.send(b'x')
+
+    assert entered.wait(timeout=5)
+    assert reactor.remove_reader(left)
+    assert finished.is_set()
+
+    left.close()
+    right.close()
+
+
+def test_node_reader():
+    node = _PipeSource(node_name='pipe_source', pipe_name='test_pipe')
+    node.add_destination('sink', _Collector(3))
+
+    # nothing is read until the node starts
+    os.write(node.write_fd, b'a')
+    time.sleep(0.1)
+
+    assert node._queue.qsize() == 0
+
+    node.start()
+
+    assert node._destinations['sink'].done.wait(timeout=0.2) is False
+
+    for chunk in (b'b', b'c'):
+        time.sleep(0.05)
+        os.write(node.write_fd, chunk)
+
+    assert node._destinations['sink'].done.wait(timeout=5)
+    assert [m.payload.cnt for m in node._destinations['sink'].messages] == [
+        b'a',
+        b'b',
+        b'c',
+    ]
+
+    # the end of the pipe removes the reader
+    os.close(node.write_fd)
+    time.sleep(0.1)
+
+    assert node._readers == dict()
+
+    node.stop()
+    os.close(node.read_fd)
+
+
+def test_audio_rtp_reads_process_output(tmp_path):
+    launcher = tmp_path / 'launcher.sh'
+    launcher.write_text('head -c 48000 /dev/zero\nexec cat > /dev/null\n')
+
+    node = AudioRTP(
+        rec_host='127.0.0.1',
+        rec_port=5000,
+        audio_rate=8000,
+        block_size=1,
+        channels=1,
+        process_log_level='quiet',
+        payload_type=0,
+        encoding_clock_chan='PCMU/8000',
+        node_name='audio_rtp',
+        pipe_name='test_pipe',
+    )
+
+    node._sdp_file_path = tmp_path / 'session.sdp'
+    node._ffmpeg_launcher_path = launcher
+    node.add_destination('sink', _Collector(3))
+    node.start()
+
+    assert node._destinations['sink'].done.wait(timeout=5)
+
+    for idx, message in enumerate(node._destinations['sink'].messages):
+        assert message.version == idx
+        assert message.payload.audio.shape == (8000,)
+        assert not message.payload.audio.any()
+
+    node.destroy()
+
+    assert node._readers == dict()
@@ -0,0 +1,74 @@
+import struct
+
+import numpy as np
+
+from juturna.utils.net_utils import RTPDatagram
+
+
+def _packet(seq: int, ts: int, payload: bytes, first: int = 0x80) -> bytes:
+    return struct.pack('!BBHII', first, 0x80 | 96, seq, ts, 1234) + payload
+
+
+# two CSRCs and a one-word extension, then the payload
+_CSRC_PACKET = _packet(
+    2, 320, struct.pack('!II', 7, 8) + b'\xbe\xde\x00\x01xxxx' + b'efgh', 0x92
+)
+
+
+def test_rtp_datagram_csrcs():
+    datagram = RTPDatagram(_CSRC_PACKET)
+
+    assert datagram.csrs == [7, 8]
+    assert datagram.extension_header == b'xxxx'
+    assert datagram.payload == b'efgh'
+    assert datagram.marker == 1
+    assert datagram.payload_type == 96
+
+
+def test_rtp_datagram_parse_batch():
+    packets = [
+        _packet(1, 160, b'abcd'),
+        _CSRC_PACKET,
+        # two bytes of padding
+        _packet(65535, 2**32 - 1, b'ijkl\x00\x02', 0xA0),
+        b'\x00' * 12,
+        b'\x80\x00',
+    ]
+    buffer = b''.join(packets)
+
+    headers = RTPDatagram.parse_batch(buffer, [len(p) for p in packets])
+    payloads = [buffer[h['offset'] : h['end']] for h in headers[:3]]
+
+    assert headers['valid'].tolist() == [True, True, True, False, False]
+    assert headers['sequence_number'][:3].tolist() == [1, 2, 65535]
+    assert headers['timestamp'][:3].tolist() == [160, 320, 2**32 - 1]
+    assert headers['csrc_count'][:3].tolist() == [0, 2, 0]
+    assert payloads == [b'abcd', b'efgh', b'ijkl']
+
+    for packet, header, payload in zip(
+        packets[:3], headers, payloads, strict=False
+    ):
+        datagram = RTPDatagram(packet)
+
+        assert datagram.sequence_number == header['sequence_number']
+        assert datagram.sync_source_id == header['sync_source_id']
+        assert datagram.payload == payload
+
+
+def test_rtp_datagram_parse_slots():
+    slots = np.zeros((3, 32), np.uint8)
+    packets = [_packet(idx, idx * 160, bytes([idx]) * 4) for idx in range(3)]
+
+    for idx, packet in enumerate(packets):
+        slots[idx, : len(packet)] = np.frombuffer(packet, np.uint8)
+
+    headers = RTPDatagram.parse_batch(
+        slots, [len(p) for p in packets], np.arange(3) * 32
+    )
+
+    assert headers['valid'].all()
+    assert headers['sequence_number'].tolist() == [0, 1, 2]
+    assert headers['offset'].tolist() == [12, 44, 76]
+    start, end = headers['offset'][2], headers['end'][2]
+
+    assert slots.reshape(-1)[start:end].tolist() == [2] * 4
@@ -0,0 +1,138 @@
+import socket
+import struct
+import threading
+
+import numpy as np
+import pytest
+
+from juturna.nodes.source._audio_rtp_pcm.audio_rtp_pcm import AudioRtpPcm
+from juturna.utils.audio_utils import decode_alaw
+from juturna.utils.audio_utils import decode_ulaw
+from juturna.utils.net_utils import JitterBuffer
+from juturna.utils.net_utils import RTPReceiver
+
+
+class _Collector:
+    def __init__(self, expected: int):
+        self.messages = list()
+        self.expected = expected
+        self.done = threading.Event()
+
+    def put(self, message):
+        self.messages.append(message)
+
+        if len(self.messages) == self.expected:
+            self.done.set()
+
+
+def _packet(seq: int, ts: int, payload: bytes, first: int = 0x80) -> bytes:
+    return struct.pack('!BBHII', first, 0, seq, ts, 1234) + payload
+
+
+def test_g711_decode():
+    assert decode_ulaw(b'\x00\x7f\x80\xff').tolist() == [-32124, 0, 32124, 0]
+    assert decode_alaw(b'\xd5\x55\x2a\xaa').tolist() == [8, -8, -32256, 32256]
+
+
+def test_jitter_buffer_reorder_and_loss():
+    jb = JitterBuffer(8000, min_delay=0.05, max_delay=0.05)
+
+    for seq, now in [(65534, 0.0), (0, 0.01), (65535, 0.02)]:
+        jb.push(seq, seq * 160, b'', now)
+
+    assert [ts for ts, _ in jb.pop(0.02)] == [
+        65534 * 160,
+        65535 * 160,
+        0,
+    ]
+
+    jb.push(3, 480, b'', 0.03)
+    jb.push(1, 160, b'', 0.04)
+
+    assert [ts for ts, _ in jb.pop(0.04)] == [160]
+    assert [ts for ts, _ in jb.pop(0.1)] == [480]
+    assert (jb.lost, jb.late) == (1, 0)
+
+    jb.push(2, 320, b'', 0.1)
+
+    assert jb.late == 1
+
+
+def test_audio_rtp_pcm_out_channels():
+    arguments = {
+        'host': '127.0.0.1',
+        'port': 0,
+        'encoding': 'L16',
+        'clock_rate': 16000,
+        'payload_type': -1,
+        'block_size': 0.1,
+        'node_name': 'source',
+        'pipe_name': 'test_pipe',
+    }
+
+    node = AudioRtpPcm(**arguments | {'channels': 2, 'out_channels': 2})
+
+    assert node._samples_per_block == 3200
+
+    with pytest.raises(ValueError):
+        AudioRtpPcm(**arguments | {'channels': 1, 'out_channels': 2})
+
+    with pytest.raises(ValueError):
+        AudioRtpPcm(**arguments | {'channels': 4, 'out_channels': 2})
+
+
+def test_audio_rtp_pcm_sessions():
+    codes = np.arange(160, dtype=np.uint8)
+    nodes = list()
+
+    for encoding in ('PCMU', 'PCMA'):
+        node = AudioRtpPcm(
+            host='127.0.0.1',
+            port=0,
+            encoding=encoding,
+            clock_rate=8000,
+            channels=1,
+            payload_type=0,
+            out_channels=1,
+            block_size=0.1,
+            node_name=f'source_{encoding}',
+            pipe_name='test_pipe',
+        )
+
+        node.add_destination('sink', _Collector(2))
+        node.warmup()
+        node.start()
+        nodes.append(node)
+
+    assert len(RTPReceiver.shared()) == 2
+
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    # packet 4 is lost, packets 6 and 7 are swapped
+    for seq in (0, 1, 2, 3, 5, 7, 6, 8, 9, 10, 11):
+        for node in nodes:
+            sender.sendto(
+                _packet(seq, seq * 160, codes.tobytes()),
+                node._session.address,
+            )
+
+    for node in nodes:
+        assert node._destinations['sink'].done.wait(timeout=5)
+
+    sender.close()
+
+    for node, decode in zip(nodes, (decode_ulaw, decode_alaw), strict=True):
+        node.destroy()
+
+        audio = np.concatenate(
+            [m.payload.audio for m in node._destinations['sink'].messages]
+        )
+        expected = decode(codes.tobytes()).astype(np.float32) / 32768.0
+
+        assert len(audio) == 1600
+        assert np.array_equal(audio[:640], np.tile(expected, 4))
+        assert not audio[640:800].any()
+        assert np.array_equal(audio[800:], np.tile(expected, 5))
+        assert node._session is None
+
+    assert len(RTPReceiver.shared()) == 0
@@ -0,0 +1,157 @@
+import json
+import random
+import socket
+
+import numpy as np
+import pytest
+
+from juturna.components import Message
+from juturna.nodes.sink._notifier_udp.notifier_udp import NotifierUDP
+from juturna.payloads import ObjectPayload
+from juturna.utils.net_utils import FRAGMENT_HEADER
+from juturna.utils.net_utils import FragmentReassembler
+from juturna.utils.net_utils import FragmentReceiver
+from juturna.utils.net_utils import fragment
+
+
+def _datagrams(data: bytes, sequence: int, payload_size: int) -> list:
+    return [h + bytes(c) for h, c in fragment(data, sequence, payload_size)]
+
+
+def test_fragment_zero_copy():
+    data = bytes(range(256)) * 10
+    fragments = list(fragment(data, 7, 100))
+
+    assert len(fragments) == -(-len(data) // (100 - FRAGMENT_HEADER.size))
+    assert all(len(h) + len(c) <= 100 for h, c in fragments)
+    assert fragments[1][1].obj is fragments[0][1].obj
+    assert b''.join(bytes(c) for _, c in fragments) == data
+
+    with pytest.raises(ValueError):
+        next(fragment(data, 0, FRAGMENT_HEADER.size))
+
+
+def test_reassembler_out_of_order():
+    data = np.random.default_rng(0).bytes(5000)
+    datagrams = _datagrams(data, 2**32 + 3, 300)
+    datagrams += datagrams[:3]
+    random.Random(0).shuffle(datagrams)
+
+    reassembler = FragmentReassembler()
+    results = [reassembler.push(d) for d in datagrams]
+    complete = [r for r in results if r is not None]
+
+    assert complete == [data]
+    assert len(reassembler) == 0
+
+    with pytest.raises(ValueError):
+        reassembler.push(b'not a fragment, really')
+
+
+def test_reassembler_eviction():
+    reassembler = FragmentReassembler(max_pending=2)
+
+    for sequence in range(3):
+        reassembler.push(_datagrams(bytes(1000), sequence, 300)[0])
+
+    assert len(reassembler) == 2
+    assert reassembler.discarded == 1
+
+    # the rest of the evicted message is not enough to complete it
+    assert all(
+        reassembler.push(d) is None for d in _datagrams(bytes(1000), 0, 300)[1:]
+    )
+
+
+def test_notifier_udp_binary():
+    receiver = FragmentReceiver(0, host='127.0.0.1')
+    node = NotifierUDP(
+        endpoint='127.0.0.1',
+        port=receiver.address[1],
+        payload_size=1200,
+        max_sequence=9999,
+        max_chunks=1000,
+        encoding='utf8',
+        encode_b64=False,
+        binary=True,
+        node_name='notifier',
+        pipe_name='test_pipe',
+    )
+
+    payload = ObjectPayload(
+        text='hello ' * 500, values=np.arange(2000, dtype=np.float32)
+    )
+    message = Message(creator='test_source', version=42, payload=payload)
+    message._freeze()
+
+    node.update(message)
+    received = Message.from_bytes(receiver.receive(timeout=2))
+
+    receiver.close()
+
+    assert received.version == 42
+    assert received.payload['text'] == payload['text']
+    np.testing.assert_array_equal(received.payload['values'], payload['values'])
+
+
+def test_notifier_udp_repeated_versions():
+    receiver = FragmentReceiver(0, host='127.0.0.1')
+    node = NotifierUDP(
+        endpoint='127.0.0.1',
+        port=receiver.address[1],
+        payload_size=1200,
+        max_sequence=9999,
+        max_chunks=1000,
+        encoding='utf8',
+        encode_b64=False,
+        binary=True,
+        node_name='notifier',
+        pipe_name='test_pipe',
+    )
+
+    # messages keep the default version, they are still told apart
+    for idx in range(3):
+        message = Message(
+            creator='test_source', payload=ObjectPayload(value=idx)
+        )
+        message._freeze()
+        node.update(message)
+
+    received = [
+        Message.from_bytes(receiver.receive(timeout=2)) for _ in range(3)
+    ]
+
+    receiver.close()
+
+    assert [m.payload['value'] for m in received] == [0, 1, 2]
+    assert all(m.version == -1 for m in received)
+
+
+def test_notifier_udp_json_sequence():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.settimeout(2)
+
+    node = NotifierUDP(
+        endpoint='127.0.0.1',
+        port=sock.getsockname()[1],
+        payload_size=1200,
+        max_sequence=9999,
+        max_chunks=1000,
+        encoding='utf8',
+        encode_b64=True,
+        node_name='notifier',
+        pipe_name='test_pipe',
+    )
+
+    # the JSON wire format keeps numbering messages by their versions
+    for version in (7, 7, 10005):
+        message = Message(
+            creator='test_source', version=version, payload=ObjectPayload()
+        )
+        node.update(message)
+
+    chunks = [json.loads(sock.recv(2048)) for _ in range(3)]
+    sock.close()
+
+    assert [c['seq'] for c in chunks] == [7, 7, 6]
@@ -0,0 +1,209 @@
+import os
+import threading
+import time
+
+import av
+import numpy as np
+import pytest
+
+from juturna.nodes.source._video_file.video_file import VideoFile
+
+
+class _Collector:
+    def __init__(self, expected: int):
+        self.messages = list()
+        self.expected = expected
+        self.done = threading.Event()
+
+    def put(self, message):
+        self.messages.append(message)
+
+        if len(self.messages) == self.expected:
+            self.done.set()
+
+
+@pytest.fixture(scope='module')
+def video_path(tmp_path_factory) -> str:
+    path = str(tmp_path_factory.mktemp('video') / 'video.mp4')
+
+    # 4 seconds at 25 fps, a keyframe every 10 frames, and the frame index
+    # written in the brightness of the frame
+    with av.open(path, 'w') as container:
+        stream = container.add_stream('mpeg4', rate=25)
+        stream.width, stream.height = 64, 48
+        stream.pix_fmt = 'yuv420p'
+        stream.codec_context.gop_size = 10
+
+        for idx in range(100):
+            image = np.full((48, 64, 3), idx * 2, np.uint8)
+            frame = av.VideoFrame.from_ndarray(image, format='rgb24')
+            frame.pts = idx
+
+            for packet in stream.encode(frame):
+                container.mux(packet)
+
+        for packet in stream.encode(None):
+            container.mux(packet)
+
+    return path
+
+
+def _read(video_path: str, expected: int, **kwargs) -> list:
+    arguments = dict(
+        video_path=video_path,
+        width=32,
+        height=24,
+        pool_size=8,
+        realtime=False,
+        node_name='video_file',
+        pipe_name='test_pipe',
+    )
+
+    node = VideoFile(**(arguments | kwargs))
+    node.add_destination('sink', _Collector(expected))
+    node.configure()
+    node.warmup()
+    node.start()
+
+    assert node._destinations['sink'].done.wait(timeout=10)
+
+    # nothing is produced past the end of the file, or of the range
+    time.sleep(0.2)
+    node.stop()
+
+    assert len(node._destinations['sink'].messages) == expected
+
+    return node._destinations['sink'].messages
+
+
+def _positions(messages: list) -> list:
+    return [m.meta['position'] for m in messages]
+
+
+def test_video_file_info(video_path):
+    node = VideoFile(video_path, 0, 0, 8, node_name='video_file')
+    node.configure()
+
+    assert node._video_info['fps'] == 25
+    assert (node._width, node._height) == (64, 48)
+
+
+def test_video_file_whole(video_path):
+    messages = _read(video_path, 100)
+
+    assert [m.version for m in messages] == list(range(100))
+    assert _positions(messages) == [
+        pytest.approx(idx / 25) for idx in range(100)
+    ]
+    assert {m.payload.image.shape for m in messages} == {(24, 32, 3)}
+
+
+def test_video_file_seek_and_fps(video_path):
+    # starting in the middle of a group of pictures
+    messages = _read(video_path, 25, start_time=1.1, end_time=2.1)
+
+    assert _positions(messages) == [
+        pytest.approx(idx / 25) for idx in range(28, 53)
+    ]
+
+    messages = _read(video_path, 40, fps=10)
+    intervals = np.diff(_positions(messages))
+
+    assert len(messages) == 40
+    assert ((intervals > 0.07) & (intervals < 0.13)).all()
+
+
+def test_video_file_segments(video_path):
+    sequential = _read(video_path, 35, start_time=0.5, fps=10)
+    parallel = _read(video_path, 35, start_time=0.5, fps=10, segments=3)
+
+    assert _positions(parallel) == _positions(sequential)
+    assert [m.version for m in parallel] == list(range(35))
+
+    # frames of later segments make it back from their spill files intact
+    for p, s in zip(parallel, sequential, strict=True):
+        np.testing.assert_array_equal(p.payload.image, s.payload.image)
+
+
+def test_video_file_segments_decode_concurrently(video_path):
+    node = VideoFile(
+        video_path,
+        32,
+        24,
+        8,
+        read_ahead=2,
+        segments=4,
+        node_name='video_file',
+        pipe_name='test_pipe',
+    )
+    node.add_destination('sink', _Collector(100))
+    node.configure()
+    node.warmup()
+    node.start()
+
+    # frames are paced at 25 fps, so while the first segment is consumed,
+    # the later ones are decoded to the end without waiting for it
+    deadline = time.monotonic() + 0.8
+
+    while time.monotonic() < deadline and any(
+        d.is_alive() for d in node._decoders[1:]
+    ):
+        time.sleep(0.01)
+
+    try:
+        assert node._segment == 0
+        assert not any(d.is_alive() for d in node._decoders[1:])
+    finally:
+        node.stop()
+
+
+def test_video_file_segments_bounded_spill(video_path):
+    frame_size = 32 * 24 * 3
+    sequential = _read(video_path, 35, start_time=0.5, fps=10)
+
+    # spill files wrap around many times, and frames still come back intact
+    bounded = _read(
+        video_path,
+        35,
+        start_time=0.5,
+        fps=10,
+        segments=3,
+        max_spill_bytes=2 * frame_size,
+    )
+
+    for b, s in zip(bounded, sequential, strict=True):
+        np.testing.assert_array_equal(b.payload.image, s.payload.image)
+
+    node = VideoFile(
+        video_path,
+        32,
+        24,
+        8,
+        read_ahead=2,
+        segments=2,
+        max_spill_bytes=3 * frame_size,
+        node_name='video_file',
+        pipe_name='test_pipe',
+    )
+    node.add_destination('sink', _Collector(100))
+    node.configure()
+    node.warmup()
+    node.start()
+
+    try:
+        time.sleep(0.5)
+
+        # the second segment waits for the first one to be produced
+        assert node._segment == 0
+        assert node._decoders[1].is_alive()
+        assert os.fstat(node._frames[1]._fd).st_size <= 3 * frame_size
+    finally:
+        node.stop()
+
+
+def test_video_file_realtime(video_path):
+    start = time.monotonic()
+    _read(video_path, 13, realtime=True, end_time=0.5)
+
+    # 12 frame intervals at 25 fps
+    assert time.monotonic() - start >= 0.48
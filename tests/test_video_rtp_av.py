@@ -0,0 +1,129 @@
+import socket
+import threading
+import time
+
+import numpy as np
+
+from juturna.components import Message
+from juturna.nodes.sink._videostream_av.videostream_av import VideostreamAv
+from juturna.nodes.source._video_rtp_av.video_rtp_av import VideoRtpAv
+from juturna.payloads import ImagePayload
+
+
+class _Collector:
+    def __init__(self, expected: int):
+        self.messages = list()
+        self.expected = expected
+        self.done = threading.Event()
+
+    def put(self, message):
+        self.messages.append(message)
+
+        if len(self.messages) >= self.expected:
+            self.done.set()
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+
+        return sock.getsockname()[1]
+
+
+def _feed(sink: VideostreamAv, stop: threading.Event) -> list:
+    sent = [0]
+
+    def _loop():
+        while not stop.is_set():
+            image = np.zeros((120, 160, 3), np.uint8)
+            image[:, : sent[0] * 4 % 160] = 255
+
+            sink.update(
+                Message[ImagePayload](
+                    creator='test',
+                    version=sent[0],
+                    payload=ImagePayload(image=image, pixel_format='rgb24'),
+                )
+            )
+
+            sent[0] += 1
+            time.sleep(1 / 30)
+
+    threading.Thread(target=_loop, daemon=True).start()
+
+    return sent
+
+
+def _receive(tmp_path, expected: int, **kwargs) -> tuple[VideoRtpAv, int]:
+    port = _free_port()
+    source = VideoRtpAv(
+        rec_host='127.0.0.1',
+        rec_port=port,
+        payload_type=96,
+        codec='VP8',
+        encoding_clock_chan='90000',
+        node_name='source',
+        pipe_name='test_pipe',
+        **kwargs,
+    )
+    source.pipe_path = str(tmp_path)
+    source.add_destination('sink', _Collector(expected))
+    source.warmup()
+    source.start()
+
+    sink = VideostreamAv(
+        dst_host='127.0.0.1',
+        dst_port=port,
+        codec='vp8',
+        payload_type=96,
+        out_width=0,
+        out_height=0,
+        rate=30,
+        gop=5,
+        bit_rate=500000,
+        queue_size=64,
+        node_name='sink',
+        pipe_name='test_pipe',
+    )
+    sink.start()
+
+    stop = threading.Event()
+    sent = _feed(sink, stop)
+
+    assert source._destinations['sink'].done.wait(timeout=10)
+
+    # the source only notices it is stopped while packets keep coming
+    source.stop()
+    stop.set()
+    sink.stop()
+
+    return source, sent[0]
+
+
+def test_video_rtp_av_scaled_gray(tmp_path):
+    source, _ = _receive(tmp_path, 10, out_width=80, pixel_format='gray')
+    payloads = [m.payload for m in source._destinations['sink'].messages]
+
+    assert {p.image.shape for p in payloads} == {(60, 80)}
+    assert {(p.width, p.height, p.depth) for p in payloads} == {(80, 60, 1)}
+    assert {p.pixel_format for p in payloads} == {'gray'}
+
+
+def test_video_rtp_av_decimation(tmp_path):
+    source, _ = _receive(
+        tmp_path, 10, out_height=60, pixel_format='yuv420p', decimation=3
+    )
+    payloads = [m.payload for m in source._destinations['sink'].messages]
+
+    assert len(payloads) == (source._decoded + 2) // 3
+    assert {p.image.shape for p in payloads} == {(90, 80)}
+
+
+def test_video_rtp_av_keyframes_only(tmp_path):
+    source, sent = _receive(tmp_path, 5, keyframes_only=True)
+    payloads = [m.payload for m in source._destinations['sink'].messages]
+
+    # one keyframe every 5 frames
+    assert len(payloads) == source._decoded
+    assert source._decoded <= sent // 5 + 1
+    assert {p.image.shape for p in payloads} == {(120, 160, 3)}
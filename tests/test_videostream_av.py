@@ -0,0 +1,126 @@
+import socket
+import struct
+import time
+
+import numpy as np
+import pytest
+
+from juturna.components import Message
+from juturna.nodes.sink._videostream_av import videostream_av
+from juturna.nodes.sink._videostream_av.videostream_av import VideostreamAv
+from juturna.payloads import ImagePayload
+
+
+def _node(port: int, codec: str, **kwargs) -> VideostreamAv:
+    arguments = dict(
+        dst_host='127.0.0.1',
+        dst_port=port,
+        codec=codec,
+        payload_type=97,
+        out_width=0,
+        out_height=0,
+        rate=1000,
+        gop=10,
+        bit_rate=256000,
+        queue_size=64,
+        node_name=f'stream_{codec}',
+        pipe_name='test_pipe',
+    )
+
+    return VideostreamAv(**(arguments | kwargs))
+
+
+def _frame(version: int, width: int = 64, height: int = 48) -> Message:
+    image = np.full((height, width, 3), version * 8 % 256, np.uint8)
+
+    return Message[ImagePayload](
+        creator='test',
+        version=version,
+        payload=ImagePayload(
+            image=image, width=width, height=height, depth=3,
+            pixel_format='rgb24',
+        ),
+    )
+
+
+def _receive(sock: socket.socket) -> list:
+    packets = list()
+
+    try:
+        while True:
+            packets.append(struct.unpack('!BBHII', sock.recv(2048)[:12]))
+    except TimeoutError:
+        return packets
+
+
+def test_videostream_av_codecs():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.settimeout(0.5)
+
+    for codec in ('h264', 'vp8'):
+        node = _node(sock.getsockname()[1], codec, out_width=33)
+        node.warmup()
+        node.start()
+
+        for version in range(20):
+            node.put(_frame(version))
+            time.sleep(0.005)
+
+        node.stop()
+
+        packets = _receive(sock)
+
+        assert node._encoded == 20 - node._skipped
+        assert node._container is None
+        assert packets
+        assert {pt & 0x7F for _, pt, _, _, _ in packets} == {97}
+        assert len({ssrc for *_, ssrc in packets}) == 1
+
+    sock.close()
+
+
+def test_videostream_av_backpressure():
+    node = _node(9, 'vp8', queue_size=2, rate=100000)
+
+    # no encoder is running, so the queue fills up
+    for version in range(10):
+        node.update(_frame(version))
+
+    assert node._frames.qsize() == 2
+    assert node._dropped == 10 - node._skipped - 2
+
+    # newest frames are kept
+    assert node._frames.get_nowait()[0][0, 0, 0] > 0
+
+    node._origin = time.monotonic() + 10
+    node.update(_frame(10))
+
+    assert node._skipped >= 1
+
+
+def test_videostream_av_failed_open(monkeypatch):
+    monkeypatch.setitem(
+        videostream_av._CODECS, 'h264', ('no_such_encoder', 'H264', dict())
+    )
+
+    node = _node(9, 'h264')
+    image = _frame(0).payload.image
+
+    # a stream that cannot be added leaves no half-open container behind
+    with pytest.raises(ValueError):
+        node._write(image, 'rgb24', 0)
+
+    assert node._container is None
+    assert node._stream is None
+
+    node.start()
+
+    for version in range(5):
+        node.update(_frame(version))
+
+    node.stop()
+
+    assert node._encoder is None
+    assert node._container is None
+    assert node._encoded == 0